@@ -5,13 +5,13 @@ Developer: Varsha Rana
 File: __init__.py
 Description: Initializes the Game API application and configures its core
              components. The app uses Flask with SQLAlchemy for PostgreSQL
-             database interactions, supporting CRUD operations for entities
+             (or, on single-node deployments, SQLite) database interactions, supporting CRUD operations for entities
              like users, contacts, and more. It includes caching and migration
              tools for optimized performance and adaptability. The configuration
              is securely managed via environment variables, ensuring flexible
              deployment across environments.
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 =============================================================================
 """
 
@@ -25,16 +25,38 @@ from flask_migrate import Migrate
 from config import Config
 from dotenv import load_dotenv
 from app.controllers.common_fun import handle_file_upload
+from app.password_hasher import password_hasher
+from app.bloom_filter import known_emails
+from app.datamanager.unit_of_work import init_unit_of_work
+from app.datamanager.replica_routing import init_replica_routing
+from app.monitoring.pool_metrics import engine_options
+from app.monitoring.request_timing import init_request_timing
+from app.monitoring.metrics import init_metrics
+from app.monitoring.slow_queries import init_slow_query_log
+from app.monitoring.request_profiler import init_request_profiler
+from app.monitoring.sampling_profiler import init_sampling_profiler
+from app.monitoring.memory_profiler import init_memory_profiler
+from app.monitoring.tracing import init_tracing
+from app.datamanager.sqlite_data_manager import init_sqlite
+from app.datamanager.data_manager_factory import init_data_manager, data_manager_name
+from app.datamanager.rollups import init_rollup_command
+from app.datamanager.seed import init_seed_command
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 load_dotenv()
 
 migrate = Migrate()
 cache_instance = Cache()
 
 
-def create_app():
+def create_app(config_overrides=None):
+    """
+    Create and configure the Flask application.
+
+    Parameters:
+    config_overrides (dict): Optional settings applied after the environment,
+                             before any extension is initialised (used by
+                             tests and benchmarks to pick their own database).
+    """
     app = Flask(__name__)
 
     # Configure the app using the Config class
@@ -49,25 +71,77 @@ def create_app():
     # Set the upload folder path
     app.config['UPLOAD_FOLDER'] = os.path.join(os.getcwd(), 'app', 'static', 'img', 'upload', 'profile_image')
 
+    if config_overrides:
+        app.config.update(config_overrides)
+
+    # Set up logging (no-op if the host already configured it)
+    logging.basicConfig(level=app.config['LOG_LEVEL'])
+
     # Ensure the upload folder exists
     if not os.path.exists(app.config['UPLOAD_FOLDER']):
         os.makedirs(app.config['UPLOAD_FOLDER'])
 
+    # The in-memory data manager needs no database; give SQLAlchemy a
+    # throw-away one so the extensions still initialise
+    if data_manager_name(app.config) == 'memory' and not app.config['SQLALCHEMY_DATABASE_URI']:
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+
+    # Optional read replica engine for read-only queries
+    init_replica_routing(app)
+    # Sized, pre-pinged and instrumented connection pool
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
+
     # Initialize the database and migration tool
     db.init_app(app)
+    # WAL, busy timeout and friends on SQLite databases (no-op elsewhere)
+    init_sqlite(app)
+    # Log slow statements with their plans (rate limited, plans off-request)
+    init_slow_query_log(app)
     migrate.init_app(app, db)
+    # PostgreSQL, SQLite or in-memory storage behind DataManagerInterface
+    init_data_manager(app)
+    # Server-Timing header and a timing log line per request; registered
+    # first so its after_request hook runs after the commit
+    init_request_timing(app)
+    # Prometheus latency/status/in-flight metrics, also ahead of the commit
+    init_metrics(app)
+    # Always-on stack sampling per endpoint, for flame graphs
+    init_sampling_profiler(app)
+    # tracemalloc snapshots on demand and per-request peak allocations
+    init_memory_profiler(app)
+    # One commit per successful request, rollback on errors
+    init_unit_of_work(app)
 
     # Configure and initialize cache
     # cache_instance = Cache(app, config={'CACHE_TYPE': 'simple'})
     cache_instance.init_app(app)
 
+    # Bounded process pool for password hashing (503 when saturated)
+    password_hasher.init_app(app)
+
+    # Bloom filter of registered emails, rebuilt from the database at startup
+    known_emails.init_app(app)
+
     # Register Blueprints
     from .blueprints.main import main_bp
     from .blueprints.user import user_bp
     from .blueprints.auth import auth_bp
+    from .blueprints.internal import internal_bp
 
     app.register_blueprint(main_bp)
     app.register_blueprint(user_bp, url_prefix='/user')
     app.register_blueprint(auth_bp, url_prefix='/auth')
+    app.register_blueprint(internal_bp, url_prefix='/internal')
+
+    # Span trees of sampled requests (controller spans need the blueprints)
+    init_tracing(app)
+
+    # cProfile for single requests that ask for it with the internal token
+    init_request_profiler(app)
+
+    # `flask refresh-rollups`: the periodic refresh of the per-day rollups
+    init_rollup_command(app)
+    # `flask seed`: synthetic users, characters and contacts for scale tests
+    init_seed_command(app)
 
     return app
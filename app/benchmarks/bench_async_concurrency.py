@@ -0,0 +1,192 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_async_concurrency.py
+Description:
+The `bench_async_concurrency.py` file compares the synchronous data layer with
+`AsyncPostgreSQLDataManager` under many concurrent clients. Every client runs
+the character pages' hot path in a loop: load one page of the character list,
+add a character and delete it again. Synchronous clients are threads, each
+with its own app context and session; async clients are tasks on one event
+loop sharing one pooled asyncio engine. Both sides get the same pool size.
+
+Usage:
+    python -m app.benchmarks.bench_async_concurrency --clients 100 200 --rounds 20
+
+It reports operations/sec and the p50 / p95 latency of each operation. By
+default a throw-away SQLite database is used (where writers serialise on the
+database lock); pass `--database-url` (or set `BENCH_DATABASE_URL`) to run
+against PostgreSQL, which needs asyncpg installed.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+OPERATIONS = ('list', 'add', 'delete')
+NO_FILTERS = {'search_query': '', 'house_filter': '', 'role_filter': '',
+              'strength_filter': '', 'age_more_than': None, 'age_less_than': None}
+SORT_OPTIONS = {'sort_column': 'name', 'sort_order': 'asc'}
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _report(label, clients, seconds, latencies):
+    """Print one result line per operation."""
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"{clients:>8} {label:>6} {total / seconds:>10,.0f}", end='')
+    for operation in OPERATIONS:
+        samples = latencies[operation]
+        print(f" {_percentile(samples, 0.50) * 1000:>10.1f} "
+              f"{_percentile(samples, 0.95) * 1000:>10.1f}", end='')
+    print()
+
+
+def run_sync(app, user_id, clients, rounds):
+    """
+    Run `clients` threads through the hot path `rounds` times each.
+
+    Returns:
+    tuple: (seconds, {operation: [latency, ...]})
+    """
+    from app.models import db, Character
+    from app.controllers.common_fun import insert_character_if_absent
+    from app.datamanager.data_manager_factory import data_manager
+
+    def client(number):
+        latencies = {operation: [] for operation in OPERATIONS}
+        with app.app_context():
+            for round_number in range(rounds):
+                started = time.perf_counter()
+                page = data_manager().get_character_page(user_id, NO_FILTERS, SORT_OPTIONS, 1, 5)
+                [character.house for character in page.items]
+                db.session.commit()
+                latencies['list'].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                character_id = insert_character_if_absent(
+                    {'name': f'Sync {number}-{round_number}', 'user_id': user_id})
+                db.session.commit()
+                latencies['add'].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                Character.query.filter_by(id=character_id, user_id=user_id).delete()
+                db.session.commit()
+                latencies['delete'].append(time.perf_counter() - started)
+            db.session.remove()
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        results = list(executor.map(client, range(clients)))
+    return time.perf_counter() - started, _merge(results)
+
+
+async def run_async(manager, user_id, clients, rounds):
+    """
+    Run `clients` tasks through the hot path `rounds` times each.
+
+    Returns:
+    tuple: (seconds, {operation: [latency, ...]})
+    """
+    async def client(number):
+        latencies = {operation: [] for operation in OPERATIONS}
+        for round_number in range(rounds):
+            started = time.perf_counter()
+            await manager.get_character_page(user_id, NO_FILTERS, SORT_OPTIONS, 1, 5)
+            latencies['list'].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            character_id = await manager.add_character_if_absent(
+                {'name': f'Async {number}-{round_number}', 'user_id': user_id})
+            latencies['add'].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await manager.delete_user_character(character_id, user_id)
+            latencies['delete'].append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(client(number) for number in range(clients)))
+    return time.perf_counter() - started, _merge(results)
+
+
+def _merge(results):
+    return {operation: [sample for latencies in results for sample in latencies[operation]]
+            for operation in OPERATIONS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--clients', type=int, nargs='+', default=[100, 200])
+    parser.add_argument('--rounds', type=int, default=20,
+                        help='list/add/delete rounds per client')
+    parser.add_argument('--pool-size', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=200,
+                        help='characters the benchmark user starts with')
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL'))
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+    os.environ['DATABASE_URL'] = database_url
+
+    from app import create_app
+    from app.models import db, User
+    from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+    from app.datamanager.async_postgre_sql_data_manager import AsyncPostgreSQLDataManager
+
+    # SQLite writers wait on the database lock instead of failing at once
+    connect_args = {'timeout': 60} if database_url.startswith('sqlite') else {}
+    pool_options = {'pool_size': args.pool_size, 'max_overflow': 0, 'pool_timeout': 60}
+    app = create_app({'SQLALCHEMY_ENGINE_OPTIONS': {**pool_options,
+                                                    'connect_args': connect_args}})
+    with app.app_context():
+        db.create_all()
+        data_manager = PostgreSQLDataManager(app)
+        user = User.query.filter_by(email='bench_async@example.com').first()
+        if not user:
+            user = User(username='bench_async', email='bench_async@example.com',
+                        password='x', date_of_birth=date(1990, 1, 1))
+            db.session.add(user)
+            db.session.commit()
+            house_id = data_manager.bulk_upsert_houses(['Bench'])['Bench']
+            data_manager.bulk_add_characters(
+                [{'name': f'Seed {i}', 'user_id': user.id, 'house_id': house_id}
+                 for i in range(args.seed)])
+            db.session.commit()
+        user_id = user.id
+
+    print(f"database: {database_url}  pool size: {args.pool_size}  rounds: {args.rounds}")
+    print(f"{'clients':>8} {'mode':>6} {'ops/s':>10}"
+          + ''.join(f" {op + ' p50':>10} {op + ' p95':>10}" for op in OPERATIONS)
+          + "   (latencies in ms)")
+    for clients in args.clients:
+        seconds, latencies = run_sync(app, user_id, clients, args.rounds)
+        _report('sync', clients, seconds, latencies)
+
+        async def run_with_engine():
+            manager = AsyncPostgreSQLDataManager(
+                database_url, engine_options={**pool_options, 'connect_args': connect_args})
+            try:
+                return await run_async(manager, user_id, clients, args.rounds)
+            finally:
+                await manager.dispose()
+
+        seconds, latencies = asyncio.run(run_with_engine())
+        _report('async', clients, seconds, latencies)
+
+
+if __name__ == '__main__':
+    main()
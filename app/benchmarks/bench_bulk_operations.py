@@ -0,0 +1,143 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_bulk_operations.py
+Description:
+The `bench_bulk_operations.py` file compares the data manager's bulk_* methods
+with the per-row loop (`add_character` / `update_character` /
+`delete_character` once per row) for inserting, updating and deleting
+characters. It reports rows/sec for each operation at every size.
+
+Usage:
+    python -m app.benchmarks.bench_bulk_operations --sizes 1000 100000 1000000
+
+The per-row loop is skipped above `--loop-max` rows (100k by default) because
+it takes minutes at 1M rows. By default a throw-away SQLite database is used;
+pass `--database-url` (or set `BENCH_DATABASE_URL`) to run against PostgreSQL,
+where the bulk update uses `UPDATE ... FROM (VALUES ...)`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+
+def _timed(operation):
+    """Run `operation` and return the seconds it took."""
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def _rate(rows, seconds):
+    return f"{rows / seconds:12,.0f}" if seconds else f"{'-':>12}"
+
+
+def run_size(data_manager, db, user_id, lookups, size, per_row):
+    """
+    Insert, update and delete `size` characters either with the bulk methods
+    or one row at a time, each phase committed once.
+
+    Returns:
+    dict: seconds per phase ('insert', 'update', 'delete').
+    """
+    from app.models import Character
+    from app.datamanager.unit_of_work import unit_of_work
+
+    house_id, role_id, strength_id = lookups
+    rows = [{'name': f'Bench {i}', 'user_id': user_id, 'house_id': house_id,
+             'role_id': role_id, 'strength_id': strength_id, 'age': i % 90,
+             'animal': 'Wolf'} for i in range(size)]
+    timings = {}
+
+    def insert_rows():
+        with unit_of_work():
+            if per_row:
+                for row in rows:
+                    data_manager.add_character(row)
+            else:
+                data_manager.bulk_add_characters(rows)
+
+    timings['insert'] = _timed(insert_rows)
+    db.session.expunge_all()
+    ids = [row[0] for row in db.session.query(Character.id)
+           .filter(Character.user_id == user_id).all()]
+    changes = {character_id: {'age': 50, 'nickname': 'bulk'} for character_id in ids}
+
+    def update_rows():
+        with unit_of_work():
+            if per_row:
+                for character_id, change in changes.items():
+                    data_manager.update_character(character_id, change)
+            else:
+                data_manager.bulk_update_characters(changes)
+
+    timings['update'] = _timed(update_rows)
+    db.session.expunge_all()
+
+    def delete_rows():
+        with unit_of_work():
+            if per_row:
+                for character_id in ids:
+                    data_manager.delete_character(character_id)
+            else:
+                data_manager.bulk_delete_characters(ids)
+
+    timings['delete'] = _timed(delete_rows)
+    db.session.expunge_all()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--loop-max', type=int, default=100_000,
+                        help='largest size the per-row loop is run for')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL'))
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+    os.environ['DATABASE_URL'] = database_url
+
+    from app import create_app
+    from app.models import db, User
+    from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+
+    app = create_app({'DATA_MANAGER_BULK_CHUNK_SIZE': args.chunk_size})
+    with app.app_context():
+        db.create_all()
+        data_manager = PostgreSQLDataManager(app)
+        user = User.query.filter_by(email='bench_bulk@example.com').first()
+        if not user:
+            user = User(username='bench_bulk', email='bench_bulk@example.com',
+                        password='x', date_of_birth=date(1990, 1, 1))
+            db.session.add(user)
+            db.session.commit()
+        user_id = user.id
+        lookups = (data_manager.bulk_upsert_houses(['Bench'])['Bench'],
+                   data_manager.bulk_upsert_roles(['Bench'])['Bench'],
+                   data_manager.bulk_upsert_strengths(['Bench'])['Bench'])
+        db.session.commit()
+
+        print(f"database: {database_url}  chunk size: {args.chunk_size}")
+        print(f"{'rows':>9} {'mode':>8} {'insert/s':>12} {'update/s':>12} {'delete/s':>12}")
+        for size in args.sizes:
+            for label, per_row in (('per-row', True), ('bulk', False)):
+                if per_row and size > args.loop_max:
+                    print(f"{size:>9,} {label:>8} {'skipped':>12}")
+                    continue
+                timings = run_size(data_manager, db, user_id, lookups, size, per_row)
+                print(f"{size:>9,} {label:>8} {_rate(size, timings['insert'])} "
+                      f"{_rate(size, timings['update'])} {_rate(size, timings['delete'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_character_list_query.py
+Description:
+The `bench_character_list_query.py` file measures the Python-side cost of
+the character list query per request. The "before" path rebuilds the
+statement and its `.has()` EXISTS subqueries for every request. The "after"
+path uses the prebuilt statement of the filters' shape with bound values
+(`statements.character_list_statements`).
+
+For random filter combinations it reports microseconds per request for:
+building the statement, generating its cache key (what SQLAlchemy does before
+each compiled-cache lookup), and a full ORM execute on an empty SQLite table
+(build + cache key + compiled-cache hit + execution overhead).
+
+Usage:
+    python -m app.benchmarks.bench_character_list_query --requests 20000
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import random
+import time
+
+FILTER_VALUES = {
+    'search_query': 'jon',
+    'house_filter': 'stark',
+    'role_filter': 'lord',
+    'strength_filter': 'sword',
+    'age_more_than': 10,
+    'age_less_than': 60,
+}
+
+
+def random_requests(count, seed):
+    """Return `count` (filters, sort_options, page) tuples with random filter sets."""
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(count):
+        filters = {name: (value if rng.random() < 0.4 else ('' if isinstance(value, str)
+                                                             else None))
+                   for name, value in FILTER_VALUES.items()}
+        if filters['search_query']:
+            filters['search_query'] += str(rng.randrange(100))
+        sort_options = {'sort_column': rng.choice(['name', 'age']),
+                        'sort_order': rng.choice(['asc', 'desc'])}
+        requests.append((filters, sort_options, rng.randrange(1, 20)))
+    return requests
+
+
+def build_per_request(user_id, filters, sort_options, page, per_page):
+    """The previous builder: a new statement, with literal-bound values, per request."""
+    from sqlalchemy import select
+    from app.models import Character, House, Role, Strength
+
+    query = select(Character).where(Character.user_id == user_id)
+    if filters["search_query"]:
+        query = query.filter(Character.name.ilike(f"%{filters['search_query']}%"))
+    if filters["house_filter"]:
+        query = query.filter(Character.house.has(House.name.ilike(f"%{filters['house_filter']}%")))
+    if filters["role_filter"]:
+        query = query.filter(Character.role.has(Role.name.ilike(f"%{filters['role_filter']}%")))
+    if filters["strength_filter"]:
+        query = query.filter(
+            Character.strength.has(Strength.name.ilike(f"%{filters['strength_filter']}%")))
+    if filters["age_more_than"]:
+        query = query.filter(Character.age >= filters["age_more_than"])
+    if filters["age_less_than"]:
+        query = query.filter(Character.age <= filters["age_less_than"])
+    sort_column = getattr(Character, sort_options["sort_column"])
+    order = sort_column.asc() if sort_options["sort_order"] == 'asc' else sort_column.desc()
+    return query.order_by(order).limit(per_page).offset((page - 1) * per_page), {}
+
+
+def build_from_shape(user_id, filters, sort_options, page, per_page):
+    """The prebuilt shape and its bound values."""
+    from app.datamanager import statements
+
+    page_statement, _ = statements.character_list_statements(filters, sort_options)
+    return page_statement, statements.character_list_params(user_id, filters, page, per_page)
+
+
+def measure(builder, requests, session):
+    """
+    Time the three phases for every request.
+
+    Returns:
+    dict: microseconds per request for 'build', 'cache key' and 'execute'.
+    """
+    per_page = 10
+    started = time.perf_counter()
+    built = [builder(1, filters, sort_options, page, per_page)
+             for filters, sort_options, page in requests]
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for statement, _ in built:
+        statement._generate_cache_key()
+    cache_key = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for filters, sort_options, page in requests:
+        statement, params = builder(1, filters, sort_options, page, per_page)
+        session.execute(statement, params).scalars().all()
+    execute = time.perf_counter() - started
+
+    count = len(requests)
+    return {'build': build / count * 1e6, 'cache key': cache_key / count * 1e6,
+            'execute': execute / count * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from app.models import db
+
+    engine = create_engine('sqlite://')
+    db.metadata.create_all(engine)
+    requests = random_requests(args.requests, args.seed)
+
+    results = {}
+    with Session(engine) as session:
+        for name, builder in (('before', build_per_request), ('after', build_from_shape)):
+            # Warm up the compiled cache with every shape
+            measure(builder, requests, session)
+            results[name] = measure(builder, requests, session)
+
+    shapes = len({(tuple(bool(v) for v in filters.values()), tuple(sort_options.values()))
+                  for filters, sort_options, _ in requests})
+    print(f"requests: {args.requests}  distinct shapes: {shapes}  "
+          f"compiled cache entries: {len(engine._compiled_cache)}")
+    print(f"{'us/request':<12} {'build':>10} {'cache key':>10} {'execute':>10}")
+    for name, timings in results.items():
+        print(f"{name:<12} {timings['build']:>10.1f} {timings['cache key']:>10.1f} "
+              f"{timings['execute']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,422 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_hot_routes.py
+Description:
+The `bench_hot_routes.py` file is the performance test suite of the hot
+routes. It seeds a database at several scales and measures, per route, the
+latency, the peak memory allocated by one request and the number of SQL
+statements it runs. The results are written as JSON and compared with a
+committed baseline, so a regression fails the run instead of reaching users.
+
+Routes: login, signup_user, user_dashboard, my_character_list (plain,
+filtered, sorted and its last page), user_edit_character (form and save),
+user_add_character and delete_character.
+
+Usage:
+    python -m app.benchmarks.bench_hot_routes --scales 100 1000 10000
+    python -m app.benchmarks.bench_hot_routes --output results.json --compare
+    python -m app.benchmarks.bench_hot_routes --update-baseline
+
+A scale is the number of characters of the benchmark user; nine other users
+own as many again, so the table holds ten times the scale. Latency comes
+from `--rounds` rounds of `--requests` requests per route (the p50 is the
+lowest round median); allocations and statements from a second, shorter
+pass under tracemalloc, so tracing does not slow the timed requests. By default every scale gets a throw-away
+SQLite database; pass `--database-url` (or set `BENCH_DATABASE_URL`) to run
+against PostgreSQL.
+
+`--compare` exits with status 1 if a route runs more statements, or
+allocates more or got slower (p50) than the tolerances stored in the
+baseline allow. Statement counts and allocations are deterministic and carry
+over between machines, so they are the strict gates; latencies only compare
+on the machine that wrote the baseline, so CI should keep its own
+(`--update-baseline --baseline <path>`) and may tighten its tolerance. When
+the run's settings or environment (`LATENCY_META`) differ from the
+baseline's, latency regressions are only printed as warnings.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'hot_routes.json')
+# Allowed growth over the baseline before a route counts as regressed
+DEFAULT_THRESHOLDS = {
+    # p50 latency, relative, ignored below `latency_floor_ms` of growth. Loose:
+    # a shared machine's speed drifts by a third between runs
+    'latency': 0.5,
+    'latency_floor_ms': 1.0,
+    # peak allocation, relative, ignored below `allocation_floor_kib` of growth
+    'allocations': 0.25,
+    'allocation_floor_kib': 16,
+    # SQL statements, absolute
+    'queries': 0,
+}
+PASSWORD = 'Bench@1234'
+OTHER_USERS = 9
+PER_PAGE = 5
+LOOKUPS = 20
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _email(scale, user=0):
+    return f'bench_routes_{scale}_{user}@example.com'
+
+
+def build_app(scale, database_url=None):
+    """Create an app whose benchmark user owns `scale` characters."""
+    from app import create_app
+    from app.models import db
+    from app.datamanager.data_manager_factory import data_manager
+    from app.datamanager.unit_of_work import unit_of_work
+
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database_url or 'sqlite:///' + os.path.join(
+            tempfile.mkdtemp(), 'bench.db'),
+        'TESTING': True,
+        'LOG_LEVEL': 'WARNING',
+        # The routes are measured, not the hash; bench_login_throughput covers it
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'PASSWORD_HASH_POOL_SIZE': 0,
+    })
+    with app.app_context():
+        db.create_all()
+        manager = data_manager()
+        if manager.get_user_by_email(_email(scale)) is not None:
+            return app
+        with unit_of_work():
+            names = [f'{i:02}' for i in range(LOOKUPS)]
+            houses = list(manager.bulk_upsert_houses([f'House {n}' for n in names]).values())
+            roles = list(manager.bulk_upsert_roles([f'Role {n}' for n in names]).values())
+            strengths = list(manager.bulk_upsert_strengths(
+                [f'Strength {n}' for n in names]).values())
+            for user in range(OTHER_USERS + 1):
+                user_id = manager.add_user(f'bench_{user}', _email(scale, user), PASSWORD,
+                                           date(1990, 1, 1), None, None).id
+                manager.bulk_add_characters([
+                    {'name': f'Character {i}', 'user_id': user_id, 'age': i % 90,
+                     'house_id': houses[i % LOOKUPS], 'role_id': roles[i * 7 % LOOKUPS],
+                     'strength_id': strengths[i * 13 % LOOKUPS], 'animal': 'Wolf'}
+                    for i in range(scale)])
+    # Signup consults the known-email filter; rebuild it with the seeded users
+    from app.bloom_filter import known_emails
+    known_emails.init_app(app)
+    return app
+
+
+class Context:
+    """The logged-in client and the ids the routes need at one scale."""
+
+    def __init__(self, app, scale):
+        from app.models import Character, db
+        from app.datamanager.data_manager_factory import data_manager
+
+        self.app = app
+        self.scale = scale
+        self.client = app.test_client()
+        self.anonymous = app.test_client()
+        self.email = _email(scale)
+        response = self.client.post('/auth/login',
+                                    data={'email': self.email, 'password': PASSWORD})
+        if response.status_code != 302 or '/user/dashboard' not in response.headers['Location']:
+            raise RuntimeError('Benchmark login failed.')
+        with app.app_context():
+            self.user_id = data_manager().get_user_by_email(self.email).id
+            self.character_id = db.session.execute(
+                db.select(Character.id).where(Character.user_id == self.user_id)
+                .order_by(Character.id).limit(1)).scalar_one()
+        with open(os.path.join(os.path.dirname(__file__), '..', 'characters.json')) as f:
+            self.catalog_names = [entry['name'] for entry in json.load(f)]
+        self.last_page = max(1, math.ceil(scale / PER_PAGE))
+        self.signups = 0
+
+
+def _expect(response, *statuses):
+    if response.status_code not in statuses:
+        raise RuntimeError(f'{response.request.method} {response.request.path} '
+                           f'returned {response.status_code}.')
+    return response
+
+
+def _delete_by_name(ctx, name):
+    from app.models import Character, db
+    from app.datamanager.data_manager_factory import data_manager
+    from app.datamanager.unit_of_work import unit_of_work
+
+    with ctx.app.app_context(), unit_of_work():
+        character_id = db.session.execute(
+            db.select(Character.id).where(Character.user_id == ctx.user_id,
+                                          Character.name == name)).scalar_one()
+        data_manager().delete_character(character_id)
+
+
+def _add_doomed(ctx, iteration):
+    from app.datamanager.data_manager_factory import data_manager
+    from app.datamanager.unit_of_work import unit_of_work
+
+    with ctx.app.app_context(), unit_of_work():
+        return data_manager().add_character_if_absent(
+            {'name': f'Doomed {iteration}', 'user_id': ctx.user_id})
+
+
+def _login(ctx, iteration, measure):
+    measure(lambda: _expect(ctx.client.post(
+        '/auth/login', data={'email': ctx.email, 'password': PASSWORD}), 302))
+
+
+def _signup_user(ctx, iteration, measure):
+    ctx.signups += 1
+    # Usernames and emails are unique; earlier runs may have left theirs
+    username = f'signup_{ctx.scale}_{time.time_ns()}_{ctx.signups}'
+    measure(lambda: _expect(ctx.anonymous.post('/auth/signup_user', data={
+        'username': username, 'email': f'{username}@example.com', 'dob': '1990-01-01',
+        'password': PASSWORD}), 302))
+
+
+def _get(path):
+    def scenario(ctx, iteration, measure):
+        url = path(ctx) if callable(path) else path
+        measure(lambda: _expect(ctx.client.get(url), 200))
+    return scenario
+
+
+def _user_edit_character_post(ctx, iteration, measure):
+    measure(lambda: _expect(ctx.client.post(
+        f'/user/edit_character/{ctx.character_id}',
+        data={'name': 'Character 0', 'age': str(30 + iteration % 2)}), 302))
+
+
+def _user_add_character(ctx, iteration, measure):
+    name = ctx.catalog_names[iteration % len(ctx.catalog_names)]
+    measure(lambda: _expect(ctx.client.post('/user/add_character', data={'name': name}), 302))
+    _delete_by_name(ctx, name)
+
+
+def _delete_character(ctx, iteration, measure):
+    character_id = _add_doomed(ctx, iteration)
+    measure(lambda: _expect(ctx.client.post(f'/user/delete_character/{character_id}'), 302))
+
+
+SCENARIOS = {
+    'login': _login,
+    'signup_user': _signup_user,
+    'user_dashboard': _get('/user/dashboard'),
+    'my_character_list': _get('/user/character_list'),
+    'my_character_list_filtered': _get('/user/character_list?search=character 1'),
+    'my_character_list_sorted': _get('/user/character_list?sort_column=age&sort_order=desc'),
+    'my_character_list_deep_page': _get(lambda ctx: f'/user/character_list?page={ctx.last_page}'),
+    'user_edit_character_form': _get(lambda ctx: f'/user/edit_character/{ctx.character_id}'),
+    'user_edit_character_save': _user_edit_character_post,
+    'user_add_character': _user_add_character,
+    'delete_character': _delete_character,
+}
+
+
+def run_scale(app, scale, requests, rounds, alloc_requests, scenarios):
+    """
+    Measure every scenario at one scale. `p50_ms` is the lowest median of
+    `rounds` rounds of `requests` requests, which a burst of load on the
+    machine in one round does not move; `p95_ms` and `mean_ms` cover all.
+
+    Returns:
+    dict: {scenario: {'p50_ms', 'p95_ms', 'mean_ms', 'queries', 'peak_alloc_kib'}}
+    """
+    from sqlalchemy import event
+    from app.models import db
+
+    ctx = Context(app, scale)
+    with app.app_context():
+        engines = list(db.engines.values())
+    statements = []
+
+    def count_statement(*args):
+        statements.append(1)
+
+    results = {}
+    for name in scenarios:
+        scenario = SCENARIOS[name]
+        latencies, medians = [], []
+
+        def timed(call):
+            started = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - started)
+
+        # Warm up the template cache and the connection pool
+        for iteration in range(3):
+            scenario(ctx, iteration, lambda call: call())
+        for round_number in range(rounds):
+            for iteration in range(requests):
+                scenario(ctx, round_number * requests + iteration, timed)
+            medians.append(statistics.median(latencies[-requests:]))
+
+        peaks, counts = [], []
+
+        def traced(call):
+            statements.clear()
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+            counts.append(len(statements))
+
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', count_statement)
+        tracemalloc.start()
+        try:
+            for iteration in range(alloc_requests):
+                scenario(ctx, rounds * requests + iteration, traced)
+        finally:
+            tracemalloc.stop()
+            for engine in engines:
+                event.remove(engine, 'before_cursor_execute', count_statement)
+
+        results[name] = {
+            'p50_ms': round(min(medians) * 1000, 3),
+            'p95_ms': round(_percentile(latencies, 0.95) * 1000, 3),
+            'mean_ms': round(statistics.fmean(latencies) * 1000, 3),
+            'queries': max(counts),
+            'peak_alloc_kib': round(statistics.median(peaks) / 1024, 1),
+        }
+    return results
+
+
+# Run settings that must match the baseline's for latencies to be comparable
+LATENCY_META = ('machine', 'python', 'backend', 'requests', 'rounds')
+
+
+def latency_mismatches(results, baseline):
+    """
+    Return the `LATENCY_META` fields in which the run differs from the
+    baseline (empty when its latencies can be compared).
+    """
+    before = baseline.get('meta', {})
+    return [key for key in LATENCY_META if before.get(key) != results['meta'].get(key)]
+
+
+def compare(results, baseline):
+    """
+    Compare results with a baseline, using the baseline's thresholds.
+
+    Returns:
+    list: (scale, scenario, metric, baseline value, current value) of every
+          regression.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **baseline.get('thresholds', {})}
+    regressions = []
+    for scale, scenarios in results['results'].items():
+        for name, current in scenarios.items():
+            before = baseline['results'].get(scale, {}).get(name)
+            if before is None:
+                continue
+            if current['p50_ms'] - before['p50_ms'] > thresholds['latency_floor_ms'] and \
+                    current['p50_ms'] > before['p50_ms'] * (1 + thresholds['latency']):
+                regressions.append((scale, name, 'p50_ms', before['p50_ms'], current['p50_ms']))
+            if current['queries'] > before['queries'] + thresholds['queries']:
+                regressions.append((scale, name, 'queries', before['queries'], current['queries']))
+            growth = current['peak_alloc_kib'] - before['peak_alloc_kib']
+            if growth > thresholds['allocation_floor_kib'] and \
+                    current['peak_alloc_kib'] > before['peak_alloc_kib'] * (1 + thresholds['allocations']):
+                regressions.append((scale, name, 'peak_alloc_kib', before['peak_alloc_kib'],
+                                    current['peak_alloc_kib']))
+    return regressions
+
+
+def _print_results(results, baseline):
+    print(f"{'scale':>7} {'route':<30} {'p50 ms':>8} {'p95 ms':>8} {'queries':>7} "
+          f"{'peak KiB':>9} {'p50 vs base':>11}")
+    for scale, scenarios in results['results'].items():
+        for name, result in scenarios.items():
+            before = (baseline or {}).get('results', {}).get(scale, {}).get(name)
+            change = (f"{(result['p50_ms'] / before['p50_ms'] - 1) * 100:>+10.0f}%"
+                      if before and before['p50_ms'] else f"{'-':>11}")
+            print(f"{scale:>7} {name:<30} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+                  f"{result['queries']:>7} {result['peak_alloc_kib']:>9.1f} {change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[5])
+    parser.add_argument('--scales', nargs='+', type=int, default=[100, 1000, 10000],
+                        help="characters of the benchmark user (and of each other user)")
+    parser.add_argument('--requests', type=int, default=20,
+                        help='timed requests per route and round')
+    parser.add_argument('--rounds', type=int, default=3, help='rounds of timed requests')
+    parser.add_argument('--alloc-requests', type=int, default=5,
+                        help='requests per route measured under tracemalloc')
+    parser.add_argument('--routes', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL'))
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--compare', action='store_true',
+                        help='exit with status 1 on a regression against the baseline')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results as the new baseline (keeping its thresholds)')
+    args = parser.parse_args()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'backend': 'postgresql' if args.database_url else 'sqlite',
+            'python': platform.python_version(),
+            'machine': f'{platform.system()} {platform.machine()}',
+            'requests': args.requests,
+            'rounds': args.rounds,
+            'alloc_requests': args.alloc_requests,
+        },
+        'thresholds': (baseline or {}).get('thresholds', DEFAULT_THRESHOLDS),
+        'results': {},
+    }
+    for scale in args.scales:
+        app = build_app(scale, args.database_url)
+        results['results'][str(scale)] = run_scale(app, scale, args.requests, args.rounds,
+                                                   args.alloc_requests, args.routes)
+
+    _print_results(results, baseline)
+    for path in filter(None, [args.output, args.baseline if args.update_baseline else None]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+
+    if args.compare:
+        if baseline is None:
+            parser.error(f'no baseline at {args.baseline}')
+        regressions = compare(results, baseline)
+        mismatches = latency_mismatches(results, baseline)
+        if mismatches:
+            print('Latencies not gated; the baseline differs in',
+                  ', '.join(f"{key} ({baseline.get('meta', {}).get(key)} vs "
+                            f"{results['meta'][key]})" for key in mismatches))
+            regressions, slower = ([r for r in regressions if r[2] != 'p50_ms'],
+                                   [r for r in regressions if r[2] == 'p50_ms'])
+            for scale, name, metric, before, current in slower:
+                print(f'warning: {name} at scale {scale}: {metric} {before} -> {current}')
+        for scale, name, metric, before, current in regressions:
+            print(f'REGRESSION {name} at scale {scale}: {metric} {before} -> {current}')
+        if regressions:
+            raise SystemExit(1)
+        print('No regressions against', args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_login_throughput.py
+Description:
+The `bench_login_throughput.py` file measures login throughput while a burst of
+concurrent logins competes with ordinary page views. It runs the same burst
+with password hashing inline on the request threads and on the bounded
+hashing pool, and reports logins/sec, 503 rejections and the latency of the
+home page while the burst is in flight.
+
+Usage:
+    python -m app.benchmarks.bench_login_throughput --clients 32 --logins 8
+
+By default a throw-away SQLite database is used; pass `--database-url` (or set
+`BENCH_DATABASE_URL`) to run against PostgreSQL instead.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date
+
+
+def _percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_burst(app, clients, logins_per_client, email, password):
+    """
+    Fire `clients` threads doing `logins_per_client` logins each while one
+    extra thread keeps requesting the home page.
+
+    Returns:
+    dict: logins/sec, status code counts and home page latencies (ms).
+    """
+    statuses = {}
+    statuses_lock = threading.Lock()
+    home_latencies = []
+    done = threading.Event()
+
+    def login_worker():
+        client = app.test_client()
+        for _ in range(logins_per_client):
+            response = client.post('/auth/login',
+                                   data={'email': email, 'password': password})
+            with statuses_lock:
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    def home_worker():
+        client = app.test_client()
+        while not done.is_set():
+            started = time.perf_counter()
+            client.get('/')
+            home_latencies.append((time.perf_counter() - started) * 1000)
+
+    home_thread = threading.Thread(target=home_worker)
+    workers = [threading.Thread(target=login_worker) for _ in range(clients)]
+
+    started = time.perf_counter()
+    home_thread.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    home_thread.join()
+
+    successful = statuses.get(302, 0)
+    return {
+        'elapsed_s': elapsed,
+        'logins_per_s': successful / elapsed if elapsed else 0.0,
+        'statuses': statuses,
+        'home_p50_ms': statistics.median(home_latencies) if home_latencies else 0.0,
+        'home_p95_ms': _percentile(home_latencies, 95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--logins', type=int, default=8,
+                        help='logins per client thread')
+    parser.add_argument('--pool-size', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--queue-depth', type=int, default=16)
+    parser.add_argument('--method', default='pbkdf2:sha256:600000')
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL'))
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+    os.environ['DATABASE_URL'] = database_url
+
+    from app import create_app
+    from app.models import db, User
+    from app.password_hasher import password_hasher
+
+    email, password = 'bench_login@example.com', 'Bench@12345'
+    configurations = [
+        ('inline', 0, args.clients),
+        ('pool', args.pool_size, args.queue_depth),
+    ]
+
+    print(f"database: {database_url}")
+    print(f"{args.clients} clients x {args.logins} logins, method {args.method}")
+    for label, pool_size, queue_depth in configurations:
+        app = create_app()
+        app.config['PASSWORD_HASH_METHOD'] = args.method
+        app.config['PASSWORD_HASH_POOL_SIZE'] = pool_size
+        app.config['PASSWORD_HASH_QUEUE_DEPTH'] = queue_depth
+
+        with app.app_context():
+            db.create_all()
+            if not User.query.filter_by(email=email).first():
+                user = User(username='bench_login', email=email,
+                            date_of_birth=date(1990, 1, 1))
+                user.set_password(password)
+                db.session.add(user)
+                db.session.commit()
+            # Warm the pool so process start-up is not part of the measurement
+            password_hasher.hash('warm-up-password')
+
+        result = run_burst(app, args.clients, args.logins, email, password)
+
+        with app.app_context():
+            password_hasher._pool().shutdown()
+
+        print(f"[{label:6}] pool={pool_size:<3} "
+              f"logins/s={result['logins_per_s']:8.1f}  "
+              f"statuses={result['statuses']}  "
+              f"home p50={result['home_p50_ms']:.1f}ms "
+              f"p95={result['home_p95_ms']:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
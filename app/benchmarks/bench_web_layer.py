@@ -0,0 +1,139 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bench_web_layer.py
+Description:
+The `bench_web_layer.py` file measures how much of a page's latency is the
+web layer (routing, session, controller, Jinja rendering) and how much is the
+database. Every page is requested through Flask's test client (no network),
+once with the in-memory data manager, where the data cost is zero, and once
+per database backend. The difference between the two is the database's share.
+
+Usage:
+    python -m app.benchmarks.bench_web_layer --requests 500 --characters 200
+
+Backends default to `memory` and `sqlite` (a throw-away file); add
+`postgresql` together with `--database-url` to compare against PostgreSQL.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+PAGES = [
+    '/user/dashboard',
+    '/user/user_profile',
+    '/user/character_list',
+    '/user/character_list?search=character 1&sort_column=age&sort_order=desc',
+    '/user/character_list?page=5',
+]
+EMAIL = 'bench_web@example.com'
+PASSWORD = 'Bench@1234'
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def build_app(backend, characters, database_url=None):
+    """Create an app on `backend` with one user owning `characters` characters."""
+    from app import create_app
+    from app.models import db
+    from app.datamanager.data_manager_factory import data_manager
+
+    overrides = {'DATA_MANAGER': backend, 'TESTING': True,
+                 # Login is not what is measured; keep its hash cheap
+                 'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000', 'PASSWORD_HASH_POOL_SIZE': 0}
+    if backend == 'memory':
+        overrides['SQLALCHEMY_DATABASE_URI'] = None
+    elif backend == 'sqlite':
+        overrides['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(
+            tempfile.mkdtemp(), 'bench.db')
+    else:
+        overrides['SQLALCHEMY_DATABASE_URI'] = database_url
+    app = create_app(overrides)
+
+    with app.app_context():
+        manager = data_manager()
+        if backend != 'memory':
+            db.create_all()
+        user = manager.get_user_by_email(EMAIL)
+        if user is None:
+            manager.add_user('bench_web', EMAIL, PASSWORD, date(1990, 1, 1), None, None)
+            user = manager.get_user_by_email(EMAIL)
+            houses = manager.bulk_upsert_houses(['Stark', 'Lannister', 'Targaryen'])
+            manager.bulk_add_characters(
+                [{'name': f'Character {i}', 'age': i % 90, 'user_id': user.id,
+                  'house_id': list(houses.values())[i % 3]} for i in range(characters)])
+            if backend != 'memory':
+                db.session.commit()
+    return app
+
+
+def run_pages(app, requests):
+    """
+    Request every page `requests` times as a logged-in user.
+
+    Returns:
+    dict: {page: [latency, ...]}
+    """
+    client = app.test_client()
+    response = client.post('/auth/login', data={'email': EMAIL, 'password': PASSWORD})
+    if response.status_code != 302 or '/user/dashboard' not in response.headers['Location']:
+        raise RuntimeError('Benchmark login failed.')
+
+    latencies = {}
+    for page in PAGES:
+        # Warm up the template cache and the connection pool
+        for _ in range(5):
+            client.get(page)
+        samples = latencies[page] = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = client.get(page)
+            samples.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f'{page} returned {response.status_code}.')
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--backends', nargs='+', default=['memory', 'sqlite'],
+                        choices=['memory', 'sqlite', 'postgresql'])
+    parser.add_argument('--requests', type=int, default=500, help='requests per page')
+    parser.add_argument('--characters', type=int, default=200,
+                        help='characters owned by the benchmark user')
+    parser.add_argument('--database-url', default=os.getenv('BENCH_DATABASE_URL'))
+    args = parser.parse_args()
+    if 'postgresql' in args.backends and not args.database_url:
+        parser.error('--database-url is required for the postgresql backend')
+
+    results = {}
+    for backend in args.backends:
+        app = build_app(backend, args.characters, args.database_url)
+        results[backend] = run_pages(app, args.requests)
+
+    print(f"requests per page: {args.requests}  characters: {args.characters}")
+    print(f"{'page':<72} {'backend':>10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'web %':>6}")
+    for page in PAGES:
+        web_mean = (sum(results['memory'][page]) / args.requests
+                    if 'memory' in results else None)
+        for backend in args.backends:
+            samples = results[backend][page]
+            mean = sum(samples) / len(samples)
+            # Share of the latency that remains with the data cost at zero
+            web_share = f"{min(web_mean / mean, 1) * 100:>5.0f}%" if web_mean else f"{'-':>6}"
+            print(f"{page:<72} {backend:>10} {1 / mean:>8,.0f} "
+                  f"{_percentile(samples, 0.50) * 1000:>8.2f} "
+                  f"{_percentile(samples, 0.95) * 1000:>8.2f} {web_share}")
+
+
+if __name__ == '__main__':
+    main()
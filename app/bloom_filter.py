@@ -0,0 +1,199 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: bloom_filter.py
+Description:
+The `bloom_filter.py` file provides an in-process Bloom filter and the
+`KnownEmailFilter` extension built on it. Signup uses the filter as a fast
+path: when the filter says an email is definitely new, the pre-insert
+`SELECT` is skipped and the unique constraint on `users.email` (surfaced as an
+`IntegrityError`) remains the safety net.
+
+Key Features:
+1. **Bloom Filter**: A compact bit array sized from the expected capacity and
+   target error rate, using double hashing over a single blake2b digest.
+2. **Startup Rebuild**: `KnownEmailFilter.init_app` streams every stored email
+   from the app's data manager into a fresh filter when the app is created
+   (run it after `init_data_manager`). Until that succeeds the
+   filter answers "maybe" for everything, so signup falls back to the query.
+3. **Signup Updates**: New emails are added after a successful signup. Each
+   worker process keeps its own filter, which is safe because a stale filter
+   only ever produces "definitely new" for emails inserted by other workers,
+   and those inserts are rejected by the database.
+4. **Observability**: `stats()` exposes the configured and estimated
+   false-positive rates along with the false positives observed at signup.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import math
+import threading
+from hashlib import blake2b
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter for strings.
+
+    Attributes:
+        capacity (int): The number of items the filter was sized for.
+        error_rate (float): The target false-positive rate at capacity.
+        num_bits (int): Size of the bit array.
+        num_hashes (int): Number of bit positions set per item.
+        count (int): Number of items added so far.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive.")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, item):
+        """Yield the bit positions for an item (Kirsch-Mitzenmacher double hashing)."""
+        digest = blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item):
+        """Add an item to the filter."""
+        # Serialize writers so concurrent read-modify-writes never drop a bit
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, item):
+        """Return False if the item is definitely absent, True if it may be present."""
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(item))
+
+    @property
+    def estimated_false_positive_rate(self):
+        """The expected false-positive rate given the items added so far."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class KnownEmailFilter:
+    """
+    Flask extension keeping a per-process Bloom filter of registered emails.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Register default settings and rebuild the filter from the database."""
+        app.config.setdefault('KNOWN_EMAILS_CAPACITY', 1_000_000)
+        app.config.setdefault('KNOWN_EMAILS_ERROR_RATE', 0.01)
+        app.extensions['known_emails'] = {
+            'filter': None,
+            'false_positives': 0,
+            'prechecks_skipped': 0,
+        }
+        with app.app_context():
+            self.rebuild()
+
+    @staticmethod
+    def _state():
+        return current_app.extensions['known_emails']
+
+    def rebuild(self):
+        """
+        Stream every stored email into a new filter and swap it in.
+
+        If the table cannot be read (e.g. before the schema exists) the filter
+        stays disabled and every lookup answers "maybe". This is meant for
+        start-up and maintenance scripts: it removes the scoped session.
+        """
+        state = self._state()
+        bloom = BloomFilter(current_app.config['KNOWN_EMAILS_CAPACITY'],
+                            current_app.config['KNOWN_EMAILS_ERROR_RATE'])
+        try:
+            for email in data_manager().iter_user_emails(batch_size=10_000):
+                bloom.add(email)
+        except SQLAlchemyError as e:
+            current_app.logger.warning('Known-email filter disabled: %s', e)
+            state['filter'] = None
+            return
+        finally:
+            db.session.remove()
+
+        if bloom.count > bloom.capacity:
+            current_app.logger.warning(
+                'Known-email filter holds %d emails, above its capacity of %d; '
+                'raise KNOWN_EMAILS_CAPACITY to keep the false-positive rate down.',
+                bloom.count, bloom.capacity)
+        state['filter'] = bloom
+        current_app.logger.info('Known-email filter rebuilt: %s', self.stats())
+
+    def might_contain(self, email):
+        """
+        Return False only if the email is definitely not registered.
+        """
+        bloom = self._state()['filter']
+        return bloom is None or email in bloom
+
+    def add(self, email):
+        """Record a newly registered email."""
+        bloom = self._state()['filter']
+        if bloom is not None:
+            bloom.add(email)
+
+    def record_false_positive(self):
+        """Count a "maybe" answer that the database lookup proved wrong."""
+        state = self._state()
+        if state['filter'] is None:
+            # A disabled filter answers "maybe" by design; that is not a false positive
+            return
+        with self._lock:
+            state['false_positives'] += 1
+
+    def record_precheck_skipped(self):
+        """Count a signup that skipped the existence query."""
+        with self._lock:
+            self._state()['prechecks_skipped'] += 1
+
+    def stats(self):
+        """
+        Report the filter's size and false-positive rates.
+
+        Returns:
+        dict: Sizing, item count, configured/estimated false-positive rates,
+              and the false positives and skipped pre-checks seen at signup.
+        """
+        state = self._state()
+        bloom = state['filter']
+        if bloom is None:
+            return {'enabled': False}
+        return {
+            'enabled': True,
+            'items': bloom.count,
+            'capacity': bloom.capacity,
+            'num_bits': bloom.num_bits,
+            'num_hashes': bloom.num_hashes,
+            'configured_false_positive_rate': bloom.error_rate,
+            'estimated_false_positive_rate': bloom.estimated_false_positive_rate,
+            'observed_false_positives': state['false_positives'],
+            'prechecks_skipped': state['prechecks_skipped'],
+        }
+
+
+known_emails = KnownEmailFilter()
@@ -0,0 +1,61 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal.py
+Description:
+The `internal.py` file defines the routes for internal operations endpoints
+(metrics and diagnostics). They live under the `internal_bp` blueprint,
+mounted at `/internal`, and every route requires the internal API token.
+
+Key Features:
+1. **Pool Metrics**: `/internal/pool` reports connection pool gauges and
+   checkout metrics.
+   `/internal/metrics` serves the Prometheus metrics of all workers.
+
+2. **Profiles**: `/internal/profiles` lists the stored request profiles and
+   `/internal/profiles/<name>` downloads one.
+   `/internal/sampling` summarises the always-on sampling profiler and
+   `/internal/sampling/folded` serves its stacks for flame graphs.
+   `/internal/memory` starts and stops tracemalloc, takes snapshots and
+   diffs them.
+
+3. **Access Control**:
+   - All routes are hidden (404) unless `INTERNAL_API_TOKEN` is set, and
+     require the token in the `X-Internal-Token` header.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from flask import Blueprint
+
+from app.controllers.internal_controllers.internal_access import require_internal_token
+from app.controllers.internal_controllers.internal_controller_for_pool_metrics import pool_metrics
+from app.controllers.internal_controllers.internal_controller_for_metrics import metrics
+from app.controllers.internal_controllers.internal_controller_for_profiles import (profiles,
+                                                                                  download_profile)
+from app.controllers.internal_controllers.internal_controller_for_sampling import (sampling,
+                                                                                  reset_sampling,
+                                                                                  folded_stacks)
+from app.controllers.internal_controllers.internal_controller_for_memory import (memory_status,
+                                                                                start_tracing,
+                                                                                stop_tracing,
+                                                                                take_snapshot,
+                                                                                snapshot_top)
+
+internal_bp = Blueprint('internal', __name__)
+
+internal_bp.before_request(require_internal_token)
+
+internal_bp.route('/pool')(pool_metrics)
+internal_bp.route('/metrics')(metrics)
+internal_bp.route('/profiles')(profiles)
+internal_bp.route('/profiles/<path:name>')(download_profile)
+internal_bp.route('/sampling')(sampling)
+internal_bp.route('/sampling', methods=['DELETE'])(reset_sampling)
+internal_bp.route('/sampling/folded')(folded_stacks)
+internal_bp.route('/memory')(memory_status)
+internal_bp.route('/memory/start', methods=['POST'])(start_tracing)
+internal_bp.route('/memory/stop', methods=['POST'])(stop_tracing)
+internal_bp.route('/memory/snapshots', methods=['POST'])(take_snapshot)
+internal_bp.route('/memory/snapshots/<int:snapshot_id>')(snapshot_top)
@@ -26,7 +26,7 @@ Key Features:
    lists, user profiles, and forms for adding/editing characters and profiles.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 
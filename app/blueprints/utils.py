@@ -23,14 +23,16 @@ Key Features:
 5. **Environment Variables**: The file loads the path to the `characters.json`
    file from environment variables, ensuring flexibility and configuration through
    a `.env` file.
+6. **Tracing**: `fetch_character_data` is a span of sampled requests.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 
 import os
 import json
+from app.monitoring.tracing import traced
 
 
 # Correct the base directory
@@ -90,6 +92,7 @@ def _fetch_character_data(character_name):
     return None
 
 
+@traced
 def fetch_character_data(character_name):
     """
     Public function to fetch character data, using the internal _fetch_character_data function.
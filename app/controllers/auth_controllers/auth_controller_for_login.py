@@ -18,18 +18,23 @@ Key Features:
 2. **Input Validation**:
    - Ensures both email and password fields are filled before processing the login attempt.
 
-3. **Flash Messaging**:
+3. **Password Rehashing**:
+   - Re-hashes the password on a successful login when the configured hash
+     parameters have changed since it was stored.
+
+4. **Flash Messaging**:
    - Provides feedback to the user via flash messages for success or error notifications.
 
-4. **Template Integration**:
+5. **Template Integration**:
    - Renders the `login.html` template for the login page, ensuring a seamless user interface.
 
 Created: 2024-12-09
-Updated: 2024-12-09
+Updated: 2026-10-19
 =============================================================================
 """
 from flask import render_template, request, redirect, url_for, flash, session
-from app.models import User
+from app.password_hasher import password_hasher
+from app.datamanager.data_manager_factory import data_manager
 
 
 def login():
@@ -49,9 +54,14 @@ def login():
             return render_template('login.html')
 
         # Check if the email matches or
-        user = User.query.filter_by(email=email).first()
+        user = data_manager().get_user_by_email(email)
 
         if user and user.check_password(password):  # Verify password
+            # Transparently upgrade hashes made with older cost parameters
+            # (committed by the request's unit of work)
+            if password_hasher.needs_rehash(user.password):
+                data_manager().update_user(user.id, {'password': password_hasher.hash(password)})
+
             session.clear()  # Clear any previous session data
             session['user_id'] = user.id  # Store user ID in session
 
@@ -21,10 +21,17 @@ Key Features:
 3. Character Management:
    - Offers functions to create, update, and manage character data, including
      associated entities like houses, roles, and strengths.
+   - New characters are inserted with `INSERT ... ON CONFLICT DO NOTHING`
+     against the unique `(user_id, name)` constraint, in one roundtrip.
+   - Edits update only the changed columns and use the `version` column for
+     optimistic locking, so concurrent edits are detected without row locks.
 
 4. Database Interaction:
-   - Employs SQLAlchemy ORM for efficient and reliable database transactions,
+   - All reads and writes go through the app's data manager
+     (`data_manager()`), so the storage engine can be swapped by configuration,
      with rollback mechanisms to preserve data integrity.
+   - Helpers never commit; the request-scoped unit of work
+     (`app/datamanager/unit_of_work.py`) commits once per request.
 
 5. Error Handling:
    - Provides robust error handling with detailed feedback using flash messages,
@@ -33,11 +40,16 @@ Key Features:
 6. Cache Management:
    - Includes utilities to clear application cache, ensuring optimal performance.
 
+7. Tracing:
+   - The character helpers are `@traced`, so sampled requests show each one
+     as a span (see `app/monitoring/tracing.py`).
+
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 =============================================================================
 """
 import os
+from datetime import date
 from flask import (
     request,
     redirect,
@@ -45,10 +57,12 @@ from flask import (
     session,
     flash,
     current_app,
+    g,
     make_response)
 from werkzeug.utils import secure_filename
-from app.models import db, User, Character, Role, Strength, House
 from app.blueprints.utils import fetch_character_data
+from app.datamanager.data_manager_factory import data_manager
+from app.monitoring.tracing import traced
 
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
 
@@ -64,6 +78,27 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def parse_form_date(value):
+    """
+    Convert a form's `YYYY-MM-DD` value into a date.
+
+    PostgreSQL casts date strings itself, but SQLite's Date type only takes
+    `date` objects, so form values are converted before they reach a model.
+
+    Parameters:
+    value (str): The submitted value, e.g. from an `<input type="date">`.
+
+    Returns:
+    date or None: The date, or None if the value is empty or not a valid date.
+    """
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def handle_file_upload(upload_request):
     """
        Handles the file upload for a profile picture.
@@ -91,11 +126,20 @@ def handle_file_upload(upload_request):
 
 
 def user_logged_in():
-    """Check if the user is logged in."""
+    """
+    Check if the user is logged in.
+
+    The user is loaded once per request: controllers call this twice (to
+    check, then to use the user), and the session's identity map holds
+    objects weakly, so the second call would otherwise query again.
+    """
     user_id = session.get('user_id')
     if user_id:
-        # This should return the User object or None
-        return User.query.get(user_id)
+        cached = g.get('logged_in_user')
+        if cached is None or cached[0] != user_id:
+            # This should return the User object or None
+            cached = g.logged_in_user = (user_id, data_manager().get_user(user_id))
+        return cached[1]
     return None
 
 
@@ -165,53 +209,39 @@ def handle_missing_character_data():
 
 def handle_add_character_post(user):
     """Handle POST request for adding a character."""
-    user_id = session['user_id']
     character_name = request.form.get('name')
 
     # Check if character name is provided
     if not character_name:
         return handle_missing_character_name()
 
-    # Check if the character already exists
-    if check_existing_character(character_name, user_id):
-        flash('Character with this name already exists.', 'warning')
-        return redirect(url_for('user.my_character_list'))
-
     # Fetch character data (from JSON or another source)
     character_data = fetch_character_data(character_name)
     print("DEBUG :", character_data)
     if not character_data:
         return handle_missing_character_data()
 
-    # Create a new character using the fetched data
-    new_character = create_character_from_data(character_data, user)
-    if not new_character:
+    # Build the new character's column values from the fetched data
+    character_values = create_character_from_data(character_data, user)
+    if not character_values:
         return handle_invalid_character_data()
 
-    # Save the new character to the database
-    return save_new_character(new_character)
-
-
-def check_existing_character(character_name, user_id):
-    """
-    Checks if a character with the given name already
-    exists for the specified admin.
-    """
-    character = Character.query.filter_by(name=character_name,
-                                          user_id=user_id).first()
-    return character is not None
+    # Insert the character; an existing (user, name) pair is reported by
+    # the insert itself, so no separate existence check is needed
+    return save_new_character(character_values)
 
 
+@traced
 def create_character_from_data(character_data, user):
     """
-    Creates a new character from the fetched character data.
+    Builds the column values for a new character from the fetched character data.
 
     Parameters:
     - character_data (dict): The data used to create the character.
     - user (User): The user associated with this character.
 
     Returns:
-    - Character: A new Character object or None if the data is invalid.
+    - dict: The new character's column values, or None if the data is invalid.
     """
     # Fetch and validate character data
     character_name = character_data.get('name')
@@ -224,121 +254,175 @@ def create_character_from_data(character_data, user):
         return None
 
     # Find or create associated models
-    house = find_or_create_house(house_name) if house_name else None
-    role = find_or_create_role(role_name) if role_name else None
-    strength = find_or_create_strength(strength_name) if strength_name else None
+    house_id = find_or_create_house(house_name) if house_name else None
+    role_id = find_or_create_role(role_name) if role_name else None
+    strength_id = find_or_create_strength(strength_name) if strength_name else None
 
     try:
-        new_character = Character(
-            name=character_name,
-            house=house,
-            animal=character_data.get('animal'),
-            symbol=character_data.get('symbol'),
-            nickname=character_data.get('nickname'),
-            role=role,
-            age=character_data.get('age'),
-            death=character_data.get('death'),
-            strength=strength,
-            user_id=user.id
-        )
-        return new_character
+        return {
+            'name': character_name,
+            'house_id': house_id,
+            'animal': character_data.get('animal'),
+            'symbol': character_data.get('symbol'),
+            'nickname': character_data.get('nickname'),
+            'role_id': role_id,
+            'age': character_data.get('age'),
+            'death': character_data.get('death'),
+            'strength_id': strength_id,
+            'user_id': user.id
+        }
     except KeyError as e:
         print(f"Missing key in character data: {e}")
         return None
 
 
+@traced
 def find_or_create_house(house_name):
     """
-    Finds or creates a House based on the given name.
+    Finds or creates a House based on the given name and returns its id.
     """
-    house = House.query.filter_by(name=house_name).first()
-    if not house:
-        house = House(name=house_name)
-        db.session.add(house)
-        db.session.commit()
-    return house
+    return data_manager().bulk_upsert_houses([house_name])[house_name]
 
 
+@traced
 def find_or_create_role(role_name):
     """
-    Finds or creates a Role based on the given name.
+    Finds or creates a Role based on the given name and returns its id.
     """
-    role = Role.query.filter_by(name=role_name).first()
-    if not role:
-        role = Role(name=role_name)
-        db.session.add(role)
-        db.session.commit()
-    return role
+    return data_manager().bulk_upsert_roles([role_name])[role_name]
 
 
+@traced
 def find_or_create_strength(strength_name):
     """
-    Finds or creates a Strength based on the given name.
+    Finds or creates a Strength based on the given name and returns its id.
+    """
+    return data_manager().bulk_upsert_strengths([strength_name])[strength_name]
+
+
+def insert_character_if_absent(character_values):
+    """
+    Inserts a character unless the user already has a character with the
+    same name; see `add_character_if_absent` of the data manager.
+
+    Returns:
+    - int: The new character's id, or None if it already existed.
     """
-    strength = Strength.query.filter_by(name=strength_name).first()
-    if not strength:
-        strength = Strength(name=strength_name)
-        db.session.add(strength)
-        db.session.commit()
-    return strength
+    return data_manager().add_character_if_absent(character_values)
 
 
-def save_new_character(character):
+@traced
+def save_new_character(character_values):
     """
-    Saves the new character to the database and commits the transaction.
+    Saves the new character to the database; the request's unit of work
+    commits it together with any house, role or strength created for it.
     """
     try:
-        db.session.add(character)
-        db.session.commit()
+        character_id = insert_character_if_absent(character_values)
+        if character_id is None:
+            # Empty RETURNING: the (user_id, name) pair is already taken
+            flash('Character with this name already exists.', 'warning')
+            return redirect(url_for('user.my_character_list'))
+
         flash('Character added successfully!',
               'success')
         return redirect(url_for('user.my_character_list'))
     except Exception as e:
-        db.session.rollback()
+        data_manager().rollback()
         print(f"Error saving character: {e}")
         flash('Error adding character: Database error occurred.',
               'danger')
         return redirect(url_for('user.user_add_character'))
 
 
+# Editable character columns and how their form values are converted
+CHARACTER_FORM_FIELDS = {
+    'name': str,
+    'house_id': int,
+    'animal': str,
+    'symbol': str,
+    'nickname': str,
+    'role_id': int,
+    'age': int,
+    'death': int,
+    'strength_id': int,
+}
+
+
+def character_changes(character, form):
+    """
+    Compares the submitted form with the loaded character.
+
+    Fields missing from the form are left alone, empty values become NULL,
+    and numeric fields are converted to integers before comparing.
+
+    Parameters:
+    - character (Character): The character as currently stored.
+    - form (MultiDict): The submitted form data.
+
+    Returns:
+    - dict: Only the columns whose value actually changed.
+    """
+    changes = {}
+    for field, convert in CHARACTER_FORM_FIELDS.items():
+        raw_value = form.get(field)
+        if raw_value is None:
+            continue
+        value = convert(raw_value.strip()) if raw_value.strip() != '' else None
+        if value != getattr(character, field):
+            changes[field] = value
+    return changes
+
+
+def update_character_if_version(character, changes, expected_version):
+    """
+    Writes only the changed columns, guarded by optimistic locking: an edit
+    based on a stale version updates nothing instead of overwriting someone
+    else's changes.
+
+    Returns:
+    - bool: True if the row was updated, False on a version conflict.
+    """
+    return data_manager().update_character_if_version(character.id, changes,
+                                                      expected_version)
+
+
+@traced
 def handle_character_update(character):
     """
     Handles the update of a character's details.
     """
     try:
-        # Get updated data from the form
-        updated_data = {
-            'name': request.form.get('name'),
-            'house_id': request.form.get('house_id'),
-            'animal': request.form.get('animal'),
-            'symbol': request.form.get('symbol'),
-            'nickname': request.form.get('nickname'),
-            'role_id': request.form.get('role_id'),
-            'age': request.form.get('age'),
-            'death': request.form.get('death'),
-            'strength_id': request.form.get('strength_id')
-        }
-
         # Ensure the form data is not empty or invalid
-        if not updated_data['name']:
+        if not request.form.get('name'):
             flash('Character name is required.',
                   'danger')
-            return redirect(url_for('user.edit_character',
+            return redirect(url_for('user.user_edit_character',
                                     character_id=character.id))
 
-        # Handle 'death' field (convert empty string to None for NULL in the database)
-        if updated_data['death'] == '':
-            updated_data['death'] = None
-
-        # Update the character's details with the new data
-        for key, value in updated_data.items():
-            # Convert age and death to integers if present
-            if key in ['age'] and value:
-                value = int(value)
-            setattr(character, key, value)
+        # The version the edit form was rendered from (falls back to the
+        # loaded row for clients that do not send it)
+        expected_version = request.form.get('version', type=int) or character.version
+
+        changes = character_changes(character, request.form)
+        if not changes:
+            # Nothing changed: skip the write entirely
+            flash('No changes to save.', 'info')
+            return redirect(url_for('user.my_character_list'))
+
+        # A rename must not take a name the user already uses
+        if 'name' in changes and data_manager().character_name_exists(character.user_id,
+                                                                      changes['name']):
+            flash('Character with this name already exists.', 'warning')
+            return redirect(url_for('user.user_edit_character',
+                                    character_id=character.id))
 
-        # Commit changes to the database
-        db.session.commit()
+        if not update_character_if_version(character, changes, expected_version):
+            flash('This character was changed by someone else. '
+                  'Please review the latest version and try again.',
+                  'warning')
+            return redirect(url_for('user.user_edit_character',
+                                    character_id=character.id))
 
         flash('Character updated successfully!',
               'success')
@@ -347,7 +431,7 @@ def handle_character_update(character):
 
     except Exception as e:
         # Rollback the session if an error occurs
-        db.session.rollback()
+        data_manager().rollback()
         flash(f'Error updating character: {str(e)}',
               'danger')
         # Redirect to the user's characters list page
@@ -31,11 +31,11 @@ Key Features:
      for submitting inquiries or feedback.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 from sqlalchemy.exc import IntegrityError
 from flask import request, render_template, flash, redirect, url_for
-from app.models import db, Contact
+from app.datamanager.data_manager_factory import data_manager
 
 
 def contact():
@@ -48,15 +48,13 @@ def contact():
         email = request.form['email']
         message = request.form['message']
 
-        new_contact = Contact(name=name, email=email, message=message)
-
         try:
-            db.session.add(new_contact)
-            db.session.commit()
+            # Errors surface here; the request's unit of work commits
+            data_manager().add_contact(name, email, message)
             flash('Your message has been sent!', 'success')
             return redirect(url_for('auth.contact'))
         except IntegrityError:
-            db.session.rollback()
+            data_manager().rollback()
             flash('There was an issue saving your message. Please try again.', 'danger')
 
     return render_template('contact.html')
@@ -0,0 +1,42 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_access.py
+Description:
+The `internal_access.py` file guards the internal operations endpoints
+(metrics and diagnostics under `/internal`). They are meant for operators and
+scrapers, not for users, so they are protected by a shared token instead of
+the login session.
+
+Key Features:
+1. **Disabled by Default**: Without `INTERNAL_API_TOKEN` every internal route
+   answers 404, as if it did not exist.
+2. **Token Check**: Requests must send the token in the `X-Internal-Token`
+   header; a wrong or missing token gets a 403.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+import hmac
+from flask import abort, current_app, request
+
+INTERNAL_TOKEN_HEADER = 'X-Internal-Token'
+
+
+def token_matches(token, supplied):
+    """Compare a supplied token with the configured one in constant time."""
+    return bool(token) and hmac.compare_digest((supplied or '').encode(), token.encode())
+
+
+def require_internal_token():
+    """
+    `before_request` hook for the internal blueprint.
+
+    Aborts with 404 when no token is configured and with 403 when the request
+    does not carry it.
+    """
+    token = current_app.config.get('INTERNAL_API_TOKEN')
+    if not token:
+        abort(404)
+    if not token_matches(token, request.headers.get(INTERNAL_TOKEN_HEADER)):
+        abort(403)
@@ -0,0 +1,89 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_controller_for_memory.py
+Description:
+The `internal_controller_for_memory.py` file drives tracemalloc in the process
+that answers (see `app/monitoring/memory_profiler.py`): start and stop
+tracing, take snapshots and compare them.
+
+Key Features:
+1. **Status**: Whether tracing is on, the traced and peak sizes, and the
+   kept snapshots.
+2. **Start/Stop**: `?frames=` sets the traceback depth kept per allocation.
+3. **Snapshots**: Taking one returns its largest growth since the previous
+   snapshot; any kept snapshot can be reported on its own or against
+   another with `?compare=`, grouped by `lineno` or `filename`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+from flask import abort, current_app, jsonify, request
+
+
+def _profiler():
+    profiler = current_app.extensions.get('memory_profiler')
+    if profiler is None:
+        abort(404)
+    return profiler
+
+
+def _top(profiler, snapshot_id, compare_to):
+    try:
+        return profiler.top(snapshot_id, compare_to,
+                            group_by=request.args.get('group_by', 'lineno'),
+                            limit=request.args.get('limit', 20, type=int))
+    except KeyError:
+        abort(404)
+    except ValueError:
+        abort(400)
+
+
+def memory_status():
+    """
+    Return the tracing status as JSON.
+    """
+    return jsonify(_profiler().status())
+
+
+def start_tracing():
+    """
+    Start tracemalloc in this process.
+    """
+    profiler = _profiler()
+    profiler.start(request.args.get('frames', type=int))
+    return jsonify(profiler.status())
+
+
+def stop_tracing():
+    """
+    Stop tracemalloc in this process and drop the snapshots.
+    """
+    profiler = _profiler()
+    profiler.stop()
+    return jsonify(profiler.status())
+
+
+def take_snapshot():
+    """
+    Take a snapshot; return its id and the growth since the previous one (or
+    its largest sites when it is the first).
+    """
+    profiler = _profiler()
+    previous = profiler.snapshot_ids()[-1:]
+    snapshot_id = profiler.take_snapshot()
+    if snapshot_id is None:
+        abort(409)
+    compare_to = previous[0] if previous else None
+    return jsonify({'id': snapshot_id, 'compare': compare_to,
+                    'top': _top(profiler, snapshot_id, compare_to)}), 201
+
+
+def snapshot_top(snapshot_id):
+    """
+    Return the largest sites of a kept snapshot, or with `?compare=<id>` the
+    largest changes since that one.
+    """
+    compare_to = request.args.get('compare', type=int)
+    return jsonify({'id': snapshot_id, 'compare': compare_to,
+                    'top': _top(_profiler(), snapshot_id, compare_to)})
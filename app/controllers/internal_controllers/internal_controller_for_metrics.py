@@ -0,0 +1,32 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_controller_for_metrics.py
+Description:
+The `internal_controller_for_metrics.py` file exposes the app's metrics to a
+Prometheus scraper.
+
+Key Features:
+1. **Prometheus Text Format**: Per-endpoint latency histograms, status-code
+   counters and in-flight gauges, cache hits/misses, connection pool and
+   known-email filter numbers.
+2. **All Workers**: In multiprocess mode (`METRICS_MULTIPROC_DIR`) the numbers
+   cover every worker process, whichever one answers the scrape.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+from flask import Response, abort, current_app
+from app.monitoring.metrics import render
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def metrics():
+    """
+    Return the metrics in the Prometheus text exposition format.
+    """
+    registry = current_app.extensions.get('metrics')
+    if registry is None:
+        abort(404)
+    return Response(render(registry.collect()), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,30 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_controller_for_pool_metrics.py
+Description:
+The `internal_controller_for_pool_metrics.py` file reports the state of every
+database connection pool the app uses, so pool exhaustion can be seen and
+alerted on.
+
+Key Features:
+1. **Per-Engine Stats**: One entry per engine (`default` plus any binds) with
+   pool size, connections in use / idle / in overflow and the configured
+   overflow limit.
+2. **Checkout Metrics**: Checkout count, timeouts and the cumulative
+   wait-time histogram recorded by `InstrumentedQueuePool`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+from flask import jsonify
+from app.datamanager.replica_routing import app_engines
+from app.monitoring.pool_metrics import pool_stats
+
+
+def pool_metrics():
+    """
+    Return the connection pool gauges and checkout metrics as JSON.
+    """
+    return jsonify({bind_key or 'default': pool_stats(engine)
+                    for bind_key, engine in app_engines().items()})
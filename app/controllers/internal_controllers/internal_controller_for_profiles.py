@@ -0,0 +1,35 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_controller_for_profiles.py
+Description:
+The `internal_controller_for_profiles.py` file serves the request profiles
+stored by the on-demand profiler (see `app/monitoring/request_profiler.py`).
+
+Key Features:
+1. **Listing**: The stored pstats dumps, newest first, with size and time.
+2. **Download**: One dump as an attachment, for `python -m pstats` or
+   snakeviz.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+from flask import abort, current_app, jsonify, send_from_directory
+from app.monitoring.request_profiler import PROFILE_SUFFIX, list_profiles
+
+
+def profiles():
+    """
+    Return the stored profiles as JSON.
+    """
+    return jsonify(list_profiles(current_app.config['PROFILE_DIR']))
+
+
+def download_profile(name):
+    """
+    Return one stored profile as an attachment.
+    """
+    if not name.endswith(PROFILE_SUFFIX):
+        abort(404)
+    # send_from_directory rejects names that leave the directory
+    return send_from_directory(current_app.config['PROFILE_DIR'], name, as_attachment=True)
@@ -0,0 +1,50 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: internal_controller_for_sampling.py
+Description:
+The `internal_controller_for_sampling.py` file serves the per-endpoint stack
+samples of the always-on sampling profiler (see
+`app/monitoring/sampling_profiler.py`) of the process that answers.
+
+Key Features:
+1. **Summary**: Whether the sampler runs, its rate and measured overhead, and
+   the samples per endpoint.
+2. **Folded Stacks**: All stacks, or one endpoint's with `?endpoint=`, as
+   text for `flamegraph.pl`, speedscope or inferno.
+3. **Reset**: `DELETE` drops the counts, e.g. before comparing a release.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+from flask import Response, abort, current_app, jsonify, request
+
+
+def _sampler():
+    sampler = current_app.extensions.get('sampling_profiler')
+    if sampler is None:
+        abort(404)
+    return sampler
+
+
+def sampling():
+    """
+    Return the sampler's state and samples per endpoint as JSON.
+    """
+    return jsonify(_sampler().stats())
+
+
+def reset_sampling():
+    """
+    Drop the samples collected so far.
+    """
+    _sampler().reset()
+    return '', 204
+
+
+def folded_stacks():
+    """
+    Return the sampled stacks in the folded format.
+    """
+    return Response(_sampler().folded(request.args.get('endpoint')),
+                    content_type='text/plain; charset=utf-8')
@@ -12,7 +12,8 @@ experience for new users.
 Key Features:
 1. **User Signup Process**:
    - **Form Validation**: Ensures required fields are filled and verifies
-     that the email is unique.
+     that the email is unique. A Bloom filter of known emails skips the
+     existence query for emails that are definitely new.
    - **Password Hashing**: Secures user passwords by storing them in a hashed format.
 
 2. **Profile Picture Upload**:
@@ -20,7 +21,8 @@ Key Features:
      securely and linked to the user profile.
 
 3. **Database Integration**:
-   - Creates and stores new user records in the database with all relevant details.
+   - Creates and stores new user records through the app's data manager
+     (`add_user`), which also hashes the password.
 
 4. **Error Handling**:
    - Provides meaningful error messages for validation failures or database
@@ -39,14 +41,14 @@ Key Features:
      generation for user authentication.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 from sqlalchemy.exc import IntegrityError
-from werkzeug.security import generate_password_hash
 from flask import flash, redirect, render_template, request, url_for
-from app.models import User, db
-from app.controllers.common_fun import handle_file_upload
+from app.controllers.common_fun import handle_file_upload, parse_form_date
+from app.bloom_filter import known_emails
+from app.datamanager.data_manager_factory import data_manager
 
 
 def signup_user():
@@ -58,7 +60,7 @@ def signup_user():
     if request.method == 'POST':
         username = request.form['username']
         email = request.form['email']
-        date_of_birth = request.form['dob']
+        date_of_birth = parse_form_date(request.form['dob'])
         password = request.form['password']
         gender = request.form.get('gender')  # Optional field
 
@@ -66,30 +68,33 @@ def signup_user():
             flash('E-mail is required to create a user.', 'error')
             return redirect(url_for('auth.signup_user'))
 
-        if User.query.filter_by(email=email).first():
-            flash('User already exists with this E-mail. Please use a different email.', 'error')
-            return redirect(url_for('auth.signup_user'))
+        # Only pay for the existence query when the filter cannot rule the
+        # email out; a "definitely new" answer goes straight to the insert and
+        # the unique constraint (IntegrityError below) is the safety net.
+        if known_emails.might_contain(email):
+            if data_manager().email_exists(email):
+                flash('User already exists with this E-mail. Please use a different email.', 'error')
+                return redirect(url_for('auth.signup_user'))
+            known_emails.record_false_positive()
+        else:
+            known_emails.record_precheck_skipped()
 
-        hashed_password = generate_password_hash(password)
         profile_picture_filename = handle_file_upload(request)
 
-        new_user = User(
-            username=username,
-            email=email,
-            date_of_birth=date_of_birth,
-            password=hashed_password,
-            gender=gender,
-            profile_picture=profile_picture_filename
-        )
-
         try:
-            db.session.add(new_user)
-            db.session.commit()
+            # Hashes the password; a duplicate email raises here and the
+            # request's unit of work commits
+            data_manager().add_user(username, email, password, date_of_birth,
+                                    gender, profile_picture_filename)
+            known_emails.add(email)
 
             flash('User registration successful!', 'success')
             return redirect(url_for('auth.login'))
         except IntegrityError:
-            db.session.rollback()
+            data_manager().rollback()
             flash('User with this email already exists.', 'danger')
+        except ValueError as e:
+            # Rejected by the data manager (password too short, duplicate email)
+            flash(str(e), 'danger')
 
     return render_template('singup.html')
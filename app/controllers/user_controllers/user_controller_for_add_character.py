@@ -25,16 +25,16 @@ Key Features:
    render the character creation form for GET requests.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 from flask import render_template, request
-from app.models import House, Role, Strength
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in,
                                         handle_add_character_post
                                         )
+from app.datamanager.data_manager_factory import data_manager
 
 
 def user_add_character():
@@ -42,8 +42,8 @@ def user_add_character():
     Handles the addition of a new character by a user.
 
     This function manages user authentication, renders the character creation form,
-    and processes submitted data to add a new character. It interacts with the `House`,
-    `Role`, and `Strength` models to fetch relevant options for character attributes.
+    and processes submitted data to add a new character. It asks the data manager for
+    the houses, roles, and strengths offered as character attributes.
 
     Returns:
         - Rendered HTML template for GET requests to show the form.
@@ -62,9 +62,11 @@ def user_add_character():
 
     # For GET request, prepare the list of available
     # houses, roles, and strengths for character creation
-    houses = House.query.all()
-    roles = Role.query.all()
-    strengths = Strength.query.all()
+    # Lookup lists are read-only and may come from the read replica
+    manager = data_manager()
+    houses = manager.get_all_houses()
+    roles = manager.get_all_roles()
+    strengths = manager.get_all_strengths()
     return render_template(
         'add_character.html',
         houses=houses,
@@ -22,16 +22,16 @@ Key Features:
    or failure and redirects the user to the character list page after the operation.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 =============================================================================
 """
 
 from flask import redirect, url_for, flash
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError, OperationalError
-from app.models import db, Character
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in)
+from app.datamanager.data_manager_factory import data_manager
 
 
 def delete_character(character_id):
@@ -58,30 +58,30 @@ def delete_character(character_id):
 
     try:
         # Delete the character if it belongs to the current user
-        deleted_rows = Character.query.filter_by(id=character_id, user_id=user.id).delete()
+        deleted_rows = data_manager().delete_user_character(character_id, user.id)
         # No character found for the user
         if deleted_rows == 0:
             flash('Character not found or does not belong to you.',
                   'warning')
             return redirect(url_for('user.my_character_list'))
 
-        db.session.commit()
+        # Committed by the request's unit of work
         flash('Character deleted successfully!',
               'success')
 
     except IntegrityError:
         # Rollback on integrity error
-        db.session.rollback()
+        data_manager().rollback()
         flash('Error deleting character: Integrity error occurred.',
               'danger')
     except OperationalError:
         # Rollback on operational error
-        db.session.rollback()
+        data_manager().rollback()
         flash('Error deleting character: A database operational error occurred.',
               'danger')
     except SQLAlchemyError:
         # Rollback on SQLAlchemy-related errors
-        db.session.rollback()
+        data_manager().rollback()
         flash('Error deleting character: A database error occurred.',
               'danger')
 
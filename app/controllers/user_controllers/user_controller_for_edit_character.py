@@ -7,8 +7,8 @@ The `user_controller_for_edit_character.py` file is responsible for managing
 the user flow related to editing an existing character in the Game API App.
 This controller handles user authentication, ensures that the logged-in user
 has access to edit their own character, and processes the update request.
-It interacts with the `Character`, `House`, `Strength`, and `Role` models
-to populate the form with available data, and updates the character information
+It reads the character, houses, strengths, and roles through the app's
+data manager to populate the form with available data, and updates the character information
 in the database after validation. Additionally, the file includes error handling
 to ensure smooth user experience and security during the update process.
 
@@ -27,15 +27,15 @@ Key Features:
    the character editing form for GET requests and provides updated information on POST requests.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
-from flask import render_template, request, redirect, url_for, flash
-from app.models import Character, House, Strength, Role
+from flask import render_template, request, redirect, url_for, flash, abort
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in,
                                         handle_character_update)
+from app.datamanager.data_manager_factory import data_manager
 
 
 def user_edit_character(character_id):
@@ -53,7 +53,10 @@ def user_edit_character(character_id):
         return handle_invalid_user()
 
     # Fetch the character by ID and check if it belongs to the current user
-    character = Character.query.get_or_404(character_id)
+    manager = data_manager()
+    character = manager.get_character(character_id)
+    if character is None:
+        abort(404)
 
     if character.user_id != user.id:
         flash('You are not authorized to edit this character.',
@@ -62,9 +65,10 @@ def user_edit_character(character_id):
         return redirect(url_for('user.my_character_list'))
 
     # Get related data for the form: Houses, Roles, and Strengths
-    houses = House.query.all()
-    roles = Role.query.all()
-    strengths = Strength.query.all()
+    # Lookup lists are read-only and may come from the read replica
+    houses = manager.get_all_houses()
+    roles = manager.get_all_roles()
+    strengths = manager.get_all_strengths()
 
     if request.method == 'POST':
         # Call the function to handle the character update
@@ -8,7 +8,7 @@ related to editing a user's profile in the Game API App. This controller
 ensures that the logged-in user can update their profile details, including
 name, email, password, date of birth, gender, and profile picture. It validates
 the input data, handles the file upload for the profile picture, and updates
-the user's information in the database. The file also provides error handling
+the user's information through the app's data manager. The file also provides error handling
 for authentication and invalid user cases.
 
 Key Features:
@@ -29,7 +29,7 @@ Key Features:
    the user profile on POST requests.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 import os
@@ -39,14 +39,16 @@ from flask import (render_template,
                    redirect,
                    url_for,
                    flash,
+                   abort,
                    current_app)
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash
-from app.models import db, User
+from app.password_hasher import password_hasher
+from app.datamanager.data_manager_factory import data_manager
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in,
-                                        allowed_file)
+                                        allowed_file,
+                                        parse_form_date)
 
 
 def edit_user_profile(user_id):
@@ -77,37 +79,42 @@ def edit_user_profile(user_id):
         # Handle case where user is not valid
         return handle_invalid_user()
 
-    user = User.query.get_or_404(user_id)
+    user = data_manager().get_user(user_id)
+    if user is None:
+        abort(404)
 
     if request.method == 'POST':
         new_name = request.form.get('name', user.username)
-        new_date_of_birth = request.form.get('dob', user.date_of_birth)
+        new_date_of_birth = parse_form_date(request.form.get('dob')) or user.date_of_birth
         new_email = request.form.get('email', user.email)
         new_gender = request.form.get('gender', user.gender)
         new_password = request.form.get('password', None)
 
+        # Collect only the changed fields
+        updates = {}
+
         # Check if name has changed
         if new_name and user.username != new_name:
-            user.username = new_name
+            updates['username'] = new_name
 
         # Check if email has changed
         if new_email and user.email != new_email:
-            user.email = new_email
+            updates['email'] = new_email
 
         # Check if name has changed
         if new_date_of_birth and user.date_of_birth != new_date_of_birth:
-            user.date_of_birth = new_date_of_birth
+            updates['date_of_birth'] = new_date_of_birth
 
         # Update the password only if a new password was provided
         # Ensure the password is not blank
         if new_password and new_password.strip():
-            user.password = generate_password_hash(new_password)
+            updates['password'] = password_hasher.hash(new_password)
             # Optional timestamp for tracking password updates
-            user.updated_at = datetime.now()
+            updates['updated_at'] = datetime.now()
 
         # Check if gender has changed
         if new_gender and user.gender != new_gender:
-            user.gender = new_gender
+            updates['gender'] = new_gender
 
         # Handle profile picture upload (optional)
         if 'profile_picture' in request.files:
@@ -118,13 +125,15 @@ def edit_user_profile(user_id):
                                                     filename)
                 file.save(profile_picture_path)
                 # Save only the filename
-                user.profile_picture = filename
+                updates['profile_picture'] = filename
 
                 # Debugging: Print profile picture details
                 print(f"Profile Picture Filename: {filename}")
                 print(f"Profile Picture Path: {profile_picture_path}")
 
-        db.session.commit()
+        if updates:
+            # Errors surface here; the request's unit of work commits
+            data_manager().update_user(user.id, updates)
         flash('Your profile updated successfully!',
               'success')
         return redirect(url_for('user.user_profile'))
@@ -15,8 +15,8 @@ requests for partial page updates, improving user experience.
 Key Features:
 1. **User Authentication**: Ensures that the user is logged in before
    allowing access to the character list. If not, redirects to the login page.
-2. **Character Data Fetching**: Retrieves the list of characters related
-   to the logged-in user, and supports dynamic filtering based on search
+2. **Character Data Fetching**: Retrieves one page of the characters related
+   to the logged-in user from the app's data manager, and supports dynamic filtering based on search
    queries and multiple filters (e.g., house, role, strength, age).
 3. **Search Functionality**: Supports searching characters by name using
    a case-insensitive search query.
@@ -33,11 +33,11 @@ Key Features:
    template for AJAX responses.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 from flask import render_template, request
-from app.models import Character, House, Role, Strength
+from app.datamanager.data_manager_factory import data_manager
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in)
@@ -56,7 +56,29 @@ def my_character_list():
         # Handle case where the user object is invalid
         return handle_invalid_user()
 
-    # Fetch filter and sorting parameters
+    filters, sort_options, pagination = read_character_list_args()
+
+    # One page of the filtered, sorted list plus the total count
+    characters_query = data_manager().get_character_page(
+        user.id, filters, sort_options, pagination["page"], pagination["per_page"])
+
+    return render_template(
+        character_list_template(),
+        user=user,
+        num_characters=characters_query.total,
+        characters_query=characters_query,
+        **filters,
+        **sort_options
+    )
+
+
+def read_character_list_args():
+    """
+    Reads the filter, sorting and pagination parameters of the character list.
+
+    Returns:
+    tuple: (filters, sort_options, pagination) dictionaries.
+    """
     filters = {
         "search_query": request.args.get('search', '', type=str).lower(),
         "house_filter": request.args.get('house', '', type=str),
@@ -73,57 +95,12 @@ def my_character_list():
         "page": request.args.get('page', 1, type=int),
         "per_page": 5,
     }
+    return filters, sort_options, pagination
 
-    # Build query
-    query = build_character_query(user.id, filters, sort_options)
-
-    # Pagination logic
-    num_characters = query.count()
-    characters_query = query.paginate(page=pagination["page"], per_page=pagination["per_page"])
-
-    # Determine if the request is AJAX for partial rendering
-    template = (
-        'partials/manage_character_content.html'
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest'
-        else 'character_list.html'
-    )
-
-    return render_template(
-        template,
-        user=user,
-        num_characters=num_characters,
-        characters_query=characters_query,
-        **filters,
-        **sort_options
-    )
-
-
-def build_character_query(user_id, filters, sort_options):
-    """
-    Builds the character query with filters and sorting.
-    """
-    query = Character.query.filter_by(user_id=user_id)
-
-    # Apply filters
-    if filters["search_query"]:
-        query = query.filter(Character.name.ilike(f"%{filters['search_query']}%"))
-    if filters["house_filter"]:
-        query = query.filter(Character.house.has(House.name.ilike(f"%{filters['house_filter']}%")))
-    if filters["role_filter"]:
-        query = query.filter(Character.role.has(Role.name.ilike(f"%{filters["role_filter"]}%")))
-    if filters["strength_filter"]:
-        query = query.filter(Character.strength.has(Strength.name.ilike(f"%{filters["strength_filter"]}%")))
-    if filters["age_more_than"]:
-        query = query.filter(Character.age >= filters["age_more_than"])
-    if filters["age_less_than"]:
-        query = query.filter(Character.age <= filters["age_less_than"])
 
-    # Apply sorting
-    sort_column = sort_options["sort_column"]
-    sort_order = sort_options["sort_order"]
-    if sort_order == 'asc':
-        query = query.order_by(getattr(Character, sort_column).asc())
-    else:
-        query = query.order_by(getattr(Character, sort_column).desc())
+def character_list_template():
+    """Return the partial template for AJAX requests, the full page otherwise."""
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return 'partials/manage_character_content.html'
+    return 'character_list.html'
 
-    return query
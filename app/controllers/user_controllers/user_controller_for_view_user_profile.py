@@ -14,8 +14,8 @@ or the user data is invalid, appropriate redirection or error handling is perfor
 Key Features:
 1. **User Authentication**: Verifies that the user is logged in before
    granting access to their profile. If not, redirects to the login page.
-2. **User Data Fetching**: Retrieves the logged-in user's data from the database
-   and ensures that the profile page displays correct information.
+2. **User Data Fetching**: Retrieves the logged-in user's data through the data
+   manager and ensures that the profile page displays correct information.
 3. **Error Handling**: Provides error handling for invalid users and redirects
    them accordingly.
 4. **Template Integration**: Renders the `view_user_profile.html` template
@@ -24,11 +24,10 @@ Key Features:
    is not logged in or if their user data is invalid.
 
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 from flask import render_template
-from app.models import User
 from app.controllers.common_fun import (user_logged_in,
                                         handle_invalid_user,
                                         handle_not_logged_in
@@ -59,6 +58,4 @@ def user_profile():
         # Handle case where user is not valid
         return handle_invalid_user()
 
-    user_id = User.query.get(user.id)
-
-    return render_template('view_user_profile.html', user=user_id)
+    return render_template('view_user_profile.html', user=user)
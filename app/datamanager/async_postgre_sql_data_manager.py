@@ -0,0 +1,518 @@
+"""=============================================================================
+Project: Game Api App
+Developer: Varsha Rana
+File: async_postgre_sql_data_manager.py
+Description: This file implements the `AsyncPostgreSQLDataManager` class, the
+             asyncio counterpart of `PostgreSQLDataManager`. It implements the
+             operations of `DataManagerInterface` as coroutines on SQLAlchemy's
+             asyncio engine (asyncpg for PostgreSQL, aiosqlite for SQLite), so
+             a database call waiting on the network no longer pins a worker
+             thread. Statements are built by `statements.py`, the same builders
+             the synchronous manager uses. Each call runs in its own
+             transaction unless it is made inside `unit_of_work()`, in which
+             case all calls share one transaction that commits once.
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.models import User, House, Role, Strength, Character, Contact
+from app.password_hasher import password_hasher
+from app.datamanager.data_manager_interface import DataManagerInterface
+from app.monitoring.request_timing import record_cache
+from app.monitoring.pool_metrics import _is_sqlite_memory
+from app.datamanager.pagination import Page
+from app.datamanager.sql_dialect import dialect_insert
+from app.datamanager.sqlite_data_manager import apply_sqlite_pragmas, sqlite_pragmas
+from app.datamanager import statements
+from app.datamanager.replica_routing import stick_to_primary
+from app.datamanager.unit_of_work import has_pending_writes
+
+# asyncio driver used for each synchronous database URL scheme
+_ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+# The session of the unit of work running in the current task, if any
+_current_session = ContextVar('async_data_manager_session', default=None)
+
+
+def async_database_url(url):
+    """
+    Turn a synchronous database URL into its asyncio-driver equivalent.
+
+    Example: postgresql://u:p@host/db -> postgresql+asyncpg://u:p@host/db
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if url.drivername in _ASYNC_DRIVERS.values():
+        return url
+    if backend not in _ASYNC_DRIVERS:
+        raise NotImplementedError(f"No asyncio driver configured for '{backend}'.")
+    return url.set(drivername=_ASYNC_DRIVERS[backend])
+
+
+class AsyncPostgreSQLDataManager(DataManagerInterface):
+    """
+    Asyncio data manager: the operations of `DataManagerInterface` as coroutines.
+
+    Attributes:
+        engine (AsyncEngine): The asyncio engine all sessions use.
+    """
+
+    def __init__(self, database_url, engine_options=None, bulk_chunk_size=5000,
+                 stream_batch_size=1000, reports_cache_ttl=60,
+                 reports_estimate_threshold=1_000_000):
+        """
+        Initializes the manager with its own asyncio engine.
+
+        Args:
+            database_url (str): Synchronous or asyncio database URL.
+            engine_options (dict, optional): Extra `create_async_engine` options.
+        """
+        self.engine = create_async_engine(async_database_url(database_url),
+                                          **(engine_options or {}))
+        self.dialect = self.engine.dialect.name
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.bulk_chunk_size = bulk_chunk_size
+        self.stream_batch_size = stream_batch_size
+        self.reports_cache_ttl = reports_cache_ttl
+        self.reports_estimate_threshold = reports_estimate_threshold
+        self._reports_cache = None
+
+    @classmethod
+    def from_app(cls, app):
+        """
+        Build the manager from the app's configuration.
+
+        The engine is pooled with the DB_POOL_* settings. Pooled asyncio
+        connections belong to the event loop that opened them, so build the
+        manager once per long-lived loop and use it only from that loop.
+        """
+        url = app.config.get('ASYNC_DATABASE_URL') or app.config['SQLALCHEMY_DATABASE_URI']
+        options = {}
+        if not _is_sqlite_memory(url):
+            options = {
+                'pool_size': app.config['DB_POOL_SIZE'],
+                'max_overflow': app.config['DB_POOL_MAX_OVERFLOW'],
+                'pool_timeout': app.config['DB_POOL_TIMEOUT'],
+                'pool_recycle': app.config['DB_POOL_RECYCLE'],
+                'pool_pre_ping': app.config['DB_POOL_PRE_PING'],
+            }
+        manager = cls(url, engine_options=options,
+                      bulk_chunk_size=app.config.get('DATA_MANAGER_BULK_CHUNK_SIZE', 5000),
+                      stream_batch_size=app.config.get('DATA_MANAGER_STREAM_BATCH_SIZE', 1000),
+                      reports_cache_ttl=app.config.get('REPORTS_CACHE_TTL', 60),
+                      reports_estimate_threshold=app.config.get('REPORTS_ESTIMATE_THRESHOLD',
+                                                                1_000_000))
+        if manager.dialect == 'sqlite':
+            # Same WAL / busy timeout tuning as the synchronous engine
+            apply_sqlite_pragmas(manager.engine.sync_engine,
+                                 sqlite_pragmas(app.config, manager.engine.url))
+        return manager
+
+    async def dispose(self):
+        """Close every pooled connection of the engine."""
+        await self.engine.dispose()
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """
+        Run the enclosed calls in one transaction that commits once.
+
+        Nested use joins the outer unit of work; an exception rolls it back.
+        A commit that wrote keeps the user's reads on the primary, like the
+        synchronous unit of work.
+        """
+        session = _current_session.get()
+        if session is not None:
+            yield session
+            return
+        async with self.session_factory() as session:
+            async with session.begin():
+                token = _current_session.set(session)
+                try:
+                    yield session
+                finally:
+                    _current_session.reset(token)
+                wrote = has_pending_writes(session.sync_session)
+        if wrote:
+            stick_to_primary()
+
+    async def rollback(self):
+        """Roll back the enclosing unit of work, if any; it then commits nothing."""
+        session = _current_session.get()
+        if session is not None:
+            await session.rollback()
+
+    # Generic helpers
+    async def _get_all(self, model):
+        async with self.unit_of_work() as session:
+            return list(await session.scalars(select(model).order_by(model.id)))
+
+    async def _add(self, instance):
+        async with self.unit_of_work() as session:
+            session.add(instance)
+            await session.flush()
+            return instance
+
+    async def _update(self, model, object_id, updates):
+        async with self.unit_of_work() as session:
+            instance = await session.get(model, object_id)
+            if instance:
+                for key, value in updates.items():
+                    setattr(instance, key, value)
+            return instance
+
+    async def _delete(self, model, object_id):
+        async with self.unit_of_work() as session:
+            instance = await session.get(model, object_id)
+            if instance:
+                await session.delete(instance)
+            return instance
+
+    # Streaming methods
+    async def _iter_model(self, model, batch_size=None, rows=False):
+        """Stream a table in batches of `batch_size`; see `PostgreSQLDataManager`."""
+        batch_size = batch_size or self.stream_batch_size
+        statement = select(*model.__table__.columns) if rows else select(model)
+        statement = statement.order_by(model.id).execution_options(yield_per=batch_size)
+        async with self.unit_of_work() as session:
+            result = await session.stream(statement)
+            if not rows:
+                result = result.scalars()
+            async for item in result:
+                yield item
+
+    def iter_users(self, batch_size=None, rows=False):
+        """Stream all users (an async iterator)."""
+        return self._iter_model(User, batch_size, rows)
+
+    def iter_characters(self, batch_size=None, rows=False):
+        """Stream all characters (an async iterator)."""
+        return self._iter_model(Character, batch_size, rows)
+
+    def iter_contacts(self, batch_size=None, rows=False):
+        """Stream all contacts (an async iterator)."""
+        return self._iter_model(Contact, batch_size, rows)
+
+    # User-related methods
+    async def get_all_users(self):
+        """Retrieve a list of all users."""
+        return await self._get_all(User)
+
+    async def get_user(self, user_id):
+        """Retrieve one user by ID, or None."""
+        async with self.unit_of_work() as session:
+            return await session.get(User, user_id)
+
+    async def get_user_by_email(self, email):
+        """Retrieve the user with this email, or None."""
+        async with self.unit_of_work() as session:
+            return await session.scalar(select(User).where(User.email == email))
+
+    async def email_exists(self, email):
+        """Check for the email with a single-row primary-key lookup."""
+        async with self.unit_of_work() as session:
+            statement = select(User.id).where(User.email == email).limit(1)
+            return (await session.execute(statement)).first() is not None
+
+    async def iter_user_emails(self, batch_size=None):
+        """Stream only the email column, `batch_size` rows per round trip."""
+        statement = select(User.email).execution_options(
+            yield_per=batch_size or self.stream_batch_size)
+        async with self.unit_of_work() as session:
+            async for email in (await session.stream(statement)).scalars():
+                yield email
+
+    async def add_user(self,
+                       user_name,
+                       user_email,
+                       user_password,
+                       date_of_birth,
+                       gender,
+                       profile_picture):
+        """Add a new user; the password is hashed off the event loop."""
+        if len(user_password) < 8:
+            raise ValueError("Password must be at least 8 characters long.")
+        new_user = User(username=user_name,
+                        email=user_email,
+                        date_of_birth=date_of_birth,
+                        gender=gender,
+                        profile_picture=profile_picture,
+                        updated_at=datetime.now())
+        # to_thread copies the context, so the hasher still sees the app
+        new_user.password = await asyncio.to_thread(password_hasher.hash, user_password)
+        return await self._add(new_user)
+
+    async def update_user(self, user_id, updates):
+        """Update an existing user with provided data."""
+        return await self._update(User, user_id, updates)
+
+    async def delete_user(self, user_id):
+        """Delete a user based on their ID."""
+        return await self._delete(User, user_id)
+
+    async def get_user_characters(self, user_id):
+        """Retrieve a list of characters associated with a specific user."""
+        async with self.unit_of_work() as session:
+            return list(await session.scalars(
+                select(Character).where(Character.user_id == user_id).order_by(Character.id)))
+
+    # Character-related methods
+    async def get_all_characters(self):
+        """Retrieve a list of all characters."""
+        return await self._get_all(Character)
+
+    async def add_character(self, character_data):
+        """Add a new character with the provided data."""
+        return await self._add(Character(**character_data))
+
+    async def update_character(self, character_id, updates):
+        """Update an existing character with provided data."""
+        return await self._update(Character, character_id, updates)
+
+    async def delete_character(self, character_id):
+        """Delete a character based on their ID."""
+        return await self._delete(Character, character_id)
+
+    async def get_character(self, character_id):
+        """Retrieve one character by ID, or None."""
+        async with self.unit_of_work() as session:
+            return await session.get(Character, character_id)
+
+    async def character_name_exists(self, user_id, name):
+        """Check the (user_id, name) unique index for an existing character."""
+        statement = (select(Character.id)
+                     .where(Character.user_id == user_id, Character.name == name)
+                     .limit(1))
+        async with self.unit_of_work() as session:
+            return (await session.execute(statement)).first() is not None
+
+    async def update_character_if_version(self, character_id, changes, expected_version):
+        """
+        Write only the changed columns if the version still matches.
+
+        Returns:
+            bool: True if the row was updated, False on a version conflict.
+        """
+        table = Character.__table__
+        async with self.unit_of_work() as session:
+            result = await session.execute(
+                update(table)
+                .where(table.c.id == character_id, table.c.version == expected_version)
+                .values(**changes, version=table.c.version + 1))
+            return result.rowcount == 1
+
+    async def get_character_page(self, user_id, filters, sort_options, page, per_page):
+        """
+        Load one page of a user's filtered, sorted character list.
+
+        House, role and strength are loaded eagerly, since lazy loading is
+        not available once the async session is closed.
+
+        Returns:
+            Page: The characters of the page and the total count.
+        """
+        page = max(page, 1)
+        page_statement, count_statement = statements.character_list_statements(
+            filters, sort_options, eager=True)
+        params = statements.character_list_params(user_id, filters, page, per_page)
+        async with self.unit_of_work() as session:
+            total = await session.scalar(count_statement, params)
+            items = await session.scalars(page_statement, params)
+            return Page(items, total, page, per_page)
+
+    async def add_character_if_absent(self, character_values):
+        """
+        Insert a character unless the user already has one with that name.
+
+        Returns:
+            int: The new character's id, or None if it already existed.
+        """
+        statement = (dialect_insert(Character, self.dialect)
+                     .values(**character_values)
+                     .on_conflict_do_nothing(index_elements=['user_id', 'name'])
+                     .returning(Character.id))
+        async with self.unit_of_work() as session:
+            return (await session.execute(statement)).scalar_one_or_none()
+
+    async def delete_user_character(self, character_id, user_id):
+        """
+        Delete a character only if it belongs to the user.
+
+        Returns:
+            int: The number of characters deleted (0 or 1).
+        """
+        table = Character.__table__
+        async with self.unit_of_work() as session:
+            result = await session.execute(
+                delete(table).where(table.c.id == character_id, table.c.user_id == user_id))
+            return result.rowcount
+
+    # Bulk character methods
+    async def bulk_add_characters(self, characters_data):
+        """Add many characters with multi-row inserts; return the count."""
+        rows = list(characters_data)
+        async with self.unit_of_work() as session:
+            for chunk in statements.chunks(rows, self.bulk_chunk_size):
+                await session.execute(insert(Character.__table__), chunk)
+        return len(rows)
+
+    async def bulk_update_characters(self, changes_by_id):
+        """Apply {character_id: {column: value}} changes; return the rows updated."""
+        updated = 0
+        async with self.unit_of_work() as session:
+            for columns, items in statements.group_changes(changes_by_id).items():
+                for chunk in statements.chunks(items, self.bulk_chunk_size):
+                    if self.dialect == 'postgresql':
+                        result = await session.execute(
+                            statements.update_from_values_statement(columns, chunk))
+                    else:
+                        statement, params = statements.executemany_update(columns, chunk)
+                        result = await session.execute(statement, params)
+                    updated += result.rowcount
+        return updated
+
+    async def bulk_delete_characters(self, character_ids):
+        """Delete characters by id; return the rows deleted."""
+        ids = list(character_ids)
+        table = Character.__table__
+        deleted = 0
+        async with self.unit_of_work() as session:
+            for chunk in statements.chunks(ids, self.bulk_chunk_size):
+                result = await session.execute(delete(table).where(table.c.id.in_(chunk)))
+                deleted += result.rowcount
+        return deleted
+
+    async def _bulk_upsert_names(self, model, names):
+        names = sorted({name for name in names if name})
+        ids = {}
+        async with self.unit_of_work() as session:
+            for chunk in statements.chunks(names, self.bulk_chunk_size):
+                ids.update((await session.execute(statements.name_ids_statement(model, chunk))).all())
+                missing = [name for name in chunk if name not in ids]
+                if missing:
+                    await session.execute(statements.insert_names_statement(model, missing,
+                                                                            self.dialect))
+                    ids.update((await session.execute(
+                        statements.name_ids_statement(model, missing))).all())
+        return ids
+
+    async def bulk_upsert_houses(self, house_names):
+        """Create any missing houses and return {name: id} for all of them."""
+        return await self._bulk_upsert_names(House, house_names)
+
+    async def bulk_upsert_roles(self, role_names):
+        """Create any missing roles and return {name: id} for all of them."""
+        return await self._bulk_upsert_names(Role, role_names)
+
+    async def bulk_upsert_strengths(self, strength_names):
+        """Create any missing strengths and return {name: id} for all of them."""
+        return await self._bulk_upsert_names(Strength, strength_names)
+
+    # House-related methods
+    async def get_all_houses(self):
+        """Retrieve a list of all houses."""
+        return await self._get_all(House)
+
+    async def add_house(self, house_name):
+        """Add a new house with the provided name."""
+        return await self._add(House(name=house_name))
+
+    async def update_house(self, house_id, updates):
+        """Update an existing house with provided data."""
+        return await self._update(House, house_id, updates)
+
+    async def delete_house(self, house_id):
+        """Delete a house based on its ID."""
+        return await self._delete(House, house_id)
+
+    # Role-related methods
+    async def get_all_roles(self):
+        """Retrieve a list of all roles."""
+        return await self._get_all(Role)
+
+    async def add_role(self, role_name):
+        """Add a new role with the provided name."""
+        return await self._add(Role(name=role_name))
+
+    async def update_role(self, role_id, updates):
+        """Update an existing role with provided data."""
+        return await self._update(Role, role_id, updates)
+
+    async def delete_role(self, role_id):
+        """Delete a role based on its ID."""
+        return await self._delete(Role, role_id)
+
+    # Strength-related methods
+    async def get_all_strengths(self):
+        """Retrieve a list of all strengths."""
+        return await self._get_all(Strength)
+
+    async def add_strength(self, strength_name):
+        """Add a new strength with the provided name."""
+        return await self._add(Strength(name=strength_name))
+
+    async def update_strength(self, strength_id, updates):
+        """Update an existing strength with provided data."""
+        return await self._update(Strength, strength_id, updates)
+
+    async def delete_strength(self, strength_id):
+        """Delete a strength based on its ID."""
+        return await self._delete(Strength, strength_id)
+
+    # Contact-related methods
+    async def get_all_contacts(self):
+        """Retrieve a list of all contacts."""
+        return await self._get_all(Contact)
+
+    async def add_contact(self, contact_name, contact_email, contact_message):
+        """Add a new contact with the provided name, email, and message."""
+        return await self._add(Contact(name=contact_name, email=contact_email,
+                                       message=contact_message))
+
+    async def delete_contact(self, contact_id):
+        """Delete a contact based on its ID."""
+        return await self._delete(Contact, contact_id)
+
+    # Report-related methods
+    async def get_reports(self, use_cache=True):
+        """Generate and retrieve reports; see `PostgreSQLDataManager.get_reports`."""
+        now = time.monotonic()
+        hit = use_cache and self._reports_cache and now < self._reports_cache[0]
+        record_cache('reports', bool(hit))
+        if hit:
+            return dict(self._reports_cache[1])
+
+        statement = statements.reports_statement(self.reports_estimate_threshold, self.dialect)
+        async with self.unit_of_work() as session:
+            reports = dict((await session.execute(statement)).one()._mapping)
+        self._reports_cache = (now + self.reports_cache_ttl, reports)
+        return dict(reports)
+
+    async def refresh_daily_rollups(self):
+        """Update the per-day rollups from the latest stored day onwards."""
+        counts = {}
+        async with self.unit_of_work() as session:
+            last_day = await session.scalar(statements.last_rollup_day_statement())
+            for key, statement in statements.rollup_count_statements(last_day):
+                statements.add_rollup_counts(counts, key, await session.execute(statement))
+            if counts:
+                await session.execute(statements.rollup_upsert_statement(counts, self.dialect))
+        return len(counts)
+
+    async def get_daily_rollups(self, days=30):
+        """Return the most recent stored per-day rollups, newest first (read-only)."""
+        async with self.unit_of_work() as session:
+            rows = await session.execute(statements.daily_rollups_statement(days))
+            return [dict(row._mapping) for row in rows]
+
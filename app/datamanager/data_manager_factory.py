@@ -0,0 +1,50 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: data_manager_factory.py
+Description:
+The `data_manager_factory.py` file picks the app's `DataManagerInterface`
+implementation and makes it available to the controllers, so the storage
+engine is a configuration choice instead of a code change.
+
+Key Features:
+1. **Selection**: DATA_MANAGER chooses 'postgresql', 'sqlite' or 'memory';
+   unset, it follows the scheme of DATABASE_URL.
+2. **One Instance per App**: `init_data_manager` stores the manager in
+   `app.extensions['data_manager']`; controllers call `data_manager()`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from flask import current_app
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+from app.datamanager.sqlite_data_manager import SQLiteDataManager, is_sqlite_url
+from app.datamanager.in_memory_data_manager import InMemoryDataManager
+
+DATA_MANAGERS = {
+    'postgresql': PostgreSQLDataManager,
+    'sqlite': SQLiteDataManager,
+    'memory': InMemoryDataManager,
+}
+
+
+def data_manager_name(config):
+    """Return the configured DATA_MANAGER, or the one matching the database URL."""
+    name = config.get('DATA_MANAGER')
+    if name:
+        if name not in DATA_MANAGERS:
+            raise ValueError(f"Unknown DATA_MANAGER '{name}'; "
+                             f"expected one of {', '.join(DATA_MANAGERS)}.")
+        return name
+    return 'sqlite' if is_sqlite_url(config.get('SQLALCHEMY_DATABASE_URI')) else 'postgresql'
+
+
+def init_data_manager(app):
+    """Create the app's data manager; run after `db.init_app(app)`."""
+    app.extensions['data_manager'] = DATA_MANAGERS[data_manager_name(app.config)](app)
+
+
+def data_manager():
+    """Return the current app's data manager."""
+    return current_app.extensions['data_manager']
@@ -12,7 +12,7 @@ Description: This file defines the `DataManagerInterface`, an abstract base clas
              for handling game-related data. The interface promotes modularity
              and flexibility for future enhancements and maintenance.
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 from abc import ABC, abstractmethod
@@ -22,14 +22,71 @@ class DataManagerInterface(ABC):
     """
     An interface for data management operations, including CRUD functionality for users, characters,
     houses, roles, strengths, contacts, and generating reports.
+
+    Controllers reach the app's implementation through
+    `data_manager_factory.data_manager()` and never query the models directly.
+
+    Implementations must not commit: writes join the current transaction,
+    which the unit of work (`app/datamanager/unit_of_work.py`) commits once.
+
+    Backend-specific SQL sits behind the capability flags below; a backend
+    that leaves a flag off gets the portable fallback.
     """
 
+    # Capability flags
+    # Bulk updates as one `UPDATE ... FROM (VALUES ...)` per column group
+    supports_update_from_values = False
+    # Report counts may use planner row estimates instead of COUNT(*)
+    supports_row_estimates = False
+
+    # Transaction methods
+    @abstractmethod
+    def rollback(self):
+        """Discard the writes of the current transaction after a failed write."""
+        pass
+
+    # Streaming methods
+    @abstractmethod
+    def iter_users(self, batch_size=None, rows=False):
+        """Stream all users in batches; `rows=True` yields column tuples."""
+        pass
+
+    @abstractmethod
+    def iter_characters(self, batch_size=None, rows=False):
+        """Stream all characters in batches; `rows=True` yields column tuples."""
+        pass
+
+    @abstractmethod
+    def iter_contacts(self, batch_size=None, rows=False):
+        """Stream all contacts in batches; `rows=True` yields column tuples."""
+        pass
+
     # User-related methods
     @abstractmethod
     def get_all_users(self):
         """Retrieve a list of all users."""
         pass
 
+    @abstractmethod
+    def get_user(self, user_id):
+        """Retrieve one user by ID, or None."""
+        pass
+
+    @abstractmethod
+    def get_user_by_email(self, email):
+        """Retrieve the user with this email, or None."""
+        pass
+
+    @abstractmethod
+    def email_exists(self, email):
+        """Check whether a user with this email exists."""
+        pass
+
+    @abstractmethod
+    def iter_user_emails(self, batch_size=None):
+        """Stream every stored user email."""
+        pass
+
     @abstractmethod
     def add_user(self,
                  user_name,
@@ -38,7 +95,7 @@ class DataManagerInterface(ABC):
                  date_of_birth,
                  gender,
                  profile_picture):
-        """Add a new user with optional ."""
+        """Add a new user and return it; the password is hashed here."""
         pass
 
     @abstractmethod
@@ -62,21 +119,91 @@ class DataManagerInterface(ABC):
         """Retrieve a list of all characters."""
         pass
 
+    @abstractmethod
+    def get_character(self, character_id):
+        """Retrieve one character by ID, or None."""
+        pass
+
+    @abstractmethod
+    def character_name_exists(self, user_id, name):
+        """Check whether the user already has a character with this name."""
+        pass
+
+    @abstractmethod
+    def get_character_page(self, user_id, filters, sort_options, page, per_page):
+        """
+        Retrieve one page of a user's character list, filtered and sorted as
+        by `statements.character_list_statements`; returns a Pagination.
+        """
+        pass
+
     @abstractmethod
     def add_character(self, character_data):
         """Add a new character with the provided data."""
         pass
 
+    @abstractmethod
+    def add_character_if_absent(self, character_values):
+        """
+        Add a character unless the user already has one with that name;
+        return the new id, or None if the (user_id, name) pair was taken.
+        """
+        pass
+
     @abstractmethod
     def update_character(self, character_id, updates):
         """Update an existing character with provided data."""
         pass
 
+    @abstractmethod
+    def update_character_if_version(self, character_id, changes, expected_version):
+        """
+        Apply `changes` and bump the version only if the character is still at
+        `expected_version` (optimistic locking); return True if it was updated.
+        """
+        pass
+
     @abstractmethod
     def delete_character(self, character_id):
         """Delete a character based on their ID."""
         pass
 
+    @abstractmethod
+    def delete_user_character(self, character_id, user_id):
+        """Delete a character only if it belongs to the user; return the rows deleted."""
+        pass
+
+    # Bulk character methods
+    @abstractmethod
+    def bulk_add_characters(self, characters_data):
+        """Add many characters (an iterable of column-value dicts); return the count."""
+        pass
+
+    @abstractmethod
+    def bulk_update_characters(self, changes_by_id):
+        """Apply {character_id: {column: value}} changes; return the rows updated."""
+        pass
+
+    @abstractmethod
+    def bulk_delete_characters(self, character_ids):
+        """Delete characters by id; return the rows deleted."""
+        pass
+
+    @abstractmethod
+    def bulk_upsert_houses(self, house_names):
+        """Create missing houses and return {name: id} for all given names."""
+        pass
+
+    @abstractmethod
+    def bulk_upsert_roles(self, role_names):
+        """Create missing roles and return {name: id} for all given names."""
+        pass
+
+    @abstractmethod
+    def bulk_upsert_strengths(self, strength_names):
+        """Create missing strengths and return {name: id} for all given names."""
+        pass
+
     # House-related methods
     @abstractmethod
     def get_all_houses(self):
@@ -158,6 +285,25 @@ class DataManagerInterface(ABC):
 
     # Report-related methods
     @abstractmethod
-    def get_reports(self):
+    def get_reports(self, use_cache=True):
         """Generate and retrieve reports with relevant data."""
         pass
+
+    @abstractmethod
+    def refresh_daily_rollups(self):
+        """
+        Update the per-day signup and character-creation rollups.
+
+        This writes (upserts) and belongs in a write path or a maintenance
+        job, never in a read-only request; `flask refresh-rollups` runs it.
+        """
+        pass
+
+    @abstractmethod
+    def get_daily_rollups(self, days=30):
+        """
+        Retrieve the most recent stored per-day rollups, newest first.
+
+        Read-only; call `refresh_daily_rollups` first to bring them up to date.
+        """
+        pass
@@ -0,0 +1,558 @@
+"""=============================================================================
+Project: Game Api App
+Developer: Varsha Rana
+File: in_memory_data_manager.py
+Description: This file implements the `InMemoryDataManager` class, a
+             `DataManagerInterface` implementation that keeps every row in
+             process memory. It exists to measure the web layer (routing,
+             controllers, Jinja rendering) with the database cost at zero:
+             run the app with DATA_MANAGER=memory and benchmark it with
+             `app/benchmarks/bench_web_layer.py`. Rows are the usual model
+             instances (never added to a session), so templates render exactly
+             as they do with a database. Lookups go through dict indexes
+             (by id, email, name and (user, name)); each user's character ids
+             and the created_at timestamps are kept in sorted lists, so
+             ordered scans and per-day rollups use bisect instead of sorting.
+             Nothing is persisted and there are no transactions: writes are
+             visible immediately and survive a rollback.
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import itertools
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from app.models import User, House, Role, Strength, Character, Contact
+from app.datamanager.data_manager_interface import DataManagerInterface
+from app.monitoring.request_timing import record_cache
+from app.datamanager.pagination import Page
+
+# Lookup tables and the Character relationship pointing at each of them
+_LOOKUPS = {House: 'house', Role: 'role', Strength: 'strength'}
+
+
+def _contains(value, needle):
+    """Case-insensitive substring match, like `ILIKE '%needle%'`."""
+    return value is not None and needle.lower() in value.lower()
+
+
+class InMemoryDataManager(DataManagerInterface):
+    """
+    Data manager storing model instances in dicts, for benchmarks and tests.
+
+    Thread-safe for the multi-threaded development server: every method
+    holds one lock while it touches the indexes.
+    """
+
+    def __init__(self, app=None):
+        """
+        Initializes empty tables and indexes.
+
+        Args:
+            app (Flask, optional): Only read for the stream batch size and
+                report settings, like the other managers.
+        """
+        config = app.config if app is not None else {}
+        self.stream_batch_size = config.get('DATA_MANAGER_STREAM_BATCH_SIZE', 1000)
+        self.reports_cache_ttl = config.get('REPORTS_CACHE_TTL', 60)
+        self._reports_cache = None
+        self._lock = threading.RLock()
+        # Primary-key indexes and id sequences
+        self._rows = {model: {} for model in (User, House, Role, Strength, Character, Contact)}
+        self._ids = {model: itertools.count(1) for model in self._rows}
+        # Unique-column indexes
+        self._users_by_email = {}
+        self._names = {model: {} for model in _LOOKUPS}
+        self._characters_by_user_name = {}
+        # Sorted-list indexes: character ids per user, (created_at, id) per table
+        self._user_character_ids = {}
+        self._created = {User: [], Character: []}
+        # Per-day rollups: {day: {'signups': n, 'characters_created': n}}
+        self._rollups = {}
+
+    # Index maintenance
+    def _insert(self, model, instance):
+        if instance.id is None:
+            instance.id = next(self._ids[model])
+        if model in self._created:
+            if getattr(instance, 'created_at', None) is None:
+                instance.created_at = datetime.now()
+            insort(self._created[model], (instance.created_at, instance.id))
+        self._rows[model][instance.id] = instance
+        return instance
+
+    def _remove(self, model, instance):
+        del self._rows[model][instance.id]
+        if model in self._created:
+            created = self._created[model]
+            del created[bisect_left(created, (instance.created_at, instance.id))]
+
+    def _check_unique(self, user_id, name):
+        """Enforce the (user_id, name) unique constraint; NULL owners never clash."""
+        if user_id is not None and (user_id, name) in self._characters_by_user_name:
+            raise ValueError(f"Character '{name}' already exists for this user.")
+
+    def _link_character(self, character):
+        """Attach a character's relationships and add it to the indexes."""
+        if character.user_id is not None:
+            self._characters_by_user_name[(character.user_id, character.name)] = character
+            insort(self._user_character_ids.setdefault(character.user_id, []), character.id)
+        self._set_relationships(character)
+
+    def _unlink_character(self, character):
+        if self._characters_by_user_name.get((character.user_id, character.name)) is character:
+            del self._characters_by_user_name[(character.user_id, character.name)]
+        ids = self._user_character_ids.get(character.user_id, [])
+        position = bisect_left(ids, character.id)
+        if position < len(ids) and ids[position] == character.id:
+            del ids[position]
+
+    def _set_relationships(self, character):
+        for model, name in _LOOKUPS.items():
+            setattr(character, name, self._rows[model].get(getattr(character, f'{name}_id')))
+        character.user = self._rows[User].get(character.user_id)
+
+    def _new_character(self, values):
+        character = Character(**values)
+        self._check_unique(character.user_id, character.name)
+        if character.version is None:
+            character.version = 1
+        self._insert(Character, character)
+        self._link_character(character)
+        return character
+
+    def _update_character(self, character, updates):
+        user_id = updates.get('user_id', character.user_id)
+        name = updates.get('name', character.name)
+        if (user_id, name) != (character.user_id, character.name):
+            self._check_unique(user_id, name)
+        self._unlink_character(character)
+        for key, value in updates.items():
+            setattr(character, key, value)
+        character.version = (character.version or 0) + 1
+        character.updated_at = datetime.now()
+        self._link_character(character)
+
+    def _characters_of(self, user_id):
+        characters = self._rows[Character]
+        return [characters[character_id]
+                for character_id in self._user_character_ids.get(user_id, [])]
+
+    def _update_named(self, model, object_id, updates):
+        instance = self._rows[model].get(object_id)
+        if instance:
+            names = self._names.get(model)
+            if names is not None:
+                names.pop(instance.name, None)
+            for key, value in updates.items():
+                setattr(instance, key, value)
+            if names is not None:
+                names[instance.name] = instance
+        return instance
+
+    def _delete_lookup(self, model, object_id):
+        """Delete a house/role/strength; its characters keep a NULL reference."""
+        instance = self._rows[model].get(object_id)
+        if instance:
+            name = _LOOKUPS[model]
+            for character in self._rows[Character].values():
+                if getattr(character, f'{name}_id') == object_id:
+                    setattr(character, f'{name}_id', None)
+                    setattr(character, name, None)
+            self._names[model].pop(instance.name, None)
+            self._remove(model, instance)
+        return instance
+
+    def _add_lookup(self, model, name):
+        instance = self._names[model].get(name)
+        if instance is None:
+            instance = self._insert(model, model(name=name))
+            self._names[model][name] = instance
+        return instance
+
+    # Transaction methods
+    def rollback(self):
+        """Nothing to undo: writes are applied immediately."""
+
+    # Streaming methods
+    def _iter_model(self, model, batch_size=None, rows=False):
+        """Yield the model's rows in primary-key order, copying one batch at a time."""
+        batch_size = batch_size or self.stream_batch_size
+        columns = [column.key for column in model.__table__.columns]
+        with self._lock:
+            ids = sorted(self._rows[model])
+        for start in range(0, len(ids), batch_size):
+            with self._lock:
+                batch = [self._rows[model][object_id] for object_id in ids[start:start + batch_size]
+                         if object_id in self._rows[model]]
+            for instance in batch:
+                yield tuple(getattr(instance, name) for name in columns) if rows else instance
+
+    def iter_users(self, batch_size=None, rows=False):
+        """Stream all users; see `_iter_model`."""
+        return self._iter_model(User, batch_size, rows)
+
+    def iter_characters(self, batch_size=None, rows=False):
+        """Stream all characters; see `_iter_model`."""
+        return self._iter_model(Character, batch_size, rows)
+
+    def iter_contacts(self, batch_size=None, rows=False):
+        """Stream all contacts; see `_iter_model`."""
+        return self._iter_model(Contact, batch_size, rows)
+
+    # User-related methods
+    def get_all_users(self):
+        """Retrieve a list of all users."""
+        with self._lock:
+            return list(self._rows[User].values())
+
+    def get_user(self, user_id):
+        """Retrieve one user by ID, or None."""
+        with self._lock:
+            return self._rows[User].get(user_id)
+
+    def get_user_by_email(self, email):
+        """Retrieve the user with this email, or None."""
+        with self._lock:
+            return self._users_by_email.get(email)
+
+    def email_exists(self, email):
+        """Check the email index."""
+        with self._lock:
+            return email in self._users_by_email
+
+    def iter_user_emails(self, batch_size=None):
+        """Yield every stored email from a snapshot of the email index."""
+        with self._lock:
+            emails = list(self._users_by_email)
+        yield from emails
+
+    def add_user(self,
+                 user_name,
+                 user_email,
+                 user_password,
+                 date_of_birth,
+                 gender,
+                 profile_picture):
+        """Add a new user; the password is hashed like in the other managers."""
+        new_user = User(username=user_name,
+                        email=user_email,
+                        date_of_birth=date_of_birth,
+                        gender=gender,
+                        profile_picture=profile_picture,
+                        updated_at=datetime.now())
+        new_user.set_password(user_password)
+        with self._lock:
+            if user_email in self._users_by_email:
+                raise ValueError(f"A user with email '{user_email}' already exists.")
+            self._insert(User, new_user)
+            self._users_by_email[user_email] = new_user
+        return new_user
+
+    def update_user(self, user_id, updates):
+        """Update an existing user with provided data."""
+        with self._lock:
+            user = self._rows[User].get(user_id)
+            if user:
+                self._users_by_email.pop(user.email, None)
+                for key, value in updates.items():
+                    setattr(user, key, value)
+                self._users_by_email[user.email] = user
+            return user
+
+    def delete_user(self, user_id):
+        """Delete a user; their characters are kept without an owner."""
+        with self._lock:
+            user = self._rows[User].get(user_id)
+            if user:
+                for character in self._characters_of(user_id):
+                    self._unlink_character(character)
+                    character.user_id = None
+                    self._link_character(character)
+                self._user_character_ids.pop(user_id, None)
+                self._users_by_email.pop(user.email, None)
+                self._remove(User, user)
+            return user
+
+    def get_user_characters(self, user_id):
+        """Retrieve a list of characters associated with a specific user."""
+        with self._lock:
+            return self._characters_of(user_id)
+
+    # Character-related methods
+    def get_all_characters(self):
+        """Retrieve a list of all characters."""
+        with self._lock:
+            return list(self._rows[Character].values())
+
+    def add_character(self, character_data):
+        """Add a new character with the provided data."""
+        with self._lock:
+            return self._new_character(character_data)
+
+    def update_character(self, character_id, updates):
+        """Update an existing character with provided data."""
+        with self._lock:
+            character = self._rows[Character].get(character_id)
+            if character:
+                self._update_character(character, updates)
+            return character
+
+    def delete_character(self, character_id):
+        """Delete a character based on their ID."""
+        with self._lock:
+            character = self._rows[Character].get(character_id)
+            if character:
+                self._unlink_character(character)
+                self._remove(Character, character)
+            return character
+
+    def get_character(self, character_id):
+        """Retrieve one character by ID, or None."""
+        with self._lock:
+            return self._rows[Character].get(character_id)
+
+    def character_name_exists(self, user_id, name):
+        """Check the (user_id, name) index."""
+        with self._lock:
+            return (user_id, name) in self._characters_by_user_name
+
+    def add_character_if_absent(self, character_values):
+        """Add a character unless its (user_id, name) is taken; return the id or None."""
+        with self._lock:
+            if (character_values.get('user_id'), character_values.get('name')) \
+                    in self._characters_by_user_name:
+                return None
+            return self._new_character(character_values).id
+
+    def update_character_if_version(self, character_id, changes, expected_version):
+        """Update the character only if it is still at `expected_version`."""
+        with self._lock:
+            character = self._rows[Character].get(character_id)
+            if character is None or character.version != expected_version:
+                return False
+            self._update_character(character, changes)
+            return True
+
+    def delete_user_character(self, character_id, user_id):
+        """Delete a character only if it belongs to the user; return the rows deleted."""
+        with self._lock:
+            character = self._rows[Character].get(character_id)
+            if character is None or character.user_id != user_id:
+                return 0
+            self._unlink_character(character)
+            self._remove(Character, character)
+            return 1
+
+    def get_character_page(self, user_id, filters, sort_options, page, per_page):
+        """
+        Load one page of a user's filtered, sorted character list.
+
+        Matches the SQL of `statements.character_list_statements`, with PostgreSQL's
+        NULL ordering (last when ascending, first when descending).
+
+        Returns:
+            Page: The characters of the page and the total count.
+        """
+        with self._lock:
+            characters = [character for character in self._characters_of(user_id)
+                          if self._matches(character, filters)]
+        column = sort_options["sort_column"]
+        if column not in Character.__table__.columns.keys():
+            raise AttributeError(f"Character has no column '{column}'.")
+        descending = sort_options["sort_order"] != 'asc'
+        present = [c for c in characters if getattr(c, column) is not None]
+        missing = [c for c in characters if getattr(c, column) is None]
+        present.sort(key=lambda character: getattr(character, column), reverse=descending)
+        ordered = missing + present if descending else present + missing
+
+        page = max(page, 1)
+        start = (page - 1) * per_page
+        return Page(ordered[start:start + per_page], len(ordered), page, per_page)
+
+    @staticmethod
+    def _matches(character, filters):
+        if filters["search_query"] and not _contains(character.name, filters["search_query"]):
+            return False
+        for name in ('house', 'role', 'strength'):
+            needle = filters[f"{name}_filter"]
+            related = getattr(character, name)
+            if needle and (related is None or not _contains(related.name, needle)):
+                return False
+        if filters["age_more_than"] and (character.age is None
+                                         or character.age < filters["age_more_than"]):
+            return False
+        if filters["age_less_than"] and (character.age is None
+                                         or character.age > filters["age_less_than"]):
+            return False
+        return True
+
+    # Bulk character methods
+    def bulk_add_characters(self, characters_data):
+        """Add many characters; return the number added."""
+        rows = list(characters_data)
+        with self._lock:
+            for values in rows:
+                self._new_character(values)
+        return len(rows)
+
+    def bulk_update_characters(self, changes_by_id):
+        """Apply {character_id: {column: value}} changes; return the rows updated."""
+        updated = 0
+        with self._lock:
+            for character_id, changes in changes_by_id.items():
+                character = self._rows[Character].get(character_id)
+                if character and changes:
+                    self._update_character(character, changes)
+                    updated += 1
+        return updated
+
+    def bulk_delete_characters(self, character_ids):
+        """Delete many characters by id; return the number deleted."""
+        return sum(1 for character_id in set(character_ids)
+                   if self.delete_character(character_id) is not None)
+
+    def _bulk_upsert_names(self, model, names):
+        with self._lock:
+            return {name: self._add_lookup(model, name).id
+                    for name in sorted({name for name in names if name})}
+
+    def bulk_upsert_houses(self, house_names):
+        """Create any missing houses and return {name: id} for all of them."""
+        return self._bulk_upsert_names(House, house_names)
+
+    def bulk_upsert_roles(self, role_names):
+        """Create any missing roles and return {name: id} for all of them."""
+        return self._bulk_upsert_names(Role, role_names)
+
+    def bulk_upsert_strengths(self, strength_names):
+        """Create any missing strengths and return {name: id} for all of them."""
+        return self._bulk_upsert_names(Strength, strength_names)
+
+    # House-related methods
+    def get_all_houses(self):
+        """Retrieve a list of all houses."""
+        with self._lock:
+            return list(self._rows[House].values())
+
+    def add_house(self, house_name):
+        """Add a new house with the provided name."""
+        with self._lock:
+            return self._add_lookup(House, house_name)
+
+    def update_house(self, house_id, updates):
+        """Update an existing house with provided data."""
+        with self._lock:
+            return self._update_named(House, house_id, updates)
+
+    def delete_house(self, house_id):
+        """Delete a house based on its ID."""
+        with self._lock:
+            return self._delete_lookup(House, house_id)
+
+    # Role-related methods
+    def get_all_roles(self):
+        """Retrieve a list of all roles."""
+        with self._lock:
+            return list(self._rows[Role].values())
+
+    def add_role(self, role_name):
+        """Add a new role with the provided name."""
+        with self._lock:
+            return self._add_lookup(Role, role_name)
+
+    def update_role(self, role_id, updates):
+        """Update an existing role with provided data."""
+        with self._lock:
+            return self._update_named(Role, role_id, updates)
+
+    def delete_role(self, role_id):
+        """Delete a role based on its ID."""
+        with self._lock:
+            return self._delete_lookup(Role, role_id)
+
+    # Strength-related methods
+    def get_all_strengths(self):
+        """Retrieve a list of all strengths."""
+        with self._lock:
+            return list(self._rows[Strength].values())
+
+    def add_strength(self, strength_name):
+        """Add a new strength with the provided name."""
+        with self._lock:
+            return self._add_lookup(Strength, strength_name)
+
+    def update_strength(self, strength_id, updates):
+        """Update an existing strength with provided data."""
+        with self._lock:
+            return self._update_named(Strength, strength_id, updates)
+
+    def delete_strength(self, strength_id):
+        """Delete a strength based on its ID."""
+        with self._lock:
+            return self._delete_lookup(Strength, strength_id)
+
+    # Contact-related methods
+    def get_all_contacts(self):
+        """Retrieve a list of all contacts."""
+        with self._lock:
+            return list(self._rows[Contact].values())
+
+    def add_contact(self, contact_name, contact_email, contact_message):
+        """Add a new contact with the provided name, email, and message."""
+        contact = Contact(name=contact_name, email=contact_email, message=contact_message,
+                          created_at=datetime.now())
+        with self._lock:
+            return self._insert(Contact, contact)
+
+    def delete_contact(self, contact_id):
+        """Delete a contact based on its ID."""
+        with self._lock:
+            contact = self._rows[Contact].get(contact_id)
+            if contact:
+                self._remove(Contact, contact)
+            return contact
+
+    # Report-related methods
+    def get_reports(self, use_cache=True):
+        """Return user_count, character_count and house_count (exact, cached like the others)."""
+        now = time.monotonic()
+        hit = use_cache and self._reports_cache and now < self._reports_cache[0]
+        record_cache('reports', bool(hit))
+        if hit:
+            return dict(self._reports_cache[1])
+        with self._lock:
+            reports = {'user_count': len(self._rows[User]),
+                       'character_count': len(self._rows[Character]),
+                       'house_count': len(self._rows[House])}
+        self._reports_cache = (now + self.reports_cache_ttl, reports)
+        return dict(reports)
+
+    def refresh_daily_rollups(self):
+        """
+        Recount the days from the latest stored day onwards.
+
+        Returns:
+            int: The number of days written.
+        """
+        with self._lock:
+            last_day = max(self._rollups, default=None)
+            start = (datetime.min if last_day is None
+                     else datetime.combine(last_day, datetime.min.time()))
+            counts = {}
+            for model, key in ((User, 'signups'), (Character, 'characters_created')):
+                created = self._created[model]
+                for created_at, _ in created[bisect_left(created, (start,)):]:
+                    day_counts = counts.setdefault(created_at.date(),
+                                                   {'signups': 0, 'characters_created': 0})
+                    day_counts[key] += 1
+            self._rollups.update(counts)
+            return len(counts)
+
+    def get_daily_rollups(self, days=30):
+        """Return the most recent stored per-day rollups, newest first (read-only)."""
+        with self._lock:
+            newest = sorted(self._rollups, reverse=True)[:days]
+            return [{'day': day, **self._rollups[day]} for day in newest]
@@ -0,0 +1,35 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: pagination.py
+Description:
+The `pagination.py` file provides `Page`, a pagination object for data
+managers that load a page of items themselves (async or in-memory) instead of
+handing a query to Flask-SQLAlchemy's `paginate()`.
+
+Key Features:
+1. **Template Compatible**: `Page` is a Flask-SQLAlchemy `Pagination`, so
+   templates keep using `items`, `pages`, `has_next`, `iter_pages()` etc.
+2. **Precomputed**: The items and the total are passed in; building a page
+   runs no query.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from flask_sqlalchemy.pagination import Pagination
+
+
+class Page(Pagination):
+    """One page of already-loaded items plus the total item count."""
+
+    def __init__(self, items, total, page, per_page):
+        self._page_items = list(items)
+        self._total = total
+        super().__init__(page=page, per_page=per_page, error_out=False)
+
+    def _query_items(self):
+        return self._page_items
+
+    def _query_count(self):
+        return self._total
@@ -12,15 +12,27 @@ Description: This file implements the `PostgreSQLDataManager` class, which adher
              retrieval. The configuration is dynamically loaded from environment
              variables to ensure security and adaptability across different
              environments. This class ensures a seamless connection between
-             the application logic and database operations.
+             the application logic and database operations. Transactions
+             are owned by the unit of work in `unit_of_work.py`, so methods
+             here never commit on their own. Read-only methods
+             (get_all_*, iter_*, get_reports) may be served by the read
+             replica; see `replica_routing.py`. The bulk_* methods write many
+             rows per statement (executemany inserts, chunked deletes and
+             `UPDATE ... FROM (VALUES ...)`) for imports and admin jobs.
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 ============================================================================="""
 
 import os
+import time
 from dotenv import load_dotenv
+from sqlalchemy import delete, insert, select, update
 from app.models import db, User, House, Role, Strength, Character, Contact
 from app.datamanager.data_manager_interface import DataManagerInterface
+from app.monitoring.request_timing import record_cache
+from app.datamanager.pagination import Page
+from app.datamanager.sql_dialect import dialect_insert, dialect_name
+from app.datamanager import statements
 
 load_dotenv()
 
@@ -29,10 +41,17 @@ class PostgreSQLDataManager(DataManagerInterface):
     """
     Data Manager class to handle database operations with PostgreSQL using SQLAlchemy.
 
+    Methods never commit on their own: they add, flush or delete inside the
+    current transaction, and the request-scoped unit of work (or the
+    `unit_of_work()` context manager outside requests) commits once.
+
     Attributes:
         db (SQLAlchemy): The SQLAlchemy instance to interact with the PostgreSQL database.
     """
 
+    supports_update_from_values = True
+    supports_row_estimates = True
+
     def __init__(self, app):
         """
         Initializes the PostgreSQLDataManager with a Flask app and configures the database.
@@ -40,15 +59,86 @@ class PostgreSQLDataManager(DataManagerInterface):
         Args:
             app (Flask): The Flask application instance.
         """
-        app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
-        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        db.init_app(app)
+        # Reuse the database already set up by create_app, if any
+        if 'sqlalchemy' not in app.extensions:
+            app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL")
+            app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+            db.init_app(app)
         self.db = db
+        # Rows per statement for the bulk_* methods
+        self.bulk_chunk_size = app.config.get('DATA_MANAGER_BULK_CHUNK_SIZE', 5000)
+        # Rows fetched per round trip by the iter_* methods
+        self.stream_batch_size = app.config.get('DATA_MANAGER_STREAM_BATCH_SIZE', 1000)
+        # get_reports settings and its (expires_at, reports) cache entry
+        self.reports_cache_ttl = app.config.get('REPORTS_CACHE_TTL', 60)
+        self.reports_estimate_threshold = app.config.get('REPORTS_ESTIMATE_THRESHOLD', 1_000_000)
+        self._reports_cache = None
+
+    # Transaction methods
+    def rollback(self):
+        """Roll back the request's transaction."""
+        self.db.session.rollback()
+
+    # Streaming methods
+    def _iter_model(self, model, batch_size=None, rows=False):
+        """
+        Stream a table through a server-side cursor, `batch_size` rows at a time.
+
+        Args:
+            model: The mapped model class to read.
+            batch_size (int, optional): Rows per fetch; defaults to
+                DATA_MANAGER_STREAM_BATCH_SIZE.
+            rows (bool): Yield lightweight column tuples instead of ORM objects.
+
+        Yields:
+            The model instances (or Row tuples), ordered by primary key.
+        """
+        batch_size = batch_size or self.stream_batch_size
+        if rows:
+            statement = select(*model.__table__.columns)
+        else:
+            statement = select(model)
+        # yield_per implies stream_results, so only one batch is held in memory
+        statement = statement.order_by(model.id).execution_options(yield_per=batch_size,
+                                                                   read_replica=True)
+        result = self.db.session.execute(statement)
+        yield from result if rows else result.scalars()
+
+    def iter_users(self, batch_size=None, rows=False):
+        """Stream all users; see `_iter_model`."""
+        return self._iter_model(User, batch_size, rows)
+
+    def iter_characters(self, batch_size=None, rows=False):
+        """Stream all characters; see `_iter_model`."""
+        return self._iter_model(Character, batch_size, rows)
+
+    def iter_contacts(self, batch_size=None, rows=False):
+        """Stream all contacts; see `_iter_model`."""
+        return self._iter_model(Contact, batch_size, rows)
 
     # User-related methods
     def get_all_users(self):
-        """Retrieve a list of all users."""
-        return User.query.all()
+        """Retrieve a list of all users (use `iter_users` for large tables)."""
+        return User.query.execution_options(read_replica=True).all()
+
+    def get_user(self, user_id):
+        """Retrieve one user by ID, or None."""
+        return self.db.session.get(User, user_id)
+
+    def get_user_by_email(self, email):
+        """Retrieve the user with this email, or None."""
+        return User.query.filter_by(email=email).first()
+
+    def email_exists(self, email):
+        """Check for the email with a single-row primary-key lookup."""
+        statement = select(User.id).where(User.email == email).limit(1)
+        return self.db.session.execute(statement).first() is not None
+
+    def iter_user_emails(self, batch_size=None):
+        """Stream only the email column, `batch_size` rows per round trip."""
+        statement = select(User.email).execution_options(
+            yield_per=batch_size or self.stream_batch_size)
+        return self.db.session.execute(statement).scalars()
 
     def add_user(self,
                  user_name,
@@ -75,22 +165,24 @@ class PostgreSQLDataManager(DataManagerInterface):
         )
         new_user.set_password(user_password)
         self.db.session.add(new_user)
-        self.db.session.commit()
+        # Flush so a duplicate email raises IntegrityError here
+        self.db.session.flush()
+        return new_user
 
     def update_user(self, user_id, updates):
-        """Update an existing user with provided data."""
-        user = User.query.get(user_id)
+        """Update an existing user with provided data and return it."""
+        user = self.db.session.get(User, user_id)
         if user:
             for key, value in updates.items():
                 setattr(user, key, value)
-            self.db.session.commit()
+            self.db.session.flush()
+        return user
 
     def delete_user(self, user_id):
         """Delete a user based on their ID."""
         user = User.query.get(user_id)
         if user:
             self.db.session.delete(user)
-            self.db.session.commit()
 
     def get_user_characters(self, user_id):
         """Retrieve a list of characters associated with a specific user."""
@@ -98,14 +190,67 @@ class PostgreSQLDataManager(DataManagerInterface):
 
     # Character-related methods
     def get_all_characters(self):
-        """Retrieve a list of all characters."""
-        return Character.query.all()
+        """Retrieve a list of all characters (use `iter_characters` for large tables)."""
+        return Character.query.execution_options(read_replica=True).all()
+
+    def get_character(self, character_id):
+        """Retrieve one character by ID, or None."""
+        return self.db.session.get(Character, character_id)
+
+    def character_name_exists(self, user_id, name):
+        """Check the (user_id, name) unique index for an existing character."""
+        statement = (select(Character.id)
+                     .where(Character.user_id == user_id, Character.name == name)
+                     .limit(1))
+        return self.db.session.execute(statement).first() is not None
+
+    def get_character_page(self, user_id, filters, sort_options, page, per_page):
+        """
+        Retrieve one page of a user's filtered, sorted character list.
+
+        Runs the prebuilt statements of the filters' shape (see
+        `statements.character_list_statements`) with bound values. The list
+        is read-only, so it may be served by the read replica. House, role
+        and strength come with the characters, so listing them costs no
+        query per row.
+
+        Returns:
+            Page: The characters of the page; `total` is the full count.
+        """
+        page = max(page, 1)
+        page_statement, count_statement = statements.character_list_statements(
+            filters, sort_options, eager=True)
+        params = statements.character_list_params(user_id, filters, page, per_page)
+        options = {'read_replica': True}
+        total = self.db.session.execute(count_statement, params,
+                                        execution_options=options).scalar_one()
+        items = self.db.session.execute(page_statement, params,
+                                        execution_options=options).scalars().all()
+        return Page(items, total, page, per_page)
 
     def add_character(self, character_data):
-        """Add a new character with the provided data."""
+        """Add a new character with the provided data and return it."""
         new_character = Character(**character_data)
         self.db.session.add(new_character)
-        self.db.session.commit()
+        self.db.session.flush()
+        return new_character
+
+    def add_character_if_absent(self, character_values):
+        """
+        Insert a character in a single roundtrip unless the user already has
+        a character with the same name.
+
+        Runs `INSERT ... ON CONFLICT (user_id, name) DO NOTHING RETURNING id`,
+        so concurrent submits of the same name cannot both succeed.
+
+        Returns:
+            int: The new character's id, or None if it already existed.
+        """
+        statement = (dialect_insert(Character)
+                     .values(**character_values)
+                     .on_conflict_do_nothing(index_elements=['user_id', 'name'])
+                     .returning(Character.id))
+        return self.db.session.execute(statement).scalar_one_or_none()
 
     def update_character(self, character_id, updates):
         """Update an existing character with provided data."""
@@ -113,25 +258,141 @@ class PostgreSQLDataManager(DataManagerInterface):
         if character:
             for key, value in updates.items():
                 setattr(character, key, value)
-            self.db.session.commit()
+
+    def update_character_if_version(self, character_id, changes, expected_version):
+        """
+        Write only the changed columns, guarded by optimistic locking.
+
+        Runs `UPDATE character SET ..., version = version + 1
+        WHERE id = :id AND version = :v`, so an edit based on a stale version
+        updates nothing instead of overwriting someone else's changes.
+
+        Returns:
+            bool: True if the row was updated, False on a version conflict.
+        """
+        result = self.db.session.execute(
+            update(Character)
+            .where(Character.id == character_id,
+                   Character.version == expected_version)
+            .values(**changes, version=Character.version + 1)
+        )
+        return result.rowcount == 1
 
     def delete_character(self, character_id):
         """Delete a character based on their ID."""
         character = Character.query.get(character_id)
         if character:
             self.db.session.delete(character)
-            self.db.session.commit()
+
+    def delete_user_character(self, character_id, user_id):
+        """
+        Delete a character only if it belongs to the user, in one statement.
+
+        Returns:
+            int: The number of characters deleted (0 or 1).
+        """
+        return (Character.query
+                .filter_by(id=character_id, user_id=user_id)
+                .delete(synchronize_session=False))
+
+    # Bulk character methods
+    def bulk_add_characters(self, characters_data):
+        """
+        Add many characters with multi-row inserts.
+
+        Args:
+            characters_data (iterable of dict): Column values, one dict per character.
+
+        Returns:
+            int: The number of characters inserted.
+        """
+        rows = list(characters_data)
+        for chunk in statements.chunks(rows, self.bulk_chunk_size):
+            # executemany; the PostgreSQL driver batches it into multi-row VALUES
+            self.db.session.execute(insert(Character.__table__), chunk)
+        return len(rows)
+
+    def bulk_update_characters(self, changes_by_id):
+        """
+        Apply per-character changes with one statement per group of columns.
+
+        On PostgreSQL each group runs as
+        `UPDATE character SET ... FROM (VALUES ...) AS v WHERE character.id = v.id`;
+        other databases fall back to an executemany UPDATE by primary key.
+        Every updated row has its version bumped.
+
+        Args:
+            changes_by_id (dict): {character_id: {column: new_value}}.
+
+        Returns:
+            int: The number of rows updated.
+        """
+        from_values = self.supports_update_from_values and dialect_name() == 'postgresql'
+        updated = 0
+        for columns, items in statements.group_changes(changes_by_id).items():
+            for chunk in statements.chunks(items, self.bulk_chunk_size):
+                if from_values:
+                    statement = statements.update_from_values_statement(columns, chunk)
+                    updated += self.db.session.execute(statement).rowcount
+                else:
+                    statement, params = statements.executemany_update(columns, chunk)
+                    updated += self.db.session.execute(statement, params).rowcount
+        return updated
+
+    def bulk_delete_characters(self, character_ids):
+        """
+        Delete many characters by id.
+
+        Returns:
+            int: The number of characters deleted.
+        """
+        ids = list(character_ids)
+        table = Character.__table__
+        deleted = 0
+        for chunk in statements.chunks(ids, self.bulk_chunk_size):
+            deleted += self.db.session.execute(delete(table).where(table.c.id.in_(chunk))).rowcount
+        return deleted
+
+    def _bulk_upsert_names(self, model, names):
+        """
+        Insert the missing names of a lookup table and map every name to its id.
+
+        Names usually exist already, so they are looked up first and only the
+        missing ones are inserted and selected again.
+        """
+        names = sorted({name for name in names if name})
+        ids = {}
+        for chunk in statements.chunks(names, self.bulk_chunk_size):
+            ids.update(self.db.session.execute(statements.name_ids_statement(model, chunk)).all())
+            missing = [name for name in chunk if name not in ids]
+            if missing:
+                self.db.session.execute(statements.insert_names_statement(model, missing))
+                ids.update(self.db.session.execute(
+                    statements.name_ids_statement(model, missing)).all())
+        return ids
+
+    def bulk_upsert_houses(self, house_names):
+        """Create any missing houses and return {name: id} for all of them."""
+        return self._bulk_upsert_names(House, house_names)
+
+    def bulk_upsert_roles(self, role_names):
+        """Create any missing roles and return {name: id} for all of them."""
+        return self._bulk_upsert_names(Role, role_names)
+
+    def bulk_upsert_strengths(self, strength_names):
+        """Create any missing strengths and return {name: id} for all of them."""
+        return self._bulk_upsert_names(Strength, strength_names)
 
     # House-related methods
     def get_all_houses(self):
         """Retrieve a list of all houses."""
-        return House.query.all()
+        return House.query.execution_options(read_replica=True).all()
 
     def add_house(self, house_name):
         """Add a new house with the provided name."""
         new_house = House(name=house_name)
         self.db.session.add(new_house)
-        self.db.session.commit()
+        self.db.session.flush()
 
     def update_house(self, house_id, updates):
         """Update an existing house with provided data."""
@@ -139,25 +400,23 @@ class PostgreSQLDataManager(DataManagerInterface):
         if house:
             for key, value in updates.items():
                 setattr(house, key, value)
-            self.db.session.commit()
 
     def delete_house(self, house_id):
         """Delete a house based on its ID."""
         house = House.query.get(house_id)
         if house:
             self.db.session.delete(house)
-            self.db.session.commit()
 
     # Role-related methods
     def get_all_roles(self):
         """Retrieve a list of all roles."""
-        return Role.query.all()
+        return Role.query.execution_options(read_replica=True).all()
 
     def add_role(self, role_name):
         """Add a new role with the provided name."""
         new_role = Role(name=role_name)
         self.db.session.add(new_role)
-        self.db.session.commit()
+        self.db.session.flush()
 
     def update_role(self, role_id, updates):
         """Update an existing role with provided data."""
@@ -165,25 +424,23 @@ class PostgreSQLDataManager(DataManagerInterface):
         if role:
             for key, value in updates.items():
                 setattr(role, key, value)
-            self.db.session.commit()
 
     def delete_role(self, role_id):
         """Delete a role based on its ID."""
         role = Role.query.get(role_id)
         if role:
             self.db.session.delete(role)
-            self.db.session.commit()
 
     # Strength-related methods
     def get_all_strengths(self):
         """Retrieve a list of all strengths."""
-        return Strength.query.all()
+        return Strength.query.execution_options(read_replica=True).all()
 
     def add_strength(self, strength_name):
         """Add a new strength with the provided name."""
         new_strength = Strength(name=strength_name)
         self.db.session.add(new_strength)
-        self.db.session.commit()
+        self.db.session.flush()
 
     def update_strength(self, strength_id, updates):
         """Update an existing strength with provided data."""
@@ -191,19 +448,17 @@ class PostgreSQLDataManager(DataManagerInterface):
         if strength:
             for key, value in updates.items():
                 setattr(strength, key, value)
-            self.db.session.commit()
 
     def delete_strength(self, strength_id):
         """Delete a strength based on its ID."""
         strength = Strength.query.get(strength_id)
         if strength:
             self.db.session.delete(strength)
-            self.db.session.commit()
 
     # Contact-related methods
     def get_all_contacts(self):
-        """Retrieve a list of all contacts."""
-        return Contact.query.all()
+        """Retrieve a list of all contacts (use `iter_contacts` for large tables)."""
+        return Contact.query.execution_options(read_replica=True).all()
 
     def add_contact(self, contact_name, contact_email, contact_message):
         """Add a new contact with the provided name, email, and message."""
@@ -211,21 +466,69 @@ class PostgreSQLDataManager(DataManagerInterface):
                               email=contact_email,
                               message=contact_message)
         self.db.session.add(new_contact)
-        self.db.session.commit()
+        self.db.session.flush()
 
     def delete_contact(self, contact_id):
         """Delete a contact based on its ID."""
         contact = Contact.query.get(contact_id)
         if contact:
             self.db.session.delete(contact)
-            self.db.session.commit()
 
     # Report-related methods
-    def get_reports(self):
-        """Generate and retrieve reports with relevant data."""
-        # Example: Replace this with your report generation logic
-        return {
-            "user_count": User.query.count(),
-            "character_count": Character.query.count(),
-            "house_count": House.query.count(),
-        }
+    def get_reports(self, use_cache=True):
+        """
+        Generate and retrieve reports with relevant data.
+
+        All numbers come from a single statement and are cached for
+        REPORTS_CACHE_TTL seconds. Counts of tables above
+        REPORTS_ESTIMATE_THRESHOLD rows are PostgreSQL estimates.
+
+        Args:
+            use_cache (bool): Set to False to bypass (and refresh) the cache.
+
+        Returns:
+            dict: user_count, character_count and house_count.
+        """
+        now = time.monotonic()
+        hit = use_cache and self._reports_cache and now < self._reports_cache[0]
+        record_cache('reports', bool(hit))
+        if hit:
+            return dict(self._reports_cache[1])
+
+        threshold = self.reports_estimate_threshold if self.supports_row_estimates else None
+        statement = statements.reports_statement(threshold, dialect_name())
+        reports = dict(self.db.session.execute(statement).one()._mapping)
+        self._reports_cache = (now + self.reports_cache_ttl, reports)
+        return dict(reports)
+
+    def refresh_daily_rollups(self):
+        """
+        Bring the per-day signup and character-creation rollups up to date.
+
+        Only days from the latest stored day onwards are recounted (that day
+        may have been partial), using the created_at indexes; older days are
+        never scanned again.
+
+        Returns:
+            int: The number of days written.
+        """
+        last_day = self.db.session.execute(statements.last_rollup_day_statement()).scalar()
+        counts = {}
+        for key, statement in statements.rollup_count_statements(last_day):
+            statements.add_rollup_counts(counts, key, self.db.session.execute(statement))
+        if counts:
+            self.db.session.execute(statements.rollup_upsert_statement(counts))
+        return len(counts)
+
+    def get_daily_rollups(self, days=30):
+        """
+        Return the most recent stored per-day rollups.
+
+        Read-only: the rollups are as fresh as the last
+        `refresh_daily_rollups` call, which is the writing step.
+
+        Returns:
+            list[dict]: day, signups and characters_created, newest first.
+        """
+        rows = self.db.session.execute(statements.daily_rollups_statement(days))
+        return [dict(row._mapping) for row in rows]
@@ -0,0 +1,129 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: replica_routing.py
+Description:
+The `replica_routing.py` file sends read-only queries to a read replica while
+writes stay on the primary. Reads opt in explicitly, so anything that is not
+marked keeps the old behaviour of running on the primary.
+
+Key Features:
+1. **Replica Engine**: `REPLICA_DATABASE_URL` gets its own engine (with the
+   same pool settings as the primary), kept on the app rather than as a
+   Flask-SQLAlchemy bind so no metadata is registered on the shared `db`;
+   without it every query uses the primary.
+2. **Opt-In Reads**: A SELECT goes to the replica when it carries the
+   `read_replica=True` execution option, or runs inside `read_replica()`.
+3. **Read-Your-Writes**: Reads stay on the primary once the current
+   transaction has written, and for `REPLICA_STICKY_SECONDS` after a request
+   commits a write, for that user's session, so replica lag never hides a
+   user's own changes.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import time
+from contextlib import contextmanager
+from flask import current_app, has_request_context, session as flask_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+
+REPLICA_BIND = 'replica'
+# Execution option / bind argument marking a statement as safe for the replica
+READ_REPLICA = 'read_replica'
+_PRIMARY_UNTIL = 'primary_until'
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that can route marked reads to the replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        read_replica = kwargs.pop(READ_REPLICA, False) or self.info.get(READ_REPLICA)
+        if bind is None and read_replica and self._can_use_replica():
+            replica = current_app.extensions.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _can_use_replica(self):
+        """Reads must see this transaction's and this user's recent writes."""
+        from app.datamanager.unit_of_work import has_pending_writes
+
+        if self._flushing or has_pending_writes(self):
+            return False
+        return not primary_is_sticky()
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _route_marked_reads(orm_execute_state):
+    """Pass the statement's `read_replica` option on to `get_bind`."""
+    if orm_execute_state.is_select and orm_execute_state.execution_options.get(READ_REPLICA):
+        orm_execute_state.bind_arguments[READ_REPLICA] = True
+
+
+@event.listens_for(RoutingSession, 'before_commit')
+def _stick_to_primary_after_write(session):
+    """Keep the user on the primary while the replica catches up."""
+    from app.datamanager.unit_of_work import has_pending_writes
+
+    if has_pending_writes(session):
+        stick_to_primary()
+
+
+def stick_to_primary():
+    """
+    Send the current user's reads to the primary for REPLICA_STICKY_SECONDS.
+
+    Called once a write commits; a no-op outside of a request.
+    """
+    if has_request_context():
+        sticky_seconds = current_app.config.get('REPLICA_STICKY_SECONDS', 0)
+        if sticky_seconds:
+            flask_session[_PRIMARY_UNTIL] = time.time() + sticky_seconds
+
+
+def primary_is_sticky():
+    """Return True while the current user's reads must stay on the primary."""
+    return has_request_context() and flask_session.get(_PRIMARY_UNTIL, 0) > time.time()
+
+
+@contextmanager
+def read_replica(db_session):
+    """
+    Route the SELECTs run inside the block to the replica (where allowed).
+
+    Parameters:
+    db_session: The scoped session, usually `db.session`.
+    """
+    previous = db_session.info.get(READ_REPLICA)
+    db_session.info[READ_REPLICA] = True
+    try:
+        yield db_session
+    finally:
+        db_session.info[READ_REPLICA] = previous
+
+
+def init_replica_routing(app):
+    """Create the replica engine from `REPLICA_DATABASE_URL`, if configured."""
+    from app.monitoring.pool_metrics import engine_options
+
+    replica_url = app.config.get('REPLICA_DATABASE_URL')
+    app.extensions[REPLICA_BIND] = None
+    if replica_url:
+        options = engine_options({**app.config, 'SQLALCHEMY_DATABASE_URI': replica_url})
+        app.extensions[REPLICA_BIND] = create_engine(replica_url, **options)
+
+
+def app_engines():
+    """
+    Return the current app's engines by bind key: Flask-SQLAlchemy's and the
+    replica, if configured.
+    """
+    from app.models import db
+
+    engines = dict(db.engines)
+    replica = current_app.extensions.get(REPLICA_BIND)
+    if replica is not None:
+        engines[REPLICA_BIND] = replica
+    return engines
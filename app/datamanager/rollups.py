@@ -0,0 +1,37 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: rollups.py
+Description:
+The `rollups.py` file provides the `flask refresh-rollups` command, the
+maintenance step that keeps the per-day signup and character-creation
+rollups up to date. Reading the rollups never writes, so this command has to
+run periodically (e.g. from cron every few minutes); each run only recounts
+from the latest stored day onwards and is cheap.
+
+Usage:
+    flask --app run refresh-rollups
+    */5 * * * * cd /srv/game-api && flask --app run refresh-rollups
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import click
+from flask.cli import with_appcontext
+from app.datamanager.data_manager_factory import data_manager
+from app.datamanager.unit_of_work import unit_of_work
+
+
+@click.command('refresh-rollups')
+@with_appcontext
+def refresh_rollups_command():
+    """Bring the per-day report rollups up to date."""
+    with unit_of_work():
+        days = data_manager().refresh_daily_rollups()
+    click.echo(f'Refreshed {days} day(s) of rollups.')
+
+
+def init_rollup_command(app):
+    """Register `flask refresh-rollups`."""
+    app.cli.add_command(refresh_rollups_command)
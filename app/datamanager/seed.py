@@ -0,0 +1,348 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: seed.py
+Description:
+The `seed.py` file provides the `flask seed` command, which fills a database
+with synthetic users, characters, lookup tables and contacts for scale
+testing, and can write a synthetic character catalog far larger than the
+50 entries of `characters.json`.
+
+Key Features:
+1. **Realistic Shape**: Characters per user follow a Pareto distribution
+   around `--characters-per-user` (most users own a few, some own hundreds),
+   popular houses, roles and strengths are picked more often, and sign-up /
+   creation times spread over the year before the day of the run.
+2. **Deterministic**: Every table draws from its own generator seeded from
+   `--seed` and the table name, so the same arguments give the same rows
+   (timestamps keep their offsets from the day of the run), and changing one
+   table's count does not change the others.
+3. **Fast Loading**: Rows are generated as tuples with explicit ids and
+   streamed in chunks: `COPY ... FROM STDIN` on PostgreSQL, a prepared
+   `executemany` elsewhere, one transaction per table. Millions of rows take
+   minutes. Passwords are hashed once; every seeded user shares
+   `--password`. The per-day rollups of the seeded days are recounted
+   afterwards.
+4. **Catalog File**: `--catalog PATH --catalog-size N` streams a JSON catalog
+   in the format of `characters.json`.
+
+Usage:
+    flask --app run seed --users 100000 --characters-per-user 20 --contacts 50000
+    flask --app run seed --users 0 --catalog big_catalog.json --catalog-size 1000000
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import csv
+import io
+import itertools
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import delete, func, select
+from app.models import db, User, Character, Contact, DailyRollup
+from app.password_hasher import password_hasher
+from app.bloom_filter import known_emails
+from app.datamanager.data_manager_factory import data_manager, data_manager_name
+from app.datamanager.unit_of_work import unit_of_work
+
+# Rows sent per COPY / executemany call
+CHUNK_ROWS = 50_000
+# Pareto shape of the characters-per-user distribution (smaller: longer tail)
+SKEW = 1.5
+# Creation times spread over this many days before the day of the run
+HISTORY_DAYS = 365
+
+GIVEN_NAMES = ('Jon', 'Arya', 'Sansa', 'Bran', 'Robb', 'Rickon', 'Ned', 'Catelyn', 'Tyrion',
+               'Cersei', 'Jaime', 'Tywin', 'Daenerys', 'Viserys', 'Rhaegar', 'Aegon', 'Brienne',
+               'Samwell', 'Gilly', 'Davos', 'Stannis', 'Renly', 'Robert', 'Joffrey', 'Tommen',
+               'Myrcella', 'Margaery', 'Olenna', 'Loras', 'Oberyn', 'Ellaria', 'Theon', 'Yara',
+               'Euron', 'Sandor', 'Gregor', 'Petyr', 'Varys', 'Jorah', 'Missandei', 'Tormund',
+               'Ygritte', 'Mance', 'Podrick', 'Bronn', 'Gendry', 'Hodor', 'Meera', 'Jojen')
+FAMILY_NAMES = ('Stark', 'Lannister', 'Targaryen', 'Baratheon', 'Tyrell', 'Martell', 'Greyjoy',
+                'Tully', 'Arryn', 'Frey', 'Bolton', 'Mormont', 'Tarly', 'Clegane', 'Seaworth',
+                'Snow', 'Sand', 'Rivers', 'Stone', 'Flowers', 'Hill', 'Pyke', 'Waters', 'Storm')
+HOUSE_NAMES = tuple(f'House {name}' for name in FAMILY_NAMES)
+ANIMALS = ('Direwolf', 'Lion', 'Dragon', 'Stag', 'Rose', 'Sun', 'Kraken', 'Trout', 'Falcon',
+           'Bear', 'Hound', 'Raven', 'Horse', 'Owl', 'Bat', 'Boar', 'Eagle', 'Snake')
+SYMBOLS = ('Wolf', 'Lion', 'Three-headed dragon', 'Crowned stag', 'Golden rose', 'Spear',
+           'Golden kraken', 'Leaping trout', 'Moon and falcon', 'Flayed man', 'Onion ship')
+EPITHETS = ('the Bold', 'the Wise', 'the Young', 'the Old', 'Kingslayer', 'the Imp', 'Stormborn',
+            'the Hound', 'Littlefinger', 'the Red Viper', 'Blackfish', 'the Onion Knight',
+            'the Unready', 'the Kind', 'Half-hand', 'Oathkeeper', 'the Mad', 'the Conqueror')
+ROLE_NAMES = ('King', 'Queen', 'Lord', 'Lady', 'Knight', 'Squire', 'Maester', 'Hand of the King',
+              'Sellsword', 'Smuggler', 'Wildling', 'Ranger', 'Steward', 'Builder', 'Priest',
+              'Assassin', 'Spymaster', 'Master of Coin', 'Warden', 'Commander')
+STRENGTH_NAMES = ('Physically strong', 'Cunning', 'Swordsmanship', 'Leadership', 'Loyalty',
+                  'Intelligence', 'Diplomacy', 'Archery', 'Stealth', 'Warging', 'Resilience',
+                  'Charisma', 'Wealth', 'Seamanship', 'Horsemanship', 'Dragon riding')
+
+
+def _rng(seed, stream):
+    """An independent, reproducible generator per table."""
+    return random.Random(f'{seed}:{stream}')
+
+
+def _lookup_names(base, count):
+    """`count` names: the base names, then numbered variants of them."""
+    return [base[i] if i < len(base) else f'{base[i % len(base)]} {i // len(base) + 1}'
+            for i in range(count)]
+
+
+def _popularity(count):
+    """Cumulative weights favouring the first entries (1, 1/2, 1/3, ...)."""
+    return list(itertools.accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+def _timestamp(rng, now):
+    """A time within the past year, as text both SQLite and PostgreSQL accept."""
+    return (now - timedelta(seconds=rng.randrange(HISTORY_DAYS * 24 * 3600))).isoformat(' ')
+
+
+def character_counts(rng, users, mean, cap):
+    """Characters per user: Pareto distributed with the given mean, at most `cap`."""
+    if mean <= 0:
+        return [0] * users
+    scale = mean * (SKEW - 1) / SKEW
+    return [min(cap, int(scale * rng.paretovariate(SKEW))) for _ in range(users)]
+
+
+def _user_rows(seed, prefix, first_id, users, password_hash, now):
+    rng = _rng(seed, 'users')
+    genders = ('Male', 'Female', 'Other', None)
+    for number in range(users):
+        username = f'{prefix}_user_{number}'
+        birth = date(1950, 1, 1) + timedelta(days=rng.randrange(365 * 55))
+        created = _timestamp(rng, now)
+        yield (first_id + number, username, f'{username}@example.com', password_hash,
+               birth.isoformat(), rng.choice(genders), None, created, created)
+
+
+def _character_rows(seed, first_id, user_ids, counts, lookups, now):
+    rng = _rng(seed, 'characters')
+    (house_ids, house_weights), (role_ids, role_weights), (strength_ids, strength_weights) = lookups
+    character_id = first_id
+    for user_id, count in zip(user_ids, counts):
+        for number in range(count):
+            created = _timestamp(rng, now)
+            yield (character_id,
+                   f'{rng.choice(GIVEN_NAMES)} {rng.choice(FAMILY_NAMES)} {number}',
+                   rng.choices(house_ids, cum_weights=house_weights)[0],
+                   rng.choice(ANIMALS), rng.choice(SYMBOLS), rng.choice(EPITHETS),
+                   rng.choices(role_ids, cum_weights=role_weights)[0],
+                   rng.randrange(12, 90),
+                   rng.randrange(280, 305) if rng.random() < 0.3 else None,
+                   rng.choices(strength_ids, cum_weights=strength_weights)[0],
+                   user_id, created, created, 1)
+            character_id += 1
+
+
+def _contact_rows(seed, first_id, contacts, now):
+    rng = _rng(seed, 'contacts')
+    for number in range(contacts):
+        name = f'{rng.choice(GIVEN_NAMES)} {rng.choice(FAMILY_NAMES)}'
+        yield (first_id + number, name, f'contact_{number}@example.com',
+               f'{name} asks about {rng.choice(ROLE_NAMES).lower()}s and '
+               f'{rng.choice(ANIMALS).lower()}s.', _timestamp(rng, now))
+
+
+def catalog_entries(seed, size):
+    """Yield synthetic catalog entries in the format of `characters.json`."""
+    rng = _rng(seed, 'catalog')
+    houses = _lookup_names(HOUSE_NAMES, max(len(HOUSE_NAMES), size // 1000))
+    for number in range(size):
+        yield {
+            'id': number + 1,
+            'name': f'{rng.choice(GIVEN_NAMES)} {rng.choice(FAMILY_NAMES)} {number + 1}',
+            'house': rng.choice(houses),
+            'animal': rng.choice(ANIMALS),
+            'symbol': rng.choice(SYMBOLS),
+            'nickname': rng.choice(EPITHETS),
+            'role': rng.choice(ROLE_NAMES),
+            'age': rng.randrange(12, 90),
+            'death': rng.randrange(280, 305) if rng.random() < 0.3 else None,
+            'strength': rng.choice(STRENGTH_NAMES),
+        }
+
+
+def write_catalog(path, seed, size):
+    """Stream a synthetic catalog of `size` entries to `path` as a JSON array."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[\n')
+        for entry in catalog_entries(seed, size):
+            if entry['id'] > 1:
+                f.write(',\n')
+            f.write(json.dumps(entry))
+        f.write('\n]\n')
+
+
+def _batched(rows, size):
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def load_rows(connection, table, columns, rows):
+    """
+    Insert tuples into a table: `COPY ... FROM STDIN` on PostgreSQL, a
+    prepared `executemany` elsewhere.
+
+    Returns:
+    int: The number of rows inserted.
+    """
+    preparer = connection.dialect.identifier_preparer
+    target = f'{preparer.format_table(table)} ({", ".join(preparer.quote(c) for c in columns)})'
+    total = 0
+    if connection.dialect.name == 'postgresql':
+        cursor = connection.connection.cursor()
+        copy = f'COPY {target} FROM STDIN WITH (FORMAT csv)'
+        for chunk in _batched(rows, CHUNK_ROWS):
+            buffer = io.StringIO()
+            # None becomes an unquoted empty field, which CSV COPY reads as NULL
+            csv.writer(buffer).writerows(chunk)
+            buffer.seek(0)
+            cursor.copy_expert(copy, buffer)
+            total += len(chunk)
+        return total
+    placeholder = '?' if connection.dialect.paramstyle == 'qmark' else '%s'
+    insert = f'INSERT INTO {target} VALUES ({", ".join([placeholder] * len(columns))})'
+    for chunk in _batched(rows, CHUNK_ROWS):
+        connection.exec_driver_sql(insert, chunk)
+        total += len(chunk)
+    return total
+
+
+def _next_id(connection, model):
+    return connection.execute(select(func.coalesce(func.max(model.id), 0))).scalar_one() + 1
+
+
+def _reset_sequences(connection, models):
+    """Move PostgreSQL id sequences past the explicitly inserted ids."""
+    if connection.dialect.name != 'postgresql':
+        return
+    for model in models:
+        name = model.__tablename__
+        connection.exec_driver_sql(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+            f"(SELECT coalesce(max(id), 1) FROM {connection.dialect.identifier_preparer.quote(name)}))")
+
+
+def _report(table, rows, started):
+    seconds = time.perf_counter() - started
+    rate = f'{rows / seconds:,.0f} rows/s' if seconds else '-'
+    click.echo(f'{table:<12} {rows:>12,} rows in {seconds:7.1f}s ({rate})')
+
+
+def seed_database(users, characters_per_user, contacts, seed, prefix, password, lookups_count,
+                  max_characters_per_user):
+    """
+    Generate and load the synthetic rows; needs an app context.
+
+    Returns:
+    dict: Rows inserted per table.
+    """
+    if data_manager_name(current_app.config) == 'memory':
+        raise click.ClickException('Seeding needs a database; unset DATA_MANAGER=memory.')
+    # Times are seeded offsets before today's midnight: never in the future
+    now = datetime.combine(date.today(), datetime.min.time())
+    if db.session.execute(select(User.id).where(
+            User.username == f'{prefix}_user_0')).first() is not None:
+        raise click.ClickException(f"Users with the prefix '{prefix}' exist already; "
+                                   'pick another --prefix.')
+
+    started = time.perf_counter()
+    manager = data_manager()
+    with unit_of_work():
+        lookups = []
+        for upsert, base in ((manager.bulk_upsert_houses, HOUSE_NAMES),
+                             (manager.bulk_upsert_roles, ROLE_NAMES),
+                             (manager.bulk_upsert_strengths, STRENGTH_NAMES)):
+            ids = upsert(_lookup_names(base, lookups_count))
+            lookups.append((list(ids.values()), _popularity(len(ids))))
+    _report('lookups', 3 * lookups_count, started)
+
+    counts = {}
+    password_hash = password_hasher.hash(password)
+    engine = db.engine
+    with engine.begin() as connection:
+        started = time.perf_counter()
+        first_user = _next_id(connection, User)
+        counts['users'] = load_rows(
+            connection, User.__table__,
+            ('id', 'username', 'email', 'password', 'date_of_birth', 'gender', 'profile_picture',
+             'created_at', 'updated_at'),
+            _user_rows(seed, prefix, first_user, users, password_hash, now))
+        _report('users', counts['users'], started)
+
+    with engine.begin() as connection:
+        started = time.perf_counter()
+        per_user = character_counts(_rng(seed, 'character_counts'), users, characters_per_user,
+                                    max_characters_per_user)
+        counts['characters'] = load_rows(
+            connection, Character.__table__,
+            ('id', 'name', 'house_id', 'animal', 'symbol', 'nickname', 'role_id', 'age', 'death',
+             'strength_id', 'user_id', 'created_at', 'updated_at', 'version'),
+            _character_rows(seed, _next_id(connection, Character),
+                            range(first_user, first_user + users), per_user, lookups, now))
+        _report('characters', counts['characters'], started)
+
+    with engine.begin() as connection:
+        started = time.perf_counter()
+        counts['contacts'] = load_rows(
+            connection, Contact.__table__, ('id', 'name', 'email', 'message', 'created_at'),
+            _contact_rows(seed, _next_id(connection, Contact), contacts, now))
+        _report('contacts', counts['contacts'], started)
+        _reset_sequences(connection, (User, Character, Contact))
+
+    # The rows are backdated and the refresh only recounts from the latest
+    # stored day, so drop the seeded days' rollups and recount them
+    started = time.perf_counter()
+    with unit_of_work():
+        db.session.execute(delete(DailyRollup).where(
+            DailyRollup.day >= (now - timedelta(days=HISTORY_DAYS)).date()))
+        days = manager.refresh_daily_rollups()
+    _report('rollups', days, started)
+    return counts
+
+
+@click.command('seed')
+@click.option('--users', default=1000, show_default=True, help='Users to create.')
+@click.option('--characters-per-user', default=10.0, show_default=True,
+              help='Mean characters per user (Pareto distributed).')
+@click.option('--max-characters-per-user', default=5000, show_default=True,
+              help='Cap of the distribution tail.')
+@click.option('--contacts', default=0, show_default=True, help='Contact messages to create.')
+@click.option('--lookups', default=50, show_default=True,
+              help='Houses, roles and strengths to create (each).')
+@click.option('--seed', default=42, show_default=True, help='Seed of the generators.')
+@click.option('--prefix', default='seed', show_default=True,
+              help='Prefix of the usernames and emails (must be new).')
+@click.option('--password', default='Seed@1234', show_default=True,
+              help='Password of every seeded user.')
+@click.option('--catalog', type=click.Path(dir_okay=False, writable=True),
+              help='Also write a synthetic character catalog to this file.')
+@click.option('--catalog-size', default=100_000, show_default=True,
+              help='Entries of the catalog file.')
+@with_appcontext
+def seed_command(users, characters_per_user, contacts, lookups, seed, prefix, password, catalog,
+                 catalog_size, max_characters_per_user):
+    """Fill the database with synthetic data for scale testing."""
+    if users or contacts:
+        seed_database(users, characters_per_user, contacts, seed, prefix, password, lookups,
+                      max_characters_per_user)
+        known_emails.rebuild()
+    if catalog:
+        started = time.perf_counter()
+        write_catalog(catalog, seed, catalog_size)
+        _report('catalog', catalog_size, started)
+    current_app.logger.info('Seeding done; restart running servers to rebuild their known-email filters.')
+
+
+def init_seed_command(app):
+    """Register `flask seed`."""
+    app.cli.add_command(seed_command)
@@ -0,0 +1,51 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: sql_dialect.py
+Description:
+The `sql_dialect.py` file collects the small pieces of dialect-specific SQL
+the data layer needs. PostgreSQL and SQLite both support
+`INSERT ... ON CONFLICT`, but SQLAlchemy exposes it through each dialect's own
+`insert()` construct, so callers pick the right one through `dialect_insert`.
+
+Key Features:
+1. **Dialect Insert**: Returns the PostgreSQL or SQLite `insert()` for a model
+   so `on_conflict_do_nothing` / `on_conflict_do_update` can be used.
+2. **Clear Failure**: Other backends raise `NotImplementedError` instead of
+   silently running a plain `INSERT`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models import db
+
+_DIALECT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+def dialect_name():
+    """Return the name of the dialect writes go to (e.g. 'postgresql')."""
+    return db.engine.dialect.name
+
+
+def dialect_insert(model, name=None):
+    """
+    Build an `INSERT` for the model that supports `ON CONFLICT` clauses.
+
+    Parameters:
+    model: A mapped model class or a Table.
+    name (str): Dialect to build for; defaults to the app's database (pass
+                it for engines outside Flask-SQLAlchemy, e.g. async ones).
+
+    Returns:
+    Insert: The dialect-specific insert construct.
+    """
+    name = name or dialect_name()
+    try:
+        return _DIALECT_INSERTS[name](model)
+    except KeyError:
+        raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported on '{name}'.")
@@ -0,0 +1,123 @@
+"""=============================================================================
+Project: Game Api App
+Developer: Varsha Rana
+File: sqlite_data_manager.py
+Description: This file implements the `SQLiteDataManager` class, the data
+             manager for single-node and local deployments (edge nodes,
+             benchmarks, development) that run without a database server.
+             It shares every operation with `PostgreSQLDataManager` (the SQL
+             in `statements.py` is portable) and turns off the
+             PostgreSQL-only capabilities, so bulk updates use executemany and
+             report counts are always exact. Every connection is tuned for
+             concurrent use by `sqlite_pragmas()`: WAL journal (readers no
+             longer block the writer), a busy timeout (writers queue for the
+             lock instead of failing with "database is locked"),
+             `synchronous=NORMAL` (safe in WAL, fsync only at checkpoints) and
+             a memory-mapped read path. The schema, indexes included, comes
+             from the same models as PostgreSQL; see also `app/db/sqlite_script`.
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from app.datamanager.replica_routing import app_engines
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+
+# PRAGMAs whose value must be one of these (they are not bindable parameters)
+_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+_SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+
+
+def is_sqlite_url(url):
+    """Check whether a database URL points at SQLite."""
+    return bool(url) and make_url(url).get_backend_name() == 'sqlite'
+
+
+def _is_memory_database(url):
+    return make_url(url).database in (None, '', ':memory:')
+
+
+def sqlite_pragmas(config, url=None):
+    """
+    Build the PRAGMAs every new SQLite connection runs, from the SQLITE_* settings.
+
+    In-memory databases skip `journal_mode`, which they cannot use.
+
+    Returns:
+    list: (pragma, value) pairs, in the order they are applied.
+    """
+    journal_mode = config.get('SQLITE_JOURNAL_MODE', 'WAL').upper()
+    synchronous = config.get('SQLITE_SYNCHRONOUS', 'NORMAL').upper()
+    if journal_mode not in _JOURNAL_MODES:
+        raise ValueError(f"Unknown SQLITE_JOURNAL_MODE '{journal_mode}'.")
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(f"Unknown SQLITE_SYNCHRONOUS '{synchronous}'.")
+
+    pragmas = []
+    if not (url and _is_memory_database(url)):
+        pragmas.append(('journal_mode', journal_mode))
+    pragmas += [
+        ('busy_timeout', int(config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))),
+        ('synchronous', synchronous),
+        ('mmap_size', int(config.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))),
+    ]
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Run the PRAGMAs on every connection the engine opens from now on."""
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+
+def init_sqlite(app):
+    """
+    Tune the app's SQLite engines (the default one and any SQLite binds).
+
+    Must run after `db.init_app(app)`; engines of other databases are left
+    alone, so it is safe to call for every app.
+    """
+    if app.extensions.get('sqlite_pragmas'):
+        return
+    with app.app_context():
+        for engine in app_engines().values():
+            if engine.dialect.name == 'sqlite':
+                apply_sqlite_pragmas(engine, sqlite_pragmas(app.config, engine.url))
+                # Connections opened before the listener was added lack the PRAGMAs
+                engine.dispose()
+    app.extensions['sqlite_pragmas'] = True
+
+
+class SQLiteDataManager(PostgreSQLDataManager):
+    """
+    Data manager for a local SQLite database file.
+
+    Same operations and transaction rules as `PostgreSQLDataManager`; only
+    the capability flags differ.
+    """
+
+    supports_update_from_values = False
+    supports_row_estimates = False
+
+    def __init__(self, app):
+        """
+        Initializes the SQLiteDataManager with a Flask app whose database is SQLite.
+
+        Args:
+            app (Flask): The Flask application instance.
+
+        Raises:
+            ValueError: If the app's database is not SQLite.
+        """
+        super().__init__(app)
+        if not is_sqlite_url(app.config.get('SQLALCHEMY_DATABASE_URI')):
+            raise ValueError("SQLiteDataManager needs a sqlite:/// DATABASE_URL.")
+        init_sqlite(app)
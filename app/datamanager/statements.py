@@ -0,0 +1,281 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: statements.py
+Description:
+The `statements.py` file builds the SQL statements behind the data managers'
+bulk, report and rollup methods. Building is kept apart from executing so the
+synchronous `PostgreSQLDataManager` and the asyncio-based
+`AsyncPostgreSQLDataManager` run exactly the same SQL.
+
+Key Features:
+1. **Bulk Writes**: `UPDATE ... FROM (VALUES ...)`, the executemany update
+   fallback and lookup-name upserts.
+2. **Reports**: One statement for all report counts, with optional
+   PostgreSQL `pg_class.reltuples` estimates for large tables.
+3. **Rollups**: Incremental per-day signup / character-creation counts and
+   their upsert.
+4. **Character List**: One prebuilt page/count statement pair per
+   filter-presence bitmask and sort, reused with bound parameters.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+from datetime import date, datetime
+from sqlalchemy import (BigInteger, Integer, bindparam, case, cast, column, func,
+                        literal, select, table, update, values)
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.orm import joinedload
+from app.models import User, House, Role, Strength, Character, DailyRollup
+from app.datamanager.sql_dialect import dialect_insert
+
+# Planner statistics PostgreSQL keeps per table (row estimate in reltuples)
+_pg_class = table('pg_class', column('oid'), column('reltuples'))
+
+
+def chunks(items, size):
+    """Yield successive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# Character list
+# Filter-presence bits; together with the sort they select a statement shape
+SEARCH_FILTER, HOUSE_FILTER, ROLE_FILTER, STRENGTH_FILTER, MIN_AGE_FILTER, MAX_AGE_FILTER = (
+    1 << bit for bit in range(6))
+
+# {(mask, sort column, 'asc'/'desc', eager): (page statement, count statement)}
+_character_list_shapes = {}
+
+
+def character_list_mask(filters):
+    """Return the bitmask of the character list filters that are set."""
+    mask = 0
+    if filters["search_query"]:
+        mask |= SEARCH_FILTER
+    if filters["house_filter"]:
+        mask |= HOUSE_FILTER
+    if filters["role_filter"]:
+        mask |= ROLE_FILTER
+    if filters["strength_filter"]:
+        mask |= STRENGTH_FILTER
+    if filters["age_more_than"]:
+        mask |= MIN_AGE_FILTER
+    if filters["age_less_than"]:
+        mask |= MAX_AGE_FILTER
+    return mask
+
+
+def _character_list_criteria(mask):
+    """The WHERE criteria of one shape, with bound parameters for every value."""
+    criteria = [Character.user_id == bindparam('user_id')]
+    if mask & SEARCH_FILTER:
+        criteria.append(Character.name.ilike(bindparam('search_pattern')))
+    if mask & HOUSE_FILTER:
+        criteria.append(Character.house.has(House.name.ilike(bindparam('house_pattern'))))
+    if mask & ROLE_FILTER:
+        criteria.append(Character.role.has(Role.name.ilike(bindparam('role_pattern'))))
+    if mask & STRENGTH_FILTER:
+        criteria.append(Character.strength.has(Strength.name.ilike(bindparam('strength_pattern'))))
+    if mask & MIN_AGE_FILTER:
+        criteria.append(Character.age >= bindparam('min_age'))
+    if mask & MAX_AGE_FILTER:
+        criteria.append(Character.age <= bindparam('max_age'))
+    return criteria
+
+
+def character_list_statements(filters, sort_options, eager=False):
+    """
+    Return the (page, count) statements for the character list's shape.
+
+    Statements are built once per filter-presence bitmask and sort and then
+    reused: every value is a bound parameter (see `character_list_params`),
+    so a request skips building the statement and its EXISTS subqueries,
+    the statement's cache key is memoized on the reused object, and the
+    compiled cache holds one entry per shape.
+
+    Args:
+        eager (bool): Load house, role and strength in the same statement
+            (LEFT OUTER JOINs; each is many-to-one, so rows are not
+            multiplied). Needed by pages that show them, which would
+            otherwise lazy-load them row by row, and once the session is
+            gone, e.g. by the async manager.
+
+    Raises:
+        AttributeError: If the sort column is not a Character attribute.
+    """
+    sort_order = 'asc' if sort_options["sort_order"] == 'asc' else 'desc'
+    key = (character_list_mask(filters), sort_options["sort_column"], sort_order, eager)
+    shape = _character_list_shapes.get(key)
+    if shape is None:
+        mask, sort_column, _, _ = key
+        column = getattr(Character, sort_column)
+        criteria = _character_list_criteria(mask)
+        page_statement = (select(Character)
+                          .where(*criteria)
+                          .order_by(column.asc() if sort_order == 'asc' else column.desc())
+                          .limit(bindparam('limit'))
+                          .offset(bindparam('offset')))
+        if eager:
+            page_statement = page_statement.options(joinedload(Character.house),
+                                                    joinedload(Character.role),
+                                                    joinedload(Character.strength))
+        count_statement = select(func.count(Character.id)).where(*criteria)
+        shape = _character_list_shapes[key] = (page_statement, count_statement)
+    return shape
+
+
+def character_list_params(user_id, filters, page, per_page):
+    """
+    Return the bound parameter values for `character_list_statements`.
+
+    Parameters of filters that are not set are left out; their shape has no
+    placeholder for them.
+    """
+    params = {'user_id': user_id, 'limit': per_page, 'offset': (page - 1) * per_page}
+    for name in ('search_query', 'house_filter', 'role_filter', 'strength_filter'):
+        if filters[name]:
+            params[f"{name.split('_')[0]}_pattern"] = f"%{filters[name]}%"
+    if filters["age_more_than"]:
+        params['min_age'] = filters["age_more_than"]
+    if filters["age_less_than"]:
+        params['max_age'] = filters["age_less_than"]
+    return params
+
+
+# Bulk character writes
+def group_changes(changes_by_id):
+    """
+    Group {character_id: {column: value}} by the set of columns changed.
+
+    Returns:
+    dict: {(column, ...): [(character_id, changes), ...]}
+    """
+    groups = {}
+    for character_id, changes in changes_by_id.items():
+        if changes:
+            groups.setdefault(tuple(sorted(changes)), []).append((character_id, changes))
+    return groups
+
+
+def update_from_values_statement(columns, items):
+    """Build `UPDATE character ... FROM (VALUES ...)` for one column group."""
+    character = Character.__table__
+    rows = values(column('id', Integer),
+                  *[column(name, character.c[name].type) for name in columns],
+                  name='v').data([(character_id, *[changes[name] for name in columns])
+                                  for character_id, changes in items])
+    assignments = {name: cast(rows.c[name], character.c[name].type) for name in columns}
+    assignments['version'] = character.c.version + 1
+    return (update(character)
+            .where(character.c.id == cast(rows.c.id, Integer))
+            .values(assignments))
+
+
+def executemany_update(columns, items):
+    """
+    Build the portable fallback: one UPDATE by primary key run as executemany.
+
+    Returns:
+    tuple: (statement, list of parameter dicts)
+    """
+    character = Character.__table__
+    assignments = {name: bindparam(f'new_{name}') for name in columns}
+    assignments['version'] = character.c.version + 1
+    statement = (update(character)
+                 .where(character.c.id == bindparam('character_id'))
+                 .values(assignments))
+    params = [{'character_id': character_id,
+               **{f'new_{name}': changes[name] for name in columns}}
+              for character_id, changes in items]
+    return statement, params
+
+
+def insert_names_statement(model, names, dialect=None):
+    """`INSERT ... ON CONFLICT (name) DO NOTHING` for a lookup table."""
+    return (dialect_insert(model, dialect)
+            .values([{'name': name} for name in names])
+            .on_conflict_do_nothing(index_elements=['name']))
+
+
+def name_ids_statement(model, names):
+    """Select (name, id) of a lookup table for the given names."""
+    return select(model.name, model.id).where(model.name.in_(names))
+
+
+# Reports
+def count_expression(model, estimate_threshold, dialect):
+    """
+    Build a scalar subquery counting the model's rows.
+
+    On PostgreSQL, when `estimate_threshold` is set, tables whose planner
+    estimate is at least that many rows report the estimate instead; the
+    COUNT(*) subplan then never runs, so large tables are not scanned.
+    """
+    exact = select(func.count()).select_from(model).scalar_subquery()
+    if not estimate_threshold or dialect != 'postgresql':
+        return exact
+    estimate = (select(cast(_pg_class.c.reltuples, BigInteger))
+                .where(_pg_class.c.oid == cast(literal(model.__tablename__), REGCLASS))
+                .scalar_subquery())
+    return case((estimate >= estimate_threshold, estimate), else_=exact)
+
+
+def reports_statement(estimate_threshold, dialect):
+    """Select user_count, character_count and house_count in one statement."""
+    return select(
+        count_expression(User, estimate_threshold, dialect).label('user_count'),
+        count_expression(Character, estimate_threshold, dialect).label('character_count'),
+        count_expression(House, estimate_threshold, dialect).label('house_count'),
+    ).execution_options(read_replica=True)
+
+
+# Daily rollups
+def last_rollup_day_statement():
+    return select(func.max(DailyRollup.day))
+
+
+def rollup_count_statements(last_day):
+    """
+    Build the per-day count queries, starting at `last_day` when given.
+
+    Returns:
+    list: (rollup column, statement selecting (day, count)) pairs.
+    """
+    statements = []
+    for model, key in ((User, 'signups'), (Character, 'characters_created')):
+        day = func.date(model.created_at)
+        statement = select(day, func.count()).where(model.created_at.isnot(None)).group_by(day)
+        if last_day is not None:
+            statement = statement.where(
+                model.created_at >= datetime.combine(last_day, datetime.min.time()))
+        statements.append((key, statement))
+    return statements
+
+
+def add_rollup_counts(counts, key, rows):
+    """Merge (day, count) rows into {day: {'signups': n, 'characters_created': n}}."""
+    for value, count in rows:
+        # SQLite returns date() as 'YYYY-MM-DD' text
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        counts.setdefault(value, {'signups': 0, 'characters_created': 0})[key] = count
+    return counts
+
+
+def rollup_upsert_statement(counts, dialect=None):
+    """Insert the per-day counts, replacing the days already stored."""
+    statement = dialect_insert(DailyRollup, dialect).values(
+        [{'day': day, **day_counts} for day, day_counts in counts.items()])
+    return statement.on_conflict_do_update(
+        index_elements=['day'],
+        set_={'signups': statement.excluded.signups,
+              'characters_created': statement.excluded.characters_created})
+
+
+def daily_rollups_statement(days):
+    """Select the most recent `days` rollups, newest first."""
+    return (select(DailyRollup.day, DailyRollup.signups, DailyRollup.characters_created)
+            .order_by(DailyRollup.day.desc())
+            .limit(days))
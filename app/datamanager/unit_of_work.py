@@ -0,0 +1,115 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: unit_of_work.py
+Description:
+The `unit_of_work.py` file gives every request a single transaction. Helpers
+and data-manager methods only add, flush or execute; the unit of work commits
+once when the request finishes successfully and rolls back otherwise. That
+means one WAL fsync per request instead of one per helper, and multi-step
+writes (e.g. creating a house and then the character that uses it) become
+atomic.
+
+Key Features:
+1. **Write Tracking**: Session events mark the session as dirty when a flush
+   writes rows or an `INSERT`/`UPDATE`/`DELETE` statement is executed, so
+   read-only requests never pay for a `COMMIT`.
+2. **Commit Once**: An `after_request` hook commits when the response status
+   is below 400 and something was written, and reports the commit's time to
+   the request timings.
+3. **Rollback on Error**: 4xx/5xx responses and unhandled exceptions roll the
+   transaction back.
+4. **Scripts**: The `unit_of_work()` context manager gives CLI commands and
+   maintenance scripts the same commit-once/rollback-on-error behaviour.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import time
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models import db
+from app.monitoring.request_timing import record_commit
+
+_PENDING_WRITES = 'unit_of_work_pending_writes'
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_flush(session, flush_context):
+    """A flush only fires this event when it actually wrote something."""
+    session.info[_PENDING_WRITES] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_write_statement(orm_execute_state):
+    """Bulk and Core INSERT/UPDATE/DELETE statements bypass the flush."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_PENDING_WRITES] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _clear_pending(session):
+    session.info.pop(_PENDING_WRITES, None)
+
+
+def has_pending_writes(session=None):
+    """
+    Check whether the session holds writes that still need a commit.
+
+    Returns:
+    bool: True if rows were written or objects are waiting to be flushed.
+    """
+    session = session or db.session
+    return bool(session.info.get(_PENDING_WRITES)
+                or session.new or session.dirty or session.deleted)
+
+
+def commit_request(response):
+    """
+    Commit the request's transaction once, if it succeeded and wrote data.
+    """
+    if not has_pending_writes():
+        return response
+    if response.status_code < 400:
+        try:
+            # Flush first so the flush's statements are not timed twice
+            db.session.flush()
+            started = time.perf_counter()
+            db.session.commit()
+            record_commit(time.perf_counter() - started)
+        except Exception:
+            db.session.rollback()
+            raise
+    else:
+        db.session.rollback()
+    return response
+
+
+def rollback_request(exception=None):
+    """Roll back whatever is left if the request raised."""
+    if exception is not None:
+        db.session.rollback()
+
+
+def init_unit_of_work(app):
+    """Register the request-scoped unit of work on the app."""
+    app.after_request(commit_request)
+    app.teardown_request(rollback_request)
+
+
+@contextmanager
+def unit_of_work():
+    """
+    Run a block as one transaction outside of a request (CLI, scripts).
+
+    Commits once when the block finishes and rolls back if it raises.
+    """
+    try:
+        yield db.session
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
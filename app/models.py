@@ -4,19 +4,21 @@ Developer: Varsha Rana
 File: models.py
 Description: This file contains the SQLAlchemy models for the Game Api App.
              It defines the structure of the 'Users', 'House', 'Role', 'Strength',
-             'Character', and 'Contact' tables in the database. The 'User' model
+             'Character', 'Contact' and 'DailyRollup' tables in the database. The 'User' model
              handles user authentication, while the other models represent various
              aspects of the game, including character traits, roles, houses, and strengths.
              The file also includes methods for setting and verifying user passwords.
 Created: 2024-12-02
-Updated: 2024-12-11
+Updated: 2026-10-19
 =============================================================================
 """
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.password_hasher import password_hasher
+from app.datamanager.replica_routing import RoutingSession
 
-db = SQLAlchemy()
+# Reads marked with read_replica=True may be served by the replica engine
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 
 class User(db.Model):
@@ -29,7 +31,8 @@ class User(db.Model):
     date_of_birth = db.Column(db.Date, nullable=True)
     gender = db.Column(db.String(50), nullable=True)  # "Male", "Female", "Other"
     profile_picture = db.Column(db.String(300), nullable=True)
-    created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    # Indexed for the per-day signup rollups
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), index=True)
     updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
 
     def __repr__(self):
@@ -47,7 +50,7 @@ class User(db.Model):
         """
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters long.")
-        self.password = generate_password_hash(password)
+        self.password = password_hasher.hash(password)
         # Create password timestamp
         self.updated_at = datetime.now()
 
@@ -61,7 +64,7 @@ class User(db.Model):
         Returns:
         bool: True if the provided password matches the hashed password, False otherwise.
         """
-        return check_password_hash(self.password, password)
+        return password_hasher.verify(self.password, password)
 
 
 class House(db.Model):
@@ -105,6 +108,10 @@ class Strength(db.Model):
 
 class Character(db.Model):
     __tablename__ = 'character'
+    # One character name per user; lets inserts use ON CONFLICT DO NOTHING
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='uq_character_user_name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     house_id = db.Column(db.Integer, db.ForeignKey('house.id'), nullable=True)
@@ -116,9 +123,13 @@ class Character(db.Model):
     death = db.Column(db.Integer, nullable=True)
     strength_id = db.Column(db.Integer, db.ForeignKey('strength.id'), nullable=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
-    created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    # Indexed for the per-day character-creation rollups
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), index=True)
     updated_at = db.Column(db.DateTime, default=db.func.current_timestamp(),
                            onupdate=db.func.current_timestamp(), nullable=True)
+    # Row version for optimistic locking: every UPDATE checks and bumps it
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    __mapper_args__ = {'version_id_col': version}
     # Changed backref name
     house = db.relationship('House', backref='characters_in_house')
     role = db.relationship('Role', backref='characters_in_role')
@@ -138,3 +149,14 @@ class Contact(db.Model):
     email = db.Column(db.String(100), nullable=False)
     message = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+
+class DailyRollup(db.Model):
+    """Signups and characters created per day, maintained incrementally."""
+    __tablename__ = 'daily_rollup'
+    day = db.Column(db.Date, primary_key=True)
+    signups = db.Column(db.Integer, nullable=False, default=0)
+    characters_created = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DailyRollup {self.day}>"
@@ -0,0 +1,215 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: memory_profiler.py
+Description:
+The `memory_profiler.py` file finds out where a worker's memory goes. Worker
+RSS that creeps up over days (ORM identity maps, the simple cache, catalog
+reloads) is located by comparing tracemalloc snapshots taken hours apart,
+and the heaviest routes report how much memory a single request needs.
+
+Key Features:
+1. **Tracing on Demand**: tracemalloc slows allocations down noticeably, so
+   it only runs between `start()` and `stop()` (the `/internal/memory`
+   endpoints), or from interpreter start with `PYTHONTRACEMALLOC=1`.
+2. **Snapshots and Diffs**: `take_snapshot()` keeps the newest
+   `MEMORY_SNAPSHOT_KEEP` snapshots of the process; `top()` returns the
+   largest allocation sites of one, or the largest growth since another,
+   grouped by file and line (or by file).
+3. **Per-Request Peak**: While tracing, the peak traced memory of each
+   request to `MEMORY_PEAK_ENDPOINTS` (all endpoints when empty), above
+   what was allocated when it started, is recorded in the
+   `app_http_request_peak_alloc_bytes` histogram. The peak is process-wide,
+   so requests that overlap another request are not recorded; with one
+   request at a time per worker (prefork sync workers) every one is.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import os
+import threading
+import time
+import tracemalloc
+from flask import current_app, g, request
+
+GROUPINGS = ('lineno', 'filename')
+
+# Allocations of the tracer and the import machinery are noise in a diff
+_NOISE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class MemoryProfiler:
+    """tracemalloc control, snapshots and per-request peaks of one process."""
+
+    def __init__(self):
+        self.keep = 3
+        self.frames = 1
+        self.peak_endpoints = frozenset()
+        self._lock = threading.Lock()
+        self._snapshots = []
+        self._next_id = 1
+        self._pid = os.getpid()
+        # Requests in flight, and requests started so far, in this process
+        self._in_flight = 0
+        self._started = 0
+
+    def init_app(self, app):
+        """Read the settings and attach the per-request peak hooks."""
+        if not app.config['MEMORY_PROFILER_ENABLED']:
+            return
+        self.keep = app.config['MEMORY_SNAPSHOT_KEEP']
+        self.frames = app.config['MEMORY_TRACE_FRAMES']
+        self.peak_endpoints = frozenset(
+            name.strip() for name in app.config['MEMORY_PEAK_ENDPOINTS'].split(',') if name.strip())
+        app.before_request(self._request_started)
+        app.teardown_request(self._request_finished)
+        app.extensions['memory_profiler'] = self
+
+    def _check_fork(self):
+        # A forked worker neither shares the parent's requests nor its traces
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._in_flight = 0
+            self._snapshots = []
+
+    def start(self, frames=None):
+        """Start tracing (a no-op if already tracing)."""
+        with self._lock:
+            self._check_fork()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames or self.frames)
+
+    def stop(self):
+        """Stop tracing and drop the snapshots with their traces."""
+        with self._lock:
+            tracemalloc.stop()
+            self._snapshots = []
+
+    def status(self):
+        """Return whether tracing is on, the traced sizes and the kept snapshots."""
+        with self._lock:
+            self._check_fork()
+            tracing = tracemalloc.is_tracing()
+            current, peak = tracemalloc.get_traced_memory()
+            return {
+                'tracing': tracing,
+                'frames': tracemalloc.get_traceback_limit() if tracing else None,
+                'traced_bytes': current,
+                'traced_peak_bytes': peak,
+                'tracemalloc_bytes': tracemalloc.get_tracemalloc_memory(),
+                'snapshots': [{'id': snapshot_id, 'taken': taken}
+                              for snapshot_id, taken, _ in self._snapshots],
+            }
+
+    def take_snapshot(self):
+        """
+        Take and keep a snapshot, dropping the oldest beyond the limit.
+
+        Returns:
+        int or None: The snapshot id, or None when not tracing.
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(_NOISE)
+        with self._lock:
+            self._check_fork()
+            snapshot_id, self._next_id = self._next_id, self._next_id + 1
+            self._snapshots.append((snapshot_id, time.time(), snapshot))
+            del self._snapshots[:-self.keep]
+        return snapshot_id
+
+    def snapshot_ids(self):
+        """Return the ids of the kept snapshots, oldest first."""
+        with self._lock:
+            return [snapshot_id for snapshot_id, _, _ in self._snapshots]
+
+    def _snapshot(self, snapshot_id):
+        with self._lock:
+            for kept_id, _, snapshot in self._snapshots:
+                if kept_id == snapshot_id:
+                    return snapshot
+        raise KeyError(snapshot_id)
+
+    def top(self, snapshot_id, compare_to=None, group_by='lineno', limit=20):
+        """
+        Return the largest allocation sites of a snapshot, or the largest
+        changes since an earlier one.
+
+        Parameters:
+        snapshot_id (int): The snapshot to report.
+        compare_to (int): An earlier snapshot to diff against.
+        group_by (str): `lineno` (file and line) or `filename`.
+        limit (int): Most sites returned.
+
+        Returns:
+        list: dicts with the file, line, size and count of each site, plus
+              `size_diff` and `count_diff` when comparing.
+
+        Raises:
+        KeyError: if a snapshot is not (or no longer) kept.
+        """
+        if group_by not in GROUPINGS:
+            raise ValueError(f'group_by must be one of {", ".join(GROUPINGS)}')
+        snapshot = self._snapshot(snapshot_id)
+        if compare_to is None:
+            stats = snapshot.statistics(group_by)
+        else:
+            stats = snapshot.compare_to(self._snapshot(compare_to), group_by)
+        sites = []
+        for stat in stats[:limit]:
+            frame = stat.traceback[0]
+            site = {'file': frame.filename,
+                    'line': frame.lineno if group_by == 'lineno' else None,
+                    'size': stat.size,
+                    'count': stat.count}
+            if compare_to is not None:
+                site.update(size_diff=stat.size_diff, count_diff=stat.count_diff)
+            sites.append(site)
+        return sites
+
+    def _request_started(self):
+        with self._lock:
+            self._check_fork()
+            self._in_flight += 1
+            self._started += 1
+            alone = self._in_flight == 1
+            started = self._started
+        g.memory_request = True
+        if not (alone and tracemalloc.is_tracing()):
+            return
+        endpoint = request.endpoint
+        if self.peak_endpoints and endpoint not in self.peak_endpoints:
+            return
+        tracemalloc.reset_peak()
+        g.memory_peak = (started, tracemalloc.get_traced_memory()[0])
+
+    def _request_finished(self, exc=None):
+        if not g.pop('memory_request', False):
+            return
+        measured = g.pop('memory_peak', None)
+        with self._lock:
+            # Valid only if no other request started meanwhile
+            alone = measured is not None and self._started == measured[0]
+            self._in_flight -= 1
+        if not alone or not tracemalloc.is_tracing():
+            return
+        peak = max(0, tracemalloc.get_traced_memory()[1] - measured[1])
+        registry = current_app.extensions.get('metrics')
+        if registry is not None:
+            registry.observe('app_http_request_peak_alloc_bytes',
+                             (('blueprint', request.blueprint or ''),
+                              ('endpoint', request.endpoint or '<unmatched>')), peak)
+
+
+memory_profiler = MemoryProfiler()
+
+
+def init_memory_profiler(app):
+    """Control tracemalloc for this process and record per-request peaks."""
+    memory_profiler.init_app(app)
@@ -0,0 +1,372 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: metrics.py
+Description:
+The `metrics.py` file keeps the app's Prometheus metrics: per-endpoint
+latency histograms, status-code counters and in-flight gauges, cache
+hits/misses, per-request peak allocations (see `memory_profiler.py`), and,
+at scrape time, the connection pool and known-email filter numbers.
+`/internal/metrics` renders them in the Prometheus text format.
+
+Key Features:
+1. **No Lock on the Hot Path**: Every thread records into its own shard (a
+   plain dict only that thread writes), so requests never wait for each
+   other. A scrape adds the shards up; shards of finished threads are folded
+   into one so short-lived threads do not pile up.
+2. **Multiprocess Mode**: With `METRICS_MULTIPROC_DIR` set, every worker
+   writes its numbers to `metrics-<pid>.json` in that directory (at most every
+   `METRICS_FLUSH_INTERVAL` seconds, and on every scrape), and a scrape of any
+   worker adds up all files. Counters and histograms of exited workers are
+   kept, their gauges are dropped. Empty the directory when the server starts.
+3. **Bounded Labels**: Requests are labelled by blueprint and endpoint (the
+   route, not the URL), unmatched URLs share one label and unknown methods
+   are reported as `OTHER`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import bisect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from flask import current_app, g, has_app_context, request
+from app.datamanager.replica_routing import app_engines
+from app.monitoring.pool_metrics import WAIT_BUCKETS_MS, pool_stats
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds (bytes) of the per-request peak allocation buckets, 64 KiB to 256 MiB
+ALLOCATION_BUCKETS = tuple(64 * 1024 * 4 ** power for power in range(7))
+
+# Metric families: name -> (type, help)
+METRICS = {
+    'app_http_requests_total': (
+        'counter', 'Requests handled, by endpoint, method and status code.'),
+    'app_http_request_duration_seconds': (
+        'histogram', 'Request latency, by endpoint and method.'),
+    'app_http_request_peak_alloc_bytes': (
+        'histogram', 'Peak memory allocated by a request while tracemalloc traces, by endpoint.'),
+    'app_http_requests_in_flight': (
+        'gauge', 'Requests being handled, by endpoint.'),
+    'app_cache_requests_total': (
+        'counter', 'Cache lookups, by cache and result.'),
+    'app_db_pool_size': (
+        'gauge', 'Configured connection pool size, by bind.'),
+    'app_db_pool_connections': (
+        'gauge', 'Pool connections, by bind and state (checked_out, checked_in, overflow).'),
+    'app_db_pool_checkouts_total': (
+        'counter', 'Connection checkouts, by bind.'),
+    'app_db_pool_checkout_timeouts_total': (
+        'counter', 'Connection checkouts that timed out, by bind.'),
+    'app_db_pool_checkout_wait_seconds': (
+        'histogram', 'Time spent waiting for a pool connection, by bind.'),
+    'app_known_emails_items': (
+        'gauge', 'Emails in the known-email Bloom filter.'),
+    'app_known_emails_prechecks_skipped_total': (
+        'counter', 'Signups that skipped the email existence query.'),
+    'app_known_emails_false_positives_total': (
+        'counter', 'Known-email filter "maybe" answers that signup proved wrong.'),
+    'app_known_emails_false_positive_rate': (
+        'gauge', 'Known-email filter false-positive rate, by kind (configured, estimated).'),
+}
+
+# Bucket upper bounds of the histogram families
+HISTOGRAM_BUCKETS = {
+    'app_http_request_duration_seconds': LATENCY_BUCKETS,
+    'app_http_request_peak_alloc_bytes': ALLOCATION_BUCKETS,
+    'app_db_pool_checkout_wait_seconds': tuple(bound / 1000 for bound in WAIT_BUCKETS_MS),
+}
+
+_METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+_UNMATCHED = '<unmatched>'
+
+
+def _merge(into, samples, gauges=True):
+    """
+    Add `samples` into `into`. Values are numbers, or for histograms a list of
+    per-bucket counts (the last bucket is +Inf) followed by the sum.
+    """
+    for key, value in samples.items():
+        if not gauges and METRICS[key[0]][0] == 'gauge':
+            continue
+        if isinstance(value, list):
+            current = into.get(key)
+            into[key] = value[:] if current is None else [a + b for a, b in zip(current, value)]
+        else:
+            into[key] = into.get(key, 0) + value
+
+
+class _Shard:
+    """The samples one thread has recorded."""
+
+    __slots__ = ('thread', 'samples')
+
+    def __init__(self, thread):
+        self.thread = thread
+        self.samples = {}
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and histograms of one process.
+
+    Samples are keyed by `(name, labels)`, where labels is a tuple of
+    `(label, value)` pairs.
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+        self._retired = _Shard(None)
+        self._flush_lock = threading.Lock()
+        self._next_flush = 0.0
+
+    def _samples(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._shards.append(shard)
+        return shard.samples
+
+    def inc(self, name, labels=(), amount=1):
+        """Add to a counter or gauge (negative amounts for gauges only)."""
+        samples = self._samples()
+        key = (name, labels)
+        samples[key] = samples.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        """Record one value in a histogram."""
+        samples = self._samples()
+        key = (name, labels)
+        counts = samples.get(key)
+        buckets = HISTOGRAM_BUCKETS[name]
+        if counts is None:
+            counts = samples[key] = [0] * (len(buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(buckets, value)] += 1
+        counts[-1] += value
+
+    def snapshot(self):
+        """Return this process's recorded samples, added up over all threads."""
+        total = {}
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                if shard.thread.is_alive():
+                    live.append(shard)
+                else:
+                    # The thread is gone and cannot write to its shard anymore
+                    _merge(self._retired.samples, shard.samples)
+            self._shards = live
+            _merge(total, self._retired.samples)
+            for shard in live:
+                # dict.copy() is atomic, unlike iterating a dict another thread writes
+                _merge(total, shard.samples.copy())
+        return total
+
+    def process_samples(self):
+        """This process's samples plus the pool and filter numbers read now."""
+        samples = self.snapshot()
+        _merge(samples, scrape_samples())
+        return samples
+
+    def collect(self):
+        """
+        Return the samples to expose: this process's, or in multiprocess mode
+        the sum over every worker's file.
+        """
+        if not self.directory:
+            return self.process_samples()
+        self.flush()
+        total = {}
+        for pid, samples in self._read_processes():
+            _merge(total, samples, gauges=_is_alive(pid))
+        return total
+
+    def flush(self):
+        """Write this process's samples to its file in the multiprocess directory."""
+        samples = [[name, [list(pair) for pair in labels], value]
+                   for (name, labels), value in self.process_samples().items()]
+        handle, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'w') as tmp:
+            json.dump(samples, tmp)
+        os.replace(tmp_path, os.path.join(self.directory, f'metrics-{os.getpid()}.json'))
+
+    def maybe_flush(self):
+        """Flush if the flush interval has passed and no other thread is flushing."""
+        if not self.directory or time.monotonic() < self._next_flush:
+            return
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_flush = time.monotonic() + self.flush_interval
+            self.flush()
+        except OSError as e:
+            logger.warning('Could not write metrics to %s: %s', self.directory, e)
+        finally:
+            self._flush_lock.release()
+
+    def _read_processes(self):
+        for file_name in os.listdir(self.directory):
+            if not (file_name.startswith('metrics-') and file_name.endswith('.json')):
+                continue
+            try:
+                with open(os.path.join(self.directory, file_name)) as f:
+                    rows = json.load(f)
+            except (OSError, ValueError):
+                continue
+            yield (int(file_name[len('metrics-'):-len('.json')]),
+                   {(name, tuple(tuple(pair) for pair in labels)): value
+                    for name, labels, value in rows})
+
+
+def _is_alive(pid):
+    if pid == os.getpid() or os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def scrape_samples():
+    """Read the connection pool and known-email filter numbers (needs an app context)."""
+    samples = {}
+    for bind_key, engine in app_engines().items():
+        bind = (('bind', bind_key or 'default'),)
+        stats = pool_stats(engine)
+        if 'size' in stats:
+            samples[('app_db_pool_size', bind)] = stats['size']
+            for state in ('checked_out', 'checked_in', 'overflow'):
+                samples[('app_db_pool_connections', bind + (('state', state),))] = stats[state]
+        if 'checkouts' in stats:
+            samples[('app_db_pool_checkouts_total', bind)] = stats['checkouts']
+            samples[('app_db_pool_checkout_timeouts_total', bind)] = stats['timeouts']
+            cumulative = list(stats['wait_ms_buckets'].values())
+            counts = [count - previous for count, previous in zip(cumulative, [0] + cumulative)]
+            samples[('app_db_pool_checkout_wait_seconds', bind)] = \
+                counts + [stats['wait_ms_sum'] / 1000]
+
+    known_emails = current_app.extensions.get('known_emails')
+    if known_emails and known_emails['filter'] is not None:
+        samples[('app_known_emails_items', ())] = known_emails['filter'].count
+        samples[('app_known_emails_prechecks_skipped_total', ())] = known_emails['prechecks_skipped']
+        samples[('app_known_emails_false_positives_total', ())] = known_emails['false_positives']
+        bloom = known_emails['filter']
+        samples[('app_known_emails_false_positive_rate', (('kind', 'configured'),))] = \
+            float(bloom.error_rate)
+        samples[('app_known_emails_false_positive_rate', (('kind', 'estimated'),))] = \
+            bloom.estimated_false_positive_rate
+    return samples
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(
+        f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in labels) + '}'
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(samples):
+    """Render samples in the Prometheus text exposition format (version 0.0.4)."""
+    by_name = {}
+    for (name, labels), value in samples.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        if name not in by_name:
+            continue
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in sorted(by_name[name]):
+            if kind != 'histogram':
+                lines.append(f'{name}{_format_labels(labels)} {_format_number(value)}')
+                continue
+            running = 0
+            for bound, count in zip(HISTOGRAM_BUCKETS[name] + ('+Inf',), value[:-1]):
+                running += count
+                le = bound if bound == '+Inf' else repr(float(bound))
+                lines.append(f'{name}_bucket{_format_labels(labels + (("le", le),))} {running}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_number(value[-1])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {running}')
+    return '\n'.join(lines) + '\n'
+
+
+def count_cache(cache, hit):
+    """Count a lookup of the named cache."""
+    if has_app_context():
+        registry = current_app.extensions.get('metrics')
+        if registry is not None:
+            registry.inc('app_cache_requests_total',
+                         (('cache', cache), ('result', 'hit' if hit else 'miss')))
+
+
+def _start_request():
+    endpoint = request.endpoint or _UNMATCHED
+    endpoint_labels = (('blueprint', request.blueprint or ''), ('endpoint', endpoint))
+    g.metrics_request = [time.perf_counter(), endpoint_labels, False]
+    current_app.extensions['metrics'].inc('app_http_requests_in_flight', endpoint_labels)
+
+
+def _record(state, status):
+    registry = current_app.extensions['metrics']
+    started, endpoint_labels, _ = state
+    method = request.method if request.method in _METHODS else 'OTHER'
+    labels = endpoint_labels + (('method', method),)
+    registry.observe('app_http_request_duration_seconds', labels, time.perf_counter() - started)
+    registry.inc('app_http_requests_total', labels + (('status', str(status)),))
+    state[2] = True
+
+
+def _finish_request(response):
+    state = g.get('metrics_request')
+    if state is not None:
+        _record(state, response.status_code)
+    return response
+
+
+def _end_request(exception=None):
+    state = g.get('metrics_request')
+    if state is None:
+        return
+    if not state[2]:
+        # after_request never ran: the error escaped to the server
+        _record(state, 500)
+    registry = current_app.extensions['metrics']
+    registry.inc('app_http_requests_in_flight', state[1], -1)
+    registry.maybe_flush()
+
+
+def init_metrics(app):
+    """
+    Create the app's metrics registry and register the request hooks; call it
+    before `init_unit_of_work` so the request's commit is part of its latency.
+    """
+    if not app.config['METRICS_ENABLED']:
+        return
+    directory = app.config['METRICS_MULTIPROC_DIR']
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    app.extensions['metrics'] = MetricsRegistry(directory, app.config['METRICS_FLUSH_INTERVAL'])
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_end_request)
@@ -0,0 +1,157 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: pool_metrics.py
+Description:
+The `pool_metrics.py` file configures the SQLAlchemy connection pool from
+`Config` and instruments it, so pool exhaustion shows up in numbers instead of
+as unexplained slow requests.
+
+Key Features:
+1. **Pool Settings**: `engine_options()` turns the DB_POOL_* settings into
+   `SQLALCHEMY_ENGINE_OPTIONS` (size, overflow, recycle, pre-ping, timeout).
+2. **Checkout Timing**: `InstrumentedQueuePool` times every checkout into a
+   wait-time histogram and counts checkout timeouts.
+3. **Gauges**: `pool_stats()` reports connections in use, idle and in
+   overflow next to the counters, for the internal metrics endpoint.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (ms) of the checkout wait-time histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Thread-safe checkout counters and wait-time histogram for one pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_sum_ms = 0.0
+        self.wait_max_ms = 0.0
+        # One count per bucket plus the +Inf bucket
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def _observe(self, wait_ms):
+        self.wait_sum_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        for index, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.wait_buckets[index] += 1
+                return
+        self.wait_buckets[-1] += 1
+
+    def record_checkout(self, wait_ms):
+        with self._lock:
+            self.checkouts += 1
+            self._observe(wait_ms)
+
+    def record_timeout(self, wait_ms):
+        with self._lock:
+            self.timeouts += 1
+            self._observe(wait_ms)
+
+    def snapshot(self):
+        """Return the counters and the cumulative histogram as a dict."""
+        with self._lock:
+            cumulative, running = {}, 0
+            for bound, count in zip(WAIT_BUCKETS_MS + ('+Inf',), self.wait_buckets):
+                running += count
+                cumulative[str(bound)] = running
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'wait_ms_sum': round(self.wait_sum_ms, 3),
+                'wait_ms_max': round(self.wait_max_ms, 3),
+                'wait_ms_buckets': cumulative,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited.
+
+    The wait includes opening a new connection when the pool has none idle,
+    which is what a request actually experiences.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout((time.perf_counter() - started) * 1000)
+            raise
+        self.metrics.record_checkout((time.perf_counter() - started) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the history
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def _is_sqlite_memory(uri):
+    return uri.startswith('sqlite') and (uri in ('sqlite://', 'sqlite:///') or ':memory:' in uri)
+
+
+def engine_options(config):
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS from the DB_POOL_* settings.
+
+    In-memory SQLite keeps Flask-SQLAlchemy's single shared connection, since
+    a real pool would give every connection its own empty database.
+
+    Returns:
+    dict: Engine options; explicit SQLALCHEMY_ENGINE_OPTIONS entries win.
+    """
+    options = {}
+    if not _is_sqlite_memory(config.get('SQLALCHEMY_DATABASE_URI') or ''):
+        options = {
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': config['DB_POOL_SIZE'],
+            'max_overflow': config['DB_POOL_MAX_OVERFLOW'],
+            'pool_timeout': config['DB_POOL_TIMEOUT'],
+            'pool_recycle': config['DB_POOL_RECYCLE'],
+            'pool_pre_ping': config['DB_POOL_PRE_PING'],
+        }
+    options.update(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    return options
+
+
+def pool_stats(engine):
+    """
+    Report the gauges and counters of an engine's pool.
+
+    Returns:
+    dict: size, checked_out, checked_in, overflow, max_overflow and, for an
+          instrumented pool, the checkout metrics.
+    """
+    pool = engine.pool
+    stats = {'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            # Negative until the pool has opened `size` connections
+            'overflow': max(pool.overflow(), 0),
+            'max_overflow': pool._max_overflow,
+        })
+    metrics = getattr(pool, 'metrics', None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -0,0 +1,163 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: request_profiler.py
+Description:
+The `request_profiler.py` file profiles single production requests on
+demand, so a slow page can be examined against production data instead of a
+local copy that does not reproduce it.
+
+Key Features:
+1. **Opt-In per Request**: A request is run under cProfile only when it
+   carries `X-Profile: store|download` (or `?_profile=store|download`) and
+   the internal API token in `X-Internal-Token`. Anything else passes
+   straight through: the check is one environ lookup, no hooks, no profiler.
+2. **Bounded Ring on Disk**: `store` saves the pstats dump to `PROFILE_DIR`,
+   keeps the newest `PROFILE_KEEP` dumps and names the file in the
+   `X-Profile-Id` response header; `/internal/profiles` lists and serves
+   them.
+3. **Download**: `download` replaces the response with the pstats dump (the
+   profiled status is in `X-Profiled-Status`), for
+   `python -m pstats <file>` or snakeviz.
+4. **One at a Time**: cProfile hooks are interpreter-wide on current
+   Pythons, so only one request is profiled at a time; another profiling
+   request meanwhile runs unprofiled with `X-Profile: busy`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import cProfile
+import marshal
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qs
+from app.controllers.internal_controllers.internal_access import token_matches
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+PROFILE_QUERY_FLAG = '_profile'
+TOKEN_HEADER = 'HTTP_X_INTERNAL_TOKEN'
+PROFILE_SUFFIX = '.pstats'
+MODES = ('store', 'download')
+
+
+def _slug(path):
+    return re.sub(r'[^A-Za-z0-9]+', '_', path).strip('_')[:60] or 'root'
+
+
+def list_profiles(directory):
+    """
+    Return the stored dumps, newest first.
+
+    Returns:
+    list: dicts with the file name, size in bytes and modification time.
+    """
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(PROFILE_SUFFIX) and entry.is_file():
+            stat = entry.stat()
+            profiles.append({'name': entry.name, 'size': stat.st_size,
+                             'modified': stat.st_mtime})
+    # Names start with a zero-padded timestamp, so they sort by age
+    return sorted(profiles, key=lambda profile: profile['name'], reverse=True)
+
+
+class RequestProfiler:
+    """WSGI middleware running requests under cProfile on request."""
+
+    def __init__(self, app):
+        self.app = app
+        self.wsgi_app = app.wsgi_app
+        self._busy = threading.Lock()
+
+    def _requested_mode(self, environ):
+        mode = environ.get(PROFILE_HEADER)
+        if mode is None and PROFILE_QUERY_FLAG in environ.get('QUERY_STRING', ''):
+            mode = parse_qs(environ['QUERY_STRING']).get(PROFILE_QUERY_FLAG, [None])[0]
+        if mode is None:
+            return None
+        mode = mode.strip().lower() or 'store'
+        if mode not in MODES or not token_matches(self.app.config.get('INTERNAL_API_TOKEN'),
+                                                  environ.get(TOKEN_HEADER)):
+            return None
+        return mode
+
+    def __call__(self, environ, start_response):
+        mode = self._requested_mode(environ)
+        if mode is None:
+            return self.wsgi_app(environ, start_response)
+        if not self._busy.acquire(blocking=False):
+            def busy_start_response(status, headers, exc_info=None):
+                return start_response(status, headers + [('X-Profile', 'busy')], exc_info)
+            return self.wsgi_app(environ, busy_start_response)
+        try:
+            return self._profile(mode, environ, start_response)
+        finally:
+            self._busy.release()
+
+    def _profile(self, mode, environ, start_response):
+        response = {}
+
+        def capture_start_response(status, headers, exc_info=None):
+            response.update(status=status, headers=headers, exc_info=exc_info)
+            return lambda data: response.setdefault('written', []).append(data)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            app_iter = self.wsgi_app(environ, capture_start_response)
+            try:
+                # Consume the body under the profiler: streamed pages render here
+                body = b''.join(response.get('written', [])) + b''.join(app_iter)
+            finally:
+                if hasattr(app_iter, 'close'):
+                    app_iter.close()
+        finally:
+            profiler.disable()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        profiler.create_stats()
+        dump = marshal.dumps(profiler.stats)
+        name = (f'{time.time():017.6f}-{os.getpid()}-{environ.get("REQUEST_METHOD", "GET")}-'
+                f'{_slug(environ.get("PATH_INFO", ""))}-{elapsed_ms:.0f}ms{PROFILE_SUFFIX}')
+
+        if mode == 'download':
+            start_response('200 OK', [
+                ('Content-Type', 'application/octet-stream'),
+                ('Content-Disposition', f'attachment; filename="{name}"'),
+                ('Content-Length', str(len(dump))),
+                ('X-Profiled-Status', response['status']),
+            ])
+            return [dump]
+
+        self._store(name, dump)
+        headers = [(key, value) for key, value in response['headers']
+                   if key.lower() != 'content-length']
+        headers += [('Content-Length', str(len(body))), ('X-Profile-Id', name)]
+        start_response(response['status'], headers, response['exc_info'])
+        return [body]
+
+    def _store(self, name, dump):
+        """Write a dump and drop the oldest beyond PROFILE_KEEP."""
+        directory = self.app.config['PROFILE_DIR']
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = os.path.join(directory, name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(dump)
+        os.replace(tmp_path, os.path.join(directory, name))
+        for profile in list_profiles(directory)[self.app.config['PROFILE_KEEP']:]:
+            try:
+                os.remove(os.path.join(directory, profile['name']))
+            except FileNotFoundError:
+                # Another worker pruned it first
+                pass
+
+
+def init_request_profiler(app):
+    """Wrap the app's WSGI callable with the on-demand profiler."""
+    if app.config['PROFILER_ENABLED']:
+        app.wsgi_app = RequestProfiler(app)
@@ -0,0 +1,174 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: request_timing.py
+Description:
+The `request_timing.py` file shows where each request's time goes. It records
+wall time, the number and total time of SQL statements, template render time
+and cache hits/misses, then reports them in a `Server-Timing` response header
+(visible in the browser's network panel) and as one structured log line.
+
+Key Features:
+1. **SQL**: `before/after_cursor_execute` events on every engine count the
+   statements of the current request and add up their time; the unit of
+   work reports the time of the request's `COMMIT` through `record_commit`.
+2. **Templates**: Flask's `before_render_template` / `template_rendered`
+   signals time each `render_template` call.
+3. **Caches**: Cached code paths call `record_cache(cache, hit)`, which also
+   feeds the cache counters of `metrics.py`.
+4. **Cheap**: Per request this is one small object in a context variable and
+   two `perf_counter()` calls per statement; nothing is recorded outside of
+   requests, and the log line is only formatted when its level is enabled.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import json
+import logging
+import time
+from contextvars import ContextVar
+from flask import before_render_template, current_app, request, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.monitoring.metrics import count_cache
+
+logger = logging.getLogger('app.request_timing')
+
+# Key of a connection's statement start time in `Connection.info`
+_STATEMENT_STARTED = 'request_timing_started'
+
+# The timings of the request running in the current context, if any. Async
+# views run in a copy of the context, which still points at the same object.
+_current = ContextVar('request_timing', default=None)
+
+
+class RequestTiming:
+    """Counters of one request."""
+
+    __slots__ = ('started', 'sql_count', 'sql_seconds', 'commit_seconds', 'template_seconds',
+                 'template_started', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_seconds = 0.0
+        self.commit_seconds = 0.0
+        self.template_seconds = 0.0
+        self.template_started = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def server_timing(self, total_ms):
+        """Format the counters as a `Server-Timing` header value."""
+        return (f'total;dur={total_ms:.2f}, '
+                f'db;dur={(self.sql_seconds + self.commit_seconds) * 1000:.2f};'
+                f'desc="{self.sql_count} queries", '
+                f'tpl;dur={self.template_seconds * 1000:.2f}, '
+                f'cache;desc="hits={self.cache_hits} misses={self.cache_misses}"')
+
+
+def current_timing():
+    """Return the current request's `RequestTiming`, or None outside of requests."""
+    return _current.get()
+
+
+def record_cache(cache, hit):
+    """
+    Count a hit (True) or miss (False) of the named cache for the current
+    request and in the app's metrics.
+    """
+    count_cache(cache, hit)
+    timing = _current.get()
+    if timing is not None:
+        if hit:
+            timing.cache_hits += 1
+        else:
+            timing.cache_misses += 1
+
+
+def record_commit(seconds):
+    """
+    Add the time of a `COMMIT` to the current request's SQL time; the DBAPI
+    `commit()` fires no cursor events, so the unit of work reports it.
+    """
+    timing = _current.get()
+    if timing is not None:
+        timing.commit_seconds += seconds
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _statement_started(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info[_STATEMENT_STARTED] = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _statement_finished(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop(_STATEMENT_STARTED, None)
+    timing = _current.get()
+    if timing is not None and started is not None:
+        timing.sql_count += 1
+        timing.sql_seconds += time.perf_counter() - started
+
+
+def _template_started(sender, template, context, **extra):
+    timing = _current.get()
+    if timing is not None:
+        timing.template_started = time.perf_counter()
+
+
+def _template_finished(sender, template, context, **extra):
+    timing = _current.get()
+    if timing is not None and timing.template_started is not None:
+        timing.template_seconds += time.perf_counter() - timing.template_started
+        timing.template_started = None
+
+
+def start_request():
+    """Give the request a fresh set of counters."""
+    _current.set(RequestTiming())
+
+
+def finish_request(response):
+    """Add the `Server-Timing` header and log the request's timings."""
+    timing = _current.get()
+    if timing is None:
+        return response
+    total_ms = (time.perf_counter() - timing.started) * 1000
+    if current_app.config['SERVER_TIMING_HEADER']:
+        response.headers['Server-Timing'] = timing.server_timing(total_ms)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 2),
+            'sql_count': timing.sql_count,
+            'sql_ms': round(timing.sql_seconds * 1000, 2),
+            'commit_ms': round(timing.commit_seconds * 1000, 2),
+            'template_ms': round(timing.template_seconds * 1000, 2),
+            'cache_hits': timing.cache_hits,
+            'cache_misses': timing.cache_misses,
+        }))
+    return response
+
+
+def end_request(exception=None):
+    """Stop counting; statements after the request belong to no one."""
+    _current.set(None)
+
+
+def init_request_timing(app):
+    """
+    Register the request timing hooks; call it before `init_unit_of_work`
+    so `finish_request` runs after the commit and reports its time.
+    """
+    if not app.config['REQUEST_TIMING_ENABLED']:
+        return
+    app.before_request(start_request)
+    app.after_request(finish_request)
+    app.teardown_request(end_request)
+    before_render_template.connect(_template_started, app)
+    template_rendered.connect(_template_finished, app)
@@ -0,0 +1,201 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: sampling_profiler.py
+Description:
+The `sampling_profiler.py` file runs an always-on statistical profiler: a
+background thread looks at the stacks of the threads serving requests a few
+dozen times a second and counts them per endpoint. Under real traffic this
+shows continuously whether Jinja rendering, ORM hydration or password hashing
+dominates a route, without the cost of tracing every call like cProfile.
+
+Key Features:
+1. **Sampling Thread**: One daemon thread per process samples
+   `sys._current_frames()` every `1 / SAMPLING_PROFILER_HZ` seconds. Only
+   threads inside a request are walked; idle workers cost nothing.
+2. **Per-Endpoint Folded Stacks**: Each sample adds one to a
+   `module:function;...;module:function` key (root first) under the
+   request's endpoint, the "folded" format read by `flamegraph.pl`,
+   speedscope and inferno. At most `SAMPLING_PROFILER_MAX_STACKS` distinct
+   stacks are kept per endpoint; the rest count as `[other stacks]`.
+3. **Cheap Request Path**: A request only sets and clears its thread's
+   endpoint in a dict. The sampler measures its own busy time, reported as
+   `overhead` by `/internal/sampling`; at the default 25 Hz it stays well
+   under 1% of one core.
+4. **Fork Safe**: The thread is started by the first request of each
+   process, so prefork servers that load the app in the master get one
+   sampler per worker.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import os
+import sys
+import threading
+import time
+from flask import request
+
+# Key that collects the samples of stacks beyond the per-endpoint limit
+OTHER_STACKS = '[other stacks]'
+# Frames walked per sample, from the innermost one
+MAX_DEPTH = 128
+
+
+class SamplingProfiler:
+    """Process-wide stack sampler with per-endpoint folded stack counts."""
+
+    def __init__(self):
+        self.interval = 1 / 25
+        self.max_stacks = 2000
+        # Thread id -> endpoint of the request it is serving
+        self._active = {}
+        # Endpoint -> {folded stack: samples}
+        self._stacks = {}
+        # Code object -> 'module:qualname'
+        self._labels = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._started = None
+        self._busy_seconds = 0.0
+        self._samples = 0
+
+    def init_app(self, app):
+        """Attach the request hooks; the sampler starts on the first request."""
+        if not app.config['SAMPLING_PROFILER_ENABLED']:
+            return
+        self.interval = 1 / app.config['SAMPLING_PROFILER_HZ']
+        self.max_stacks = app.config['SAMPLING_PROFILER_MAX_STACKS']
+        app.before_request(self._request_started)
+        app.teardown_request(self._request_finished)
+        app.extensions['sampling_profiler'] = self
+
+    def _request_started(self):
+        if self._pid != os.getpid():
+            self.start()
+        self._active[threading.get_ident()] = request.endpoint or '<unmatched>'
+
+    def _request_finished(self, exc=None):
+        self._active.pop(threading.get_ident(), None)
+
+    def start(self):
+        """Start (or, in a forked child, restart) the sampling thread."""
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            # A forked child inherits the parent's counts but not its thread
+            self._stacks = {}
+            self._active = {}
+            self._busy_seconds = 0.0
+            self._samples = 0
+            self._stop = threading.Event()
+            self._started = time.perf_counter()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='sampling-profiler',
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the sampling thread (the counts are kept)."""
+        with self._lock:
+            thread, self._thread, self._pid = self._thread, None, None
+            self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        stop = self._stop
+        next_sample = time.perf_counter()
+        while True:
+            next_sample += self.interval
+            if stop.wait(max(0.0, next_sample - time.perf_counter())):
+                return
+            started = time.perf_counter()
+            if started - next_sample > self.interval:
+                # Fell behind (e.g. a long GIL hold); skip the missed samples
+                next_sample = started
+            self.sample()
+            self._busy_seconds += time.perf_counter() - started
+
+    def _label(self, frame):
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            label = (f"{frame.f_globals.get('__name__', '?')}:"
+                     f"{getattr(code, 'co_qualname', code.co_name)}")
+            self._labels[code] = label
+        return label
+
+    def sample(self):
+        """Count the current stack of every thread serving a request."""
+        active = list(self._active.items())
+        if not active:
+            return
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, endpoint in active:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < MAX_DEPTH:
+                    labels.append(self._label(frame))
+                    frame = frame.f_back
+                folded = ';'.join(reversed(labels))
+                counts = self._stacks.setdefault(endpoint, {})
+                if folded not in counts and len(counts) >= self.max_stacks:
+                    folded = OTHER_STACKS
+                counts[folded] = counts.get(folded, 0) + 1
+            self._samples += 1
+        del frames
+
+    def folded(self, endpoint=None):
+        """
+        Return the counts in the folded stack format, heaviest stacks first.
+
+        Parameters:
+        endpoint (str): Only this endpoint's stacks. Without it, every
+                        endpoint's stacks are returned under a root frame
+                        named after the endpoint.
+
+        Returns:
+        str: One `frame;frame;... count` line per stack.
+        """
+        with self._lock:
+            if endpoint is not None:
+                counts = dict(self._stacks.get(endpoint, {}))
+            else:
+                counts = {f'{name};{stack}': samples for name, stacks in self._stacks.items()
+                          for stack, samples in stacks.items()}
+        return ''.join(f'{stack} {samples}\n' for stack, samples in
+                       sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def stats(self):
+        """Return the sampler's state, overhead and samples per endpoint."""
+        with self._lock:
+            endpoints = {name: sum(stacks.values()) for name, stacks in self._stacks.items()}
+            running = self._thread is not None and self._pid == os.getpid()
+            elapsed = time.perf_counter() - self._started if self._started else 0.0
+            return {
+                'running': running,
+                'hz': round(1 / self.interval, 2),
+                'ticks': self._samples,
+                'overhead': round(self._busy_seconds / elapsed, 6) if elapsed else 0.0,
+                'endpoints': dict(sorted(endpoints.items(), key=lambda item: item[1],
+                                         reverse=True)),
+            }
+
+    def reset(self):
+        """Drop the counts collected so far."""
+        with self._lock:
+            self._stacks = {}
+
+
+sampling_profiler = SamplingProfiler()
+
+
+def init_sampling_profiler(app):
+    """Sample the app's request threads with the process-wide sampler."""
+    sampling_profiler.init_app(app)
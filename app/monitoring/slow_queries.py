@@ -0,0 +1,205 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: slow_queries.py
+Description:
+The `slow_queries.py` file logs SQL statements slower than
+`SLOW_QUERY_THRESHOLD_MS`, so a slow character list for a big user shows up
+in the logs before it shows up in user complaints.
+
+Key Features:
+1. **Context**: Each slow statement is logged as one JSON line on the
+   `app.slow_queries` logger with its duration, SQL, parameters (unless
+   `SLOW_QUERY_LOG_PARAMETERS` is off), route and session user id.
+2. **Plans Off the Request Path**: The statement's plan is captured on a
+   single background thread, on its own pooled connection, and logged as a
+   second line with the same `id`. PostgreSQL gets
+   `EXPLAIN (ANALYZE off, FORMAT JSON)`, SQLite `EXPLAIN QUERY PLAN`; neither
+   runs the statement. At most `EXPLAIN_QUEUE_SIZE` plans wait at a time.
+3. **Rate Limited**: At most `SLOW_QUERY_LOG_PER_MINUTE` statements are
+   logged (and explained) per minute and process; the next logged line
+   reports how many were suppressed, so a slow database under load does not
+   get extra EXPLAINs and log volume on top.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import itertools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from flask import has_request_context, request, session
+from sqlalchemy import event
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+from app.datamanager.replica_routing import app_engines
+
+logger = logging.getLogger('app.slow_queries')
+
+# Key of a connection's statement start time in `Connection.info`
+_STATEMENT_STARTED = 'slow_query_started'
+# Execution option that, set to False, keeps a statement out of the log (the
+# EXPLAIN statements themselves)
+_LOG_OPTION = 'slow_query_log'
+# Plans waiting for (or being captured by) the background thread, at most
+EXPLAIN_QUEUE_SIZE = 4
+# Longest SQL text and parameter text logged
+MAX_TEXT_LENGTH = 2000
+
+_EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+
+def _truncate(text):
+    return text if len(text) <= MAX_TEXT_LENGTH else text[:MAX_TEXT_LENGTH] + '...'
+
+
+class SlowQueryLog:
+    """Slow statement detection, rate limiting and plan capture for one app."""
+
+    def __init__(self, threshold_ms, per_minute, explain, log_parameters):
+        self.threshold = threshold_ms / 1000
+        self.per_minute = per_minute
+        self.explain = explain
+        self.log_parameters = log_parameters
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._window_started = time.monotonic()
+        self._logged_in_window = 0
+        self._suppressed = 0
+        self._pending = set()
+        self._executor = None
+
+    def _admit(self):
+        """
+        Take a slot in the current minute.
+
+        Returns:
+        int or None: The number of statements suppressed since the last
+                     logged one, or None if this one is suppressed too.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_started >= 60:
+                self._window_started = now
+                self._logged_in_window = 0
+            if self._logged_in_window >= self.per_minute:
+                self._suppressed += 1
+                return None
+            self._logged_in_window += 1
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+
+    def record(self, engine, bind, statement, parameters, executemany, seconds):
+        """Log a slow statement and queue its plan, rate limits permitting."""
+        suppressed = self._admit()
+        if suppressed is None:
+            return
+        line = {
+            'id': next(self._ids),
+            'duration_ms': round(seconds * 1000, 2),
+            'statement': _truncate(' '.join(statement.split())),
+            'parameters': _truncate(repr(parameters)) if self.log_parameters else None,
+            'executemany': executemany,
+            'bind': bind,
+            'method': None,
+            'route': None,
+            'user_id': None,
+            'suppressed': suppressed,
+        }
+        if has_request_context():
+            line.update(method=request.method, route=request.endpoint or request.path,
+                        user_id=session.get('user_id'))
+        logger.warning(json.dumps(line, default=str))
+        if self.explain and not executemany:
+            self._queue_explain(engine, line['id'], statement, parameters)
+
+    def _queue_explain(self, engine, query_id, statement, parameters):
+        if not statement.lstrip()[:6].upper().startswith(_EXPLAINABLE):
+            return
+        if isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+            # One shared connection: the EXPLAIN would run inside (and roll
+            # back) the transaction of the request that is still using it
+            return
+        with self._lock:
+            if len(self._pending) >= EXPLAIN_QUEUE_SIZE:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix='slow-query-explain')
+            future = self._executor.submit(_log_plan, engine, query_id, statement, parameters)
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def wait(self, timeout=None):
+        """Wait for the queued plans to be logged (for tests and shutdown)."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending, timeout=timeout)
+
+
+def _explain_sql(dialect_name, statement):
+    if dialect_name == 'postgresql':
+        return 'EXPLAIN (ANALYZE off, FORMAT JSON) ' + statement
+    if dialect_name == 'sqlite':
+        return 'EXPLAIN QUERY PLAN ' + statement
+    return None
+
+
+def _log_plan(engine, query_id, statement, parameters):
+    """Capture and log a statement's plan; runs on the background thread."""
+    sql = _explain_sql(engine.dialect.name, statement)
+    if sql is None:
+        return
+    try:
+        with engine.connect() as connection:
+            rows = connection.execution_options(**{_LOG_OPTION: False}).exec_driver_sql(
+                sql, parameters).fetchall()
+    except Exception as e:  # the plan is best effort; never let it surface
+        logger.info(json.dumps({'id': query_id, 'plan_error': str(e)}))
+        return
+    if engine.dialect.name == 'postgresql':
+        plan = rows[0][0]
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+    else:
+        plan = [list(row) for row in rows]
+    logger.warning(json.dumps({'id': query_id, 'plan': plan}, default=str))
+
+
+def _listen(engine, bind, slow_log):
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _statement_started(conn, cursor, statement, parameters, context, executemany):
+        conn.info[_STATEMENT_STARTED] = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _statement_finished(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop(_STATEMENT_STARTED, None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        if seconds >= slow_log.threshold and \
+                (context is None or context.execution_options.get(_LOG_OPTION, True)):
+            slow_log.record(engine, bind, statement, parameters, executemany, seconds)
+
+
+def init_slow_query_log(app):
+    """
+    Log the statements of the app's engines (default and binds) that exceed
+    `SLOW_QUERY_THRESHOLD_MS`; a threshold of 0 turns the log off. Must run
+    after `db.init_app(app)`.
+    """
+    if app.config['SLOW_QUERY_THRESHOLD_MS'] <= 0 or app.extensions.get('slow_query_log'):
+        return
+    slow_log = SlowQueryLog(app.config['SLOW_QUERY_THRESHOLD_MS'],
+                            app.config['SLOW_QUERY_LOG_PER_MINUTE'],
+                            app.config['SLOW_QUERY_EXPLAIN'],
+                            app.config['SLOW_QUERY_LOG_PARAMETERS'])
+    with app.app_context():
+        for bind_key, engine in app_engines().items():
+            _listen(engine, bind_key or 'default', slow_log)
+    app.extensions['slow_query_log'] = slow_log
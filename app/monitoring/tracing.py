@@ -0,0 +1,409 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: tracing.py
+Description:
+The `tracing.py` file records a tree of timed spans for sampled requests, so
+a slow route can be broken down into the step that is slow: the controller,
+a helper such as `fetch_character_data` or `find_or_create_house`, a single
+SQL statement or the template render.
+
+Key Features:
+1. **Span Tree**: The request is the root span (started on Flask's
+   `request_started` signal, so it covers every hook including the commit).
+   The view (controller), functions decorated with `@traced`, blocks in
+   `with span(...)`, SQL statements and template renders become child spans
+   of whatever span is current.
+2. **Head-Based Sampling**: Whether a request is traced is decided once, when
+   it starts: an incoming W3C `traceparent` header's sampled flag is
+   followed (and its trace id kept); otherwise `TRACING_SAMPLE_RATE` of the
+   requests are traced. An unsampled request pays one context variable
+   lookup per would-be span.
+3. **Cheap Spans**: A span is a slotted object with a monotonic start and
+   end; ids, timestamps and attributes are encoded only when exported. Span
+   creation costs a microsecond or two.
+4. **Export Off the Request Path**: Finished traces are queued (at most
+   `TRACING_QUEUE_SIZE`, further ones are dropped and counted) and a
+   background thread writes them in batches as OTLP/JSON: one export
+   request per line to `TRACING_FILE`, or POSTed to an OTLP/HTTP collector
+   at `TRACING_OTLP_ENDPOINT`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from flask import (before_render_template, request, request_finished, request_started,
+                   request_tearing_down, template_rendered)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kinds
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+EXPORTERS = ('file', 'otlp')
+# Spans written or POSTed per export request, at most
+BATCH_SIZE = 512
+# Seconds a started batch waits for more spans before it is exported
+BATCH_INTERVAL = 1.0
+# Longest SQL text kept on a statement span
+MAX_STATEMENT_LENGTH = 1000
+# Name prefix of template render spans
+RENDER = 'render '
+
+# Key of a connection's statement span in `Connection.info`
+_STATEMENT_SPAN = 'tracing_span'
+# Converts `perf_counter_ns()` readings to Unix time
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+_TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+
+# The current span, or None outside of sampled requests. Coroutines and tasks
+# run in a copy of the context, so their spans still join the request's trace.
+_current = ContextVar('tracing_span', default=None)
+
+
+class _Trace:
+    """The finished spans of one request."""
+
+    __slots__ = ('trace_id', 'spans')
+
+    def __init__(self, trace_id):
+        self.trace_id = trace_id
+        self.spans = []
+
+
+class Span:
+    """A timed step of a traced request; ends with `end()` or a `with` block."""
+
+    __slots__ = ('trace', 'parent', 'parent_id', 'span_id', 'name', 'kind', 'attributes',
+                 'start', 'end_time', 'error')
+
+    def __init__(self, trace, parent, name, kind=KIND_INTERNAL, attributes=None, parent_id=None):
+        self.trace = trace
+        self.parent = parent
+        self.parent_id = parent.span_id if parent is not None else parent_id
+        self.span_id = random.getrandbits(64) or 1
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.error = None
+        self.end_time = None
+        self.start = time.perf_counter_ns()
+
+    def set(self, key, value):
+        """Set an attribute."""
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
+
+    def end(self, error=None):
+        """End the span and make its parent the current span again."""
+        self.end_time = time.perf_counter_ns()
+        if error is not None:
+            self.error = f'{type(error).__name__}: {error}'
+        self.trace.spans.append(self)
+        _current.set(self.parent)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end(exc)
+        return False
+
+
+class _NoopSpan:
+    """Stands in for spans of requests that are not sampled."""
+
+    __slots__ = ()
+
+    def set(self, key, value):
+        pass
+
+    def end(self, error=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name, kind=KIND_INTERNAL, attributes=None):
+    """
+    Start a child of the current span and make it current.
+
+    Returns:
+    Span: The new span, or a no-op stand-in outside of sampled requests.
+          Use it in a `with` block, or call `end()`.
+    """
+    parent = _current.get()
+    if parent is None:
+        return _NOOP
+    child = Span(parent.trace, parent, name, kind, attributes)
+    _current.set(child)
+    return child
+
+
+def traced(func=None, *, name=None):
+    """Decorator running every call of a function (sync or async) in a span."""
+    if func is None:
+        return functools.partial(traced, name=name)
+    span_name = name or func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return await func(*args, **kwargs)
+            with span(span_name):
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current.get() is None:
+            return func(*args, **kwargs)
+        with span(span_name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def current_trace_id():
+    """Return the current trace id as 32 hex digits, or None if not traced."""
+    current = _current.get()
+    return f'{current.trace.trace_id:032x}' if current is not None else None
+
+
+def _parse_traceparent(header):
+    """
+    Return `(trace_id, parent_span_id, sampled)` of a W3C `traceparent`
+    header, or `(None, None, None)` if it is missing or invalid.
+    """
+    match = _TRACEPARENT.match(header or '')
+    if match is None:
+        return None, None, None
+    trace_id, parent_id = int(match.group(1), 16), int(match.group(2), 16)
+    if not trace_id or not parent_id:
+        return None, None, None
+    return trace_id, parent_id, bool(int(match.group(3), 16) & 1)
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+def _otlp_span(finished):
+    encoded = {
+        'traceId': f'{finished.trace.trace_id:032x}',
+        'spanId': f'{finished.span_id:016x}',
+        'name': finished.name,
+        'kind': finished.kind,
+        'startTimeUnixNano': str(_EPOCH_OFFSET_NS + finished.start),
+        'endTimeUnixNano': str(_EPOCH_OFFSET_NS + finished.end_time),
+        'attributes': [_attribute(key, value)
+                       for key, value in (finished.attributes or {}).items()],
+        'status': {'code': 2, 'message': finished.error} if finished.error else {},
+    }
+    if finished.parent_id:
+        encoded['parentSpanId'] = f'{finished.parent_id:016x}'
+    return encoded
+
+
+def otlp_payload(spans, service_name):
+    """Encode finished spans as an OTLP/JSON trace export request."""
+    return {'resourceSpans': [{
+        'resource': {'attributes': [_attribute('service.name', service_name)]},
+        'scopeSpans': [{'scope': {'name': __name__},
+                        'spans': [_otlp_span(finished) for finished in spans]}],
+    }]}
+
+
+class Tracer:
+    """Sampling decision and background export of one app's traces."""
+
+    def __init__(self, exporter, sample_rate, service_name, queue_size, file_path=None,
+                 otlp_endpoint=None):
+        if exporter not in EXPORTERS:
+            raise ValueError(f'TRACING_EXPORTER must be one of {", ".join(EXPORTERS)}')
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self.file_path = file_path
+        self.otlp_url = (otlp_endpoint or '').rstrip('/') + '/v1/traces'
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def export(self, trace):
+        """Queue a finished trace for the export thread (never blocks)."""
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(trace.spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # A forked child starts with an empty queue and its own thread
+            self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            threading.Thread(target=self._run, name='trace-export', daemon=True).start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        export_queue = self._queue
+        while True:
+            batch = list(export_queue.get())
+            taken = 1
+            deadline = time.monotonic() + BATCH_INTERVAL
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.extend(export_queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+                taken += 1
+            try:
+                self._write(otlp_payload(batch, self.service_name))
+            except Exception as e:  # export is best effort; keep the thread alive
+                logger.warning('Could not export %d spans: %s', len(batch), e)
+            finally:
+                for _ in range(taken):
+                    export_queue.task_done()
+
+    def _write(self, payload):
+        data = json.dumps(payload, separators=(',', ':'))
+        if self.exporter == 'file':
+            with open(self.file_path, 'a', encoding='utf-8') as f:
+                f.write(data + '\n')
+            return
+        urllib.request.urlopen(urllib.request.Request(
+            self.otlp_url, data=data.encode(), method='POST',
+            headers={'Content-Type': 'application/json'}), timeout=5).close()
+
+    def flush(self, timeout=5.0):
+        """Wait until the queued traces are exported (for tests and shutdown)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+def _start_request(sender, **extra):
+    tracer = sender.extensions['tracing']
+    trace_id, parent_id, sampled = _parse_traceparent(request.headers.get('traceparent'))
+    if sampled is None:
+        sampled = random.random() < tracer.sample_rate
+    if not sampled:
+        _current.set(None)
+        return
+    rule = request.url_rule
+    root = Span(_Trace(trace_id or random.getrandbits(128) or 1), None,
+                f'{request.method} {request.endpoint or "<unmatched>"}', KIND_SERVER,
+                {'http.method': request.method, 'http.route': rule.rule if rule else '',
+                 'http.target': request.path}, parent_id)
+    _current.set(root)
+
+
+def _finish_request(sender, response, **extra):
+    current = _current.get()
+    if current is not None:
+        current.set('http.status_code', response.status_code)
+
+
+def _end_request(sender, exc=None, **extra):
+    current = _current.get()
+    if current is None:
+        return
+    # Spans left open by an error (e.g. a failed render) are not exported
+    root = current
+    while root.parent is not None:
+        root = root.parent
+    root.end(exc)
+    _current.set(None)
+    sender.extensions['tracing'].export(root.trace)
+
+
+def _statement_started(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info[_STATEMENT_SPAN] = span('sql', KIND_CLIENT, {
+            'db.system': conn.dialect.name,
+            'db.statement': statement[:MAX_STATEMENT_LENGTH],
+        })
+
+
+def _statement_finished(conn, cursor, statement, parameters, context, executemany):
+    statement_span = conn.info.pop(_STATEMENT_SPAN, None)
+    if statement_span is not None:
+        statement_span.end()
+
+
+def _statement_failed(exception_context):
+    connection = exception_context.connection
+    statement_span = connection.info.pop(_STATEMENT_SPAN, None) if connection is not None else None
+    if statement_span is not None:
+        statement_span.end(exception_context.original_exception)
+
+
+def _template_started(sender, template, context, **extra):
+    span(RENDER + (template.name or 'template'))
+
+
+def _template_finished(sender, template, context, **extra):
+    current = _current.get()
+    if current is not None and current.name.startswith(RENDER):
+        current.end()
+
+
+def init_tracing(app):
+    """
+    Trace `TRACING_SAMPLE_RATE` of the app's requests and export them with
+    `TRACING_EXPORTER` (`file` or `otlp`; unset turns tracing off). Call it
+    after the blueprints are registered: their views get controller spans.
+    """
+    exporter = app.config['TRACING_EXPORTER']
+    if not exporter:
+        return
+    app.extensions['tracing'] = Tracer(exporter, app.config['TRACING_SAMPLE_RATE'],
+                                       app.config['TRACING_SERVICE_NAME'],
+                                       app.config['TRACING_QUEUE_SIZE'],
+                                       app.config['TRACING_FILE'],
+                                       app.config['TRACING_OTLP_ENDPOINT'])
+    for endpoint, view in list(app.view_functions.items()):
+        app.view_functions[endpoint] = traced(view)
+    request_started.connect(_start_request, app)
+    request_finished.connect(_finish_request, app)
+    request_tearing_down.connect(_end_request, app)
+    before_render_template.connect(_template_started, app)
+    template_rendered.connect(_template_finished, app)
+    if not event.contains(Engine, 'before_cursor_execute', _statement_started):
+        event.listen(Engine, 'before_cursor_execute', _statement_started)
+        event.listen(Engine, 'after_cursor_execute', _statement_finished)
+        event.listen(Engine, 'handle_error', _statement_failed)
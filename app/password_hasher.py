@@ -0,0 +1,192 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: password_hasher.py
+Description:
+The `password_hasher.py` file moves password hashing and verification off the
+request thread and into a small, bounded process pool. Hashing is deliberately
+CPU-heavy, so a burst of logins or signups used to pin every web worker for
+tens of milliseconds each and starve unrelated routes.
+
+Key Features:
+1. **Bounded Worker Pool**: A lazily created `ProcessPoolExecutor` per app runs
+   `generate_password_hash` / `check_password_hash` on dedicated processes.
+2. **Backpressure**: The number of in-flight jobs (running + queued) is capped.
+   When the cap is reached the request fails fast with `PasswordHashPoolBusy`,
+   which the registered error handler turns into a `503` with `Retry-After`.
+3. **Tunable Cost**: The hash method (e.g. `pbkdf2:sha256:600000`) and salt
+   length come from the app configuration.
+4. **Rehash-on-Login**: `needs_rehash` reports hashes made with older
+   parameters so the login flow can transparently upgrade them; shorthand
+   methods such as `scrypt` are compared in their expanded form.
+5. **Inline Mode**: `PASSWORD_HASH_POOL_SIZE = 0` hashes on the calling thread
+   (still bounded), which is handy for tests and single-process tools.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+============================================================================="""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class PasswordHashPoolBusy(Exception):
+    """Raised when the hashing pool has no free slot or a job timed out."""
+
+
+class _HashPool:
+    """
+    Per-app hashing state: the executor and the slot semaphore that bounds
+    the number of running + queued hashing jobs.
+    """
+
+    def __init__(self, config):
+        self.method = config['PASSWORD_HASH_METHOD']
+        self.salt_length = config['PASSWORD_HASH_SALT_LENGTH']
+        self.pool_size = config['PASSWORD_HASH_POOL_SIZE']
+        self.timeout = config['PASSWORD_HASH_TIMEOUT']
+        self.start_method = config['PASSWORD_HASH_POOL_START_METHOD']
+        self.slots = threading.BoundedSemaphore(
+            max(1, self.pool_size) + config['PASSWORD_HASH_QUEUE_DEPTH'])
+        self._executor = None
+        self._lock = threading.Lock()
+        self._stored_method = None
+
+    @property
+    def stored_method(self):
+        """
+        The method as werkzeug writes it into hashes: shorthands are expanded
+        (`scrypt` becomes `scrypt:32768:8:1`, `pbkdf2` becomes
+        `pbkdf2:sha256:600000`), so it is read from one probe hash.
+        """
+        if self._stored_method is None:
+            self._stored_method = generate_password_hash('', self.method, 1).split('$', 1)[0]
+        return self._stored_method
+
+    @property
+    def executor(self):
+        """Create the process pool on first use (i.e. after any pre-fork)."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.pool_size,
+                        mp_context=multiprocessing.get_context(self.start_method))
+        return self._executor
+
+    def run(self, func, *args):
+        """
+        Run `func(*args)` on the pool, or inline when the pool size is 0.
+
+        Raises:
+            PasswordHashPoolBusy: if every slot is taken or the job times out.
+        """
+        if not self.slots.acquire(blocking=False):
+            raise PasswordHashPoolBusy('Password hashing pool is saturated.')
+
+        if self.pool_size <= 0:
+            try:
+                return func(*args)
+            finally:
+                self.slots.release()
+
+        try:
+            future = self.executor.submit(func, *args)
+        except Exception:
+            self.slots.release()
+            raise
+        # The slot is held until the job really finishes, even if we stop waiting
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise PasswordHashPoolBusy('Password hashing timed out.')
+
+    def shutdown(self):
+        """Stop the worker processes, if they were ever started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class PasswordHasher:
+    """
+    Flask extension exposing `hash`, `verify` and `needs_rehash`.
+
+    The pool itself is built lazily from the current app's configuration, so
+    settings changed after `create_app` (as the tests do) still apply.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Register default settings and the 503 error handler on the app."""
+        app.config.setdefault('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+        app.config.setdefault('PASSWORD_HASH_SALT_LENGTH', 16)
+        app.config.setdefault('PASSWORD_HASH_POOL_SIZE', 2)
+        app.config.setdefault('PASSWORD_HASH_QUEUE_DEPTH', 8)
+        app.config.setdefault('PASSWORD_HASH_TIMEOUT', 5.0)
+        app.config.setdefault('PASSWORD_HASH_POOL_START_METHOD', 'spawn')
+        app.extensions['password_hasher'] = None
+        app.register_error_handler(PasswordHashPoolBusy, handle_pool_busy)
+
+    @staticmethod
+    def _pool():
+        """Return the hashing pool for the current app, creating it if needed."""
+        pool = current_app.extensions.get('password_hasher')
+        if pool is None:
+            pool = _HashPool(current_app.config)
+            current_app.extensions['password_hasher'] = pool
+        return pool
+
+    def hash(self, password):
+        """
+        Hash a password with the configured method and salt length.
+
+        Parameters:
+        password (str): The plain-text password.
+
+        Returns:
+        str: The werkzeug-formatted password hash.
+        """
+        pool = self._pool()
+        return pool.run(generate_password_hash, password, pool.method, pool.salt_length)
+
+    def verify(self, pwhash, password):
+        """
+        Check a plain-text password against a stored hash.
+
+        Returns:
+        bool: True if the password matches, False otherwise.
+        """
+        return self._pool().run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """
+        Check whether a stored hash was made with different parameters than
+        the ones currently configured.
+
+        Returns:
+        bool: True if the hash should be regenerated on the next login.
+        """
+        pool = self._pool()
+        if not pwhash or pwhash.count('$') < 2:
+            return True
+        method, salt, _ = pwhash.split('$', 2)
+        return method != pool.stored_method or len(salt) != pool.salt_length
+
+
+def handle_pool_busy(error):
+    """Fail fast with a 503 so clients back off instead of piling up."""
+    current_app.logger.warning('Password hashing rejected: %s', error)
+    return ('The service is busy right now. Please try again in a moment.',
+            503,
+            {'Retry-After': '1'})
+
+
+password_hasher = PasswordHasher()
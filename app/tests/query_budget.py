@@ -0,0 +1,77 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: query_budget.py
+Description:
+The `query_budget.py` file is a test utility that counts the SQL statements
+run inside a block and fails the test when they exceed a budget. Wrapping a
+test client request in it catches N+1 regressions, e.g. a template that
+starts lazy-loading a relationship for every row.
+
+Key Features:
+1. **`query_budget(budget)`**: A context manager that counts every statement
+   executed on any engine and raises `AssertionError`, listing them, when
+   the count is over budget. It yields the list of statements seen.
+2. **`ROUTE_BUDGETS` / `route_budget(route)`**: The declared budget of each
+   route on SQLite, so every test exercising a route holds it to the same
+   number.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Most statements a request may run, by "METHOD endpoint". None of them may
+# grow with the number of rows shown.
+ROUTE_BUDGETS = {
+    # Look the user up by email
+    'POST auth.login': 1,
+    # Logged-in user
+    'GET user.user_dashboard': 1,
+    # User, count, page (with house, role and strength joined)
+    'GET user.my_character_list': 3,
+    # User, houses, roles, strengths for the form
+    'GET user.user_add_character': 4,
+    # User, a select per existing house/role/strength named, insert-if-absent
+    # (a new lookup name adds an insert and a select)
+    'POST user.user_add_character': 5,
+    # User, character, houses, roles, strengths
+    'GET user.user_edit_character': 5,
+    # The above, the name check of a rename and the versioned update
+    'POST user.user_edit_character': 7,
+    # User, delete
+    'POST user.delete_character': 2,
+}
+
+
+@contextmanager
+def query_budget(budget, label='block'):
+    """
+    Fail when the block runs more than `budget` SQL statements.
+
+    Yields:
+    list: The statements run so far (filled in while the block runs).
+    """
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, 'after_cursor_execute', count)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, 'after_cursor_execute', count)
+    if len(statements) > budget:
+        listing = '\n'.join(f'  {number}. {" ".join(statement.split())}'
+                            for number, statement in enumerate(statements, 1))
+        raise AssertionError(f'{label} ran {len(statements)} SQL statements, '
+                             f'over its budget of {budget}:\n{listing}')
+
+
+def route_budget(route):
+    """`query_budget` with the declared budget of a route ("METHOD endpoint")."""
+    return query_budget(ROUTE_BUDGETS[route], route)
@@ -0,0 +1,100 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_add_character_on_conflict.py
+Description:
+The `test_add_character_on_conflict.py` file tests the single-roundtrip
+add-character path, which relies on the unique `(user_id, name)` constraint
+and `INSERT ... ON CONFLICT DO NOTHING RETURNING id`. It runs against a
+throw-away SQLite database, which supports the same clause as PostgreSQL.
+
+Key Features:
+1. **Insert Helper**: The first insert returns the new id, a duplicate
+   returns None, and another user may reuse the same name.
+2. **Add Character Route**: Submitting the same character twice creates
+   one row and reports that it already exists, each within the route's
+   SQL statement budget.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from app import create_app
+from app.models import db, User, Character, House, Role, Strength
+from app.controllers.common_fun import insert_character_if_absent
+from app.tests.query_budget import route_budget
+
+
+class TestAddCharacterOnConflict(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database with two users."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            first = User(username='first', email='first@example.com',
+                         date_of_birth=date(1990, 1, 1))
+            first.set_password('Test@1234')
+            second = User(username='second', email='second@example.com',
+                          password='x', date_of_birth=date(1990, 1, 1))
+            # Jon Snow's lookups exist already, as they do for most adds
+            db.session.add_all([first, second, House(name='Stark'), Role(name='King'),
+                                Strength(name='Physically strong')])
+            db.session.commit()
+            self.first_id, self.second_id = first.id, second.id
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_insert_character_if_absent(self):
+        with self.app.app_context():
+            values = {'name': 'Jon Snow', 'user_id': self.first_id}
+            first_id = insert_character_if_absent(values)
+            self.assertIsNotNone(first_id)
+            self.assertIsNone(insert_character_if_absent(values))
+            # The same name is still free for another user
+            self.assertIsNotNone(insert_character_if_absent(
+                {'name': 'Jon Snow', 'user_id': self.second_id}))
+            db.session.commit()
+            self.assertEqual(Character.query.filter_by(name='Jon Snow').count(), 2)
+
+    def test_add_character_twice_creates_one_row(self):
+        self.client.post('/auth/login', data={'email': 'first@example.com',
+                                              'password': 'Test@1234'})
+
+        with route_budget('POST user.user_add_character'):
+            first = self.client.post('/user/add_character', data={'name': 'Jon'})
+        self.assertEqual(first.status_code, 302)
+        with route_budget('POST user.user_add_character'):
+            second = self.client.post('/user/add_character', data={'name': 'Jon'})
+        self.assertEqual(second.status_code, 302)
+        second = self.client.get(second.location)
+        self.assertEqual(second.status_code, 200)
+        self.assertIn(b'Character with this name already exists.', second.data)
+
+        with self.app.app_context():
+            characters = Character.query.filter_by(user_id=self.first_id).all()
+            self.assertEqual([c.name for c in characters], ['Jon Snow'])
+            self.assertEqual(characters[0].house.name, 'Stark')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_async_data_manager.py
+Description:
+The `test_async_data_manager.py` file checks that `AsyncPostgreSQLDataManager`
+behaves like `PostgreSQLDataManager`: both managers run against the same
+throw-away SQLite database (the async one through aiosqlite) and must return
+the same results.
+
+Key Features:
+1. **CRUD Parity**: Rows written by one manager are read back identically by
+   the other.
+2. **Bulk Parity**: Bulk inserts, updates and lookup upserts give the same
+   results as the synchronous methods.
+3. **Reports and Rollups**: Both managers report the same counts and days.
+4. **Character Page**: Filters, sorting and pagination match the synchronous
+   character list query.
+5. **Read-Your-Writes**: An async commit that wrote keeps the user's reads on
+   the primary, like the synchronous unit of work.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from app import create_app
+from app.models import db, User, Character
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+from app.datamanager.replica_routing import primary_is_sticky
+
+try:
+    import aiosqlite  # noqa: F401  (driver of the async SQLite engine)
+except ImportError:
+    aiosqlite = None
+
+if aiosqlite is not None:
+    from app.datamanager.async_postgre_sql_data_manager import (AsyncPostgreSQLDataManager,
+                                                                async_database_url)
+
+
+def _test_app(tmp_dir):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp_dir, 'test.db'),
+        'TESTING': True,
+        'SECRET_KEY': 'test-secret',
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'PASSWORD_HASH_POOL_SIZE': 0,
+        'DATA_MANAGER_BULK_CHUNK_SIZE': 3,
+    })
+
+
+NO_FILTERS = {'search_query': '', 'house_filter': '', 'role_filter': '',
+              'strength_filter': '', 'age_more_than': None, 'age_less_than': None}
+
+
+@unittest.skipIf(aiosqlite is None, 'aiosqlite is not installed')
+class TestAsyncDataManagerParity(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Create both managers on one temporary SQLite database."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = _test_app(self.tmp_dir)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.sync_manager = PostgreSQLDataManager(self.app)
+        self.async_manager = AsyncPostgreSQLDataManager.from_app(self.app)
+        user = User(username='parity', email='parity@example.com', password='x',
+                    date_of_birth=date(1990, 1, 1))
+        db.session.add(user)
+        db.session.commit()
+        self.user_id = user.id
+
+    async def asyncTearDown(self):
+        """Drop the temporary database."""
+        await self.async_manager.dispose()
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _sync_characters(self):
+        db.session.expire_all()
+        return [(c.id, c.name, c.age, c.nickname, c.version)
+                for c in self.sync_manager.get_user_characters(self.user_id)]
+
+    async def _async_characters(self):
+        return [(c.id, c.name, c.age, c.nickname, c.version)
+                for c in await self.async_manager.get_user_characters(self.user_id)]
+
+    def test_async_database_url(self):
+        self.assertEqual(async_database_url('postgresql://u:p@db/game').drivername,
+                         'postgresql+asyncpg')
+        self.assertEqual(async_database_url('sqlite:///x.db').drivername, 'sqlite+aiosqlite')
+
+    async def test_crud_parity(self):
+        added = await self.async_manager.add_character({'name': 'Arya', 'age': 11,
+                                                        'user_id': self.user_id})
+        self.sync_manager.add_character({'name': 'Bran', 'age': 10, 'user_id': self.user_id})
+        db.session.commit()
+        self.assertEqual(self._sync_characters(), await self._async_characters())
+
+        await self.async_manager.update_character(added.id, {'nickname': 'No One'})
+        self.assertEqual(db.session.get(Character, added.id).nickname, 'No One')
+
+        await self.async_manager.delete_character(added.id)
+        self.assertEqual([c[1] for c in self._sync_characters()], ['Bran'])
+        self.assertEqual(self._sync_characters(), await self._async_characters())
+
+        self.assertEqual([u.id for u in await self.async_manager.get_all_users()],
+                         [u.id for u in self.sync_manager.get_all_users()])
+
+    async def test_bulk_parity(self):
+        rows = [{'name': f'Character {i}', 'age': i, 'user_id': self.user_id}
+                for i in range(7)]
+        self.assertEqual(await self.async_manager.bulk_add_characters(rows), 7)
+        ids = [c[0] for c in self._sync_characters()]
+        changes = {character_id: {'age': 100 + n} for n, character_id in enumerate(ids)}
+        changes[ids[0]] = {'nickname': 'First', 'age': 1}
+        self.assertEqual(await self.async_manager.bulk_update_characters(changes), 7)
+        self.assertEqual(self._sync_characters()[0][2:], (1, 'First', 2))
+        self.assertEqual(self._sync_characters(), await self._async_characters())
+
+        async_ids = await self.async_manager.bulk_upsert_houses(['Stark', 'Lannister'])
+        sync_ids = self.sync_manager.bulk_upsert_houses(['Lannister', 'Tully'])
+        db.session.commit()
+        self.assertEqual(async_ids['Lannister'], sync_ids['Lannister'])
+        self.assertEqual(len(self.sync_manager.get_all_houses()), 3)
+
+        self.assertEqual(await self.async_manager.bulk_delete_characters(ids[:5]), 5)
+        self.assertEqual(len(self._sync_characters()), 2)
+
+    async def test_reports_and_rollups_parity(self):
+        self.sync_manager.bulk_add_characters(
+            [{'name': f'Character {i}', 'user_id': self.user_id,
+              'created_at': datetime(2026, 10, 1 + i % 3)} for i in range(6)])
+        db.session.commit()
+        self.assertEqual(await self.async_manager.get_reports(use_cache=False),
+                         self.sync_manager.get_reports(use_cache=False))
+
+        await self.async_manager.refresh_daily_rollups()
+        async_rollups = await self.async_manager.get_daily_rollups()
+        self.assertEqual(async_rollups, self.sync_manager.get_daily_rollups())
+        self.assertEqual(sum(day['characters_created'] for day in async_rollups), 6)
+
+    async def test_character_page_matches_sync_query(self):
+        self.sync_manager.bulk_add_characters(
+            [{'name': f'Character {i}', 'age': i, 'user_id': self.user_id}
+             for i in range(12)])
+        db.session.commit()
+        filters = dict(NO_FILTERS, search_query='character 1', age_less_than=11)
+        sort_options = {'sort_column': 'age', 'sort_order': 'desc'}
+
+        expected = self.sync_manager.get_character_page(self.user_id, filters, sort_options, 1, 5)
+        page = await self.async_manager.get_character_page(
+            self.user_id, filters, sort_options, 1, 5)
+        self.assertEqual(page.total, expected.total)
+        self.assertEqual([c.id for c in page.items], [c.id for c in expected.items])
+        self.assertEqual(page.pages, expected.pages)
+
+    async def test_add_character_if_absent(self):
+        values = {'name': 'Arya', 'user_id': self.user_id}
+        self.assertIsNotNone(await self.async_manager.add_character_if_absent(values))
+        self.assertIsNone(await self.async_manager.add_character_if_absent(values))
+        self.assertEqual(len(self._sync_characters()), 1)
+
+    async def test_write_commit_sticks_to_primary(self):
+        self.app.config['REPLICA_STICKY_SECONDS'] = 30
+        with self.app.test_request_context():
+            await self.async_manager.get_user_characters(self.user_id)
+            self.assertFalse(primary_is_sticky())
+
+            await self.async_manager.add_character({'name': 'Arya', 'user_id': self.user_id})
+            self.assertTrue(primary_is_sticky())
+
+        with self.app.test_request_context():
+            async with self.async_manager.unit_of_work():
+                await self.async_manager.add_character({'name': 'Sansa', 'user_id': self.user_id})
+                await self.async_manager.rollback()
+            self.assertFalse(primary_is_sticky())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_bloom_filter.py
+Description:
+The `test_bloom_filter.py` file contains unit tests for `app/bloom_filter.py`,
+the Bloom filter that lets signup skip the email existence query.
+
+Key Features:
+1. **No False Negatives**: Every added item is always reported as present.
+2. **False-Positive Rate**: The measured rate at capacity stays close to the
+   configured target, and the estimate tracks it.
+3. **Known-Email Filter**: A disabled filter answers "maybe", while an enabled
+   one rules out new emails and reports its statistics, including its
+   false-positive rates on `/internal/metrics`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import unittest
+from app import create_app
+from app.bloom_filter import BloomFilter, known_emails
+from dotenv import load_dotenv
+
+# Load environment variables
+dotenv_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(dotenv_path)
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_added_items_are_always_present(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        emails = [f"user{i}@example.com" for i in range(1000)]
+        for email in emails:
+            bloom.add(email)
+        self.assertTrue(all(email in bloom for email in emails))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"user{i}@example.com")
+        probes = 20000
+        false_positives = sum(f"other{i}@example.com" in bloom for i in range(probes))
+        self.assertLess(false_positives / probes, 0.02)
+        self.assertAlmostEqual(bloom.estimated_false_positive_rate, 0.01, delta=0.005)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
+
+
+class TestKnownEmailFilter(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app and push its context."""
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self):
+        """Pop the application context."""
+        self.app_context.pop()
+
+    def test_disabled_filter_answers_maybe(self):
+        self.app.extensions['known_emails']['filter'] = None
+        self.assertTrue(known_emails.might_contain('new@example.com'))
+        known_emails.record_false_positive()
+        self.assertEqual(known_emails.stats(), {'enabled': False})
+
+    def test_enabled_filter_rules_out_new_emails(self):
+        self.app.extensions['known_emails']['filter'] = BloomFilter(capacity=100)
+        self.assertFalse(known_emails.might_contain('new@example.com'))
+
+        known_emails.add('new@example.com')
+        self.assertTrue(known_emails.might_contain('new@example.com'))
+
+        known_emails.record_false_positive()
+        stats = known_emails.stats()
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(stats['items'], 1)
+        self.assertEqual(stats['observed_false_positives'], 1)
+        self.assertIn('estimated_false_positive_rate', stats)
+
+    def test_false_positive_rates_are_exported(self):
+        bloom = BloomFilter(capacity=100, error_rate=0.02)
+        for i in range(50):
+            bloom.add(f"user{i}@example.com")
+        self.app.extensions['known_emails']['filter'] = bloom
+        self.app.config['INTERNAL_API_TOKEN'] = 'internal-secret'
+
+        metrics = self.app.test_client().get(
+            '/internal/metrics', headers={'X-Internal-Token': 'internal-secret'}
+        ).get_data(as_text=True)
+        self.assertIn('# TYPE app_known_emails_false_positive_rate gauge', metrics)
+        self.assertIn('app_known_emails_false_positive_rate{kind="configured"} 0.02', metrics)
+        self.assertIn('app_known_emails_false_positive_rate{kind="estimated"} '
+                      f'{bloom.estimated_false_positive_rate!r}', metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
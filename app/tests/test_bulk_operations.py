@@ -0,0 +1,109 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_bulk_operations.py
+Description:
+The `test_bulk_operations.py` file tests the bulk_* methods of
+`PostgreSQLDataManager` against a throw-away SQLite database, and checks the
+PostgreSQL `UPDATE ... FROM (VALUES ...)` statement by compiling it.
+
+Key Features:
+1. **Bulk Insert/Delete**: Rows are written in chunks and counted correctly.
+2. **Bulk Update**: Each character gets its own changes and a version bump.
+3. **Lookup Upserts**: Existing names keep their ids, new names are created.
+4. **PostgreSQL Statement**: The update compiles to one `UPDATE ... FROM`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy.dialects import postgresql
+from app import create_app
+from app.models import db, User, House, Character
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+from app.datamanager.statements import update_from_values_statement
+
+
+class TestBulkOperations(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database with one user."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'DATA_MANAGER_BULK_CHUNK_SIZE': 7,
+        })
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        user = User(username='bulk', email='bulk@example.com', password='x',
+                    date_of_birth=date(1990, 1, 1))
+        db.session.add(user)
+        db.session.commit()
+        self.user_id = user.id
+        self.data_manager = PostgreSQLDataManager(self.app)
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _add(self, count):
+        rows = [{'name': f'Character {i}', 'user_id': self.user_id, 'age': i}
+                for i in range(count)]
+        self.assertEqual(self.data_manager.bulk_add_characters(rows), count)
+        db.session.commit()
+        return [c.id for c in Character.query.order_by(Character.id)]
+
+    def test_bulk_add_and_delete(self):
+        ids = self._add(20)
+        self.assertEqual(len(ids), 20)
+        self.assertEqual(self.data_manager.bulk_delete_characters(ids[:15]), 15)
+        db.session.commit()
+        self.assertEqual(Character.query.count(), 5)
+
+    def test_bulk_update_applies_each_change(self):
+        ids = self._add(10)
+        changes = {character_id: {'age': 100 + n} for n, character_id in enumerate(ids)}
+        changes[ids[0]] = {'nickname': 'First', 'age': 1}
+        self.assertEqual(self.data_manager.bulk_update_characters(changes), 10)
+        db.session.commit()
+        db.session.expire_all()
+
+        first = db.session.get(Character, ids[0])
+        self.assertEqual((first.nickname, first.age, first.version), ('First', 1, 2))
+        last = db.session.get(Character, ids[-1])
+        self.assertEqual((last.nickname, last.age, last.version), (None, 109, 2))
+
+    def test_bulk_upsert_lookups(self):
+        db.session.add(House(name='Stark'))
+        db.session.commit()
+        stark_id = House.query.filter_by(name='Stark').one().id
+
+        ids = self.data_manager.bulk_upsert_houses(['Stark', 'Lannister', 'Stark', ''])
+        db.session.commit()
+        self.assertEqual(set(ids), {'Stark', 'Lannister'})
+        self.assertEqual(ids['Stark'], stark_id)
+        self.assertEqual(House.query.count(), 2)
+
+    def test_postgresql_update_from_values(self):
+        statement = update_from_values_statement(
+            ('age', 'nickname'), [(1, {'age': 30, 'nickname': 'A'}),
+                                  (2, {'age': 31, 'nickname': 'B'})])
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.assertIn('UPDATE character SET', sql)
+        self.assertIn('FROM (VALUES', sql)
+        self.assertIn('version=(character.version +', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_character_list_statements.py
+Description:
+The `test_character_list_statements.py` file tests the prebuilt character
+list statements: one page/count pair per filter-presence bitmask and sort,
+reused across requests with bound parameter values.
+
+Key Features:
+1. **Shape Reuse**: Different filter values share one statement object;
+   different filter sets or sorts do not.
+2. **Results**: Filters, sorting and paging give the expected rows on SQLite.
+3. **Bound Values**: Filter values never become part of the SQL text.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from app.models import db, User
+from app.datamanager import statements
+from app.datamanager.data_manager_factory import data_manager
+
+NO_FILTERS = {'search_query': '', 'house_filter': '', 'role_filter': '',
+              'strength_filter': '', 'age_more_than': None, 'age_less_than': None}
+BY_NAME = {'sort_column': 'name', 'sort_order': 'asc'}
+
+
+class TestCharacterListStatements(unittest.TestCase):
+
+    def setUp(self):
+        """Create a user with characters in a temporary SQLite database."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'SECRET_KEY': 'test-secret',
+        })
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        user = User(username='shapes', email='shapes@example.com', password='x')
+        db.session.add(user)
+        db.session.flush()
+        self.user_id = user.id
+        houses = data_manager().bulk_upsert_houses(['Stark', 'Lannister'])
+        data_manager().bulk_add_characters(
+            [{'name': f'Character {i:02}', 'age': i, 'user_id': user.id,
+              'house_id': houses['Stark' if i % 2 else 'Lannister']} for i in range(20)])
+        db.session.commit()
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _names(self, filters, sort_options=BY_NAME, page=1, per_page=50):
+        result = data_manager().get_character_page(self.user_id, filters, sort_options,
+                                                   page, per_page)
+        return result.total, [character.name for character in result.items]
+
+    def test_shapes_are_reused(self):
+        first = statements.character_list_statements(
+            dict(NO_FILTERS, search_query='jon', age_more_than=5), BY_NAME)
+        second = statements.character_list_statements(
+            dict(NO_FILTERS, search_query='arya', age_more_than=30), BY_NAME)
+        self.assertIs(first, second)
+        self.assertIsNot(first, statements.character_list_statements(
+            dict(NO_FILTERS, search_query='jon'), BY_NAME))
+        self.assertIsNot(first, statements.character_list_statements(
+            dict(NO_FILTERS, search_query='jon', age_more_than=5),
+            {'sort_column': 'name', 'sort_order': 'desc'}))
+        # Anything but 'asc' is descending and shares the descending shape
+        self.assertIs(
+            statements.character_list_statements(NO_FILTERS, {'sort_column': 'age',
+                                                              'sort_order': 'desc'}),
+            statements.character_list_statements(NO_FILTERS, {'sort_column': 'age',
+                                                              'sort_order': 'bogus'}))
+        with self.assertRaises(AttributeError):
+            statements.character_list_statements(NO_FILTERS, {'sort_column': 'missing',
+                                                              'sort_order': 'asc'})
+
+    def test_filters_sorting_and_paging(self):
+        self.assertEqual(self._names(NO_FILTERS)[0], 20)
+        self.assertEqual(self._names(dict(NO_FILTERS, search_query='character 1')),
+                         (10, [f'Character {i}' for i in range(10, 20)]))
+        self.assertEqual(self._names(dict(NO_FILTERS, house_filter='STAR', age_less_than=6)),
+                         (3, ['Character 01', 'Character 03', 'Character 05']))
+        self.assertEqual(
+            self._names(dict(NO_FILTERS, age_more_than=10),
+                        {'sort_column': 'age', 'sort_order': 'desc'}, page=2, per_page=4),
+            (10, ['Character 15', 'Character 14', 'Character 13', 'Character 12']))
+
+    def test_values_are_bound(self):
+        filters = dict(NO_FILTERS, search_query="' OR 1=1 --", house_filter='stark')
+        page_statement, _ = statements.character_list_statements(filters, BY_NAME)
+        self.assertNotIn('OR 1=1', str(page_statement))
+        self.assertNotIn('stark', str(page_statement))
+        self.assertEqual(self._names(filters), (0, []))
+        self.assertEqual(statements.character_list_params(self.user_id, filters, 3, 10),
+                         {'user_id': self.user_id, 'limit': 10, 'offset': 20,
+                          'search_pattern': "%' OR 1=1 --%", 'house_pattern': '%stark%'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_character_update_diff.py
+Description:
+The `test_character_update_diff.py` file tests character edits that write
+only the changed columns and use the `version` column for optimistic
+locking. It runs against a throw-away SQLite database.
+
+Key Features:
+1. **No-Op Edits**: Submitting unchanged data issues no UPDATE at all.
+2. **Dirty Fields Only**: The UPDATE only sets the columns that changed,
+   plus the version bump.
+3. **Version Conflicts**: An edit based on a stale version changes nothing.
+4. **Query Budget**: Every edit stays within the route's SQL statement budget.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import event
+from app import create_app
+from app.models import db, User, House, Role, Strength, Character
+from app.tests.query_budget import route_budget
+
+
+class TestCharacterUpdateDiff(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app, a logged-in user and one character."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            user = User(username='editor', email='editor@example.com',
+                        date_of_birth=date(1990, 1, 1))
+            user.set_password('Test@1234')
+            house, role, strength = House(name='Stark'), Role(name='King'), Strength(name='Brave')
+            character = Character(name='Jon Snow', house=house, role=role,
+                                  strength=strength, animal='Direwolf', age=25, user=user)
+            db.session.add(character)
+            db.session.commit()
+            self.character_id = character.id
+            self.form = {
+                'version': '1',
+                'name': 'Jon Snow',
+                'house_id': str(house.id),
+                'animal': 'Direwolf',
+                'symbol': '',
+                'nickname': '',
+                'role_id': str(role.id),
+                'age': '25',
+                'death': '',
+                'strength_id': str(strength.id),
+            }
+
+        self.client.post('/auth/login', data={'email': 'editor@example.com',
+                                              'password': 'Test@1234'})
+        self.updates = []
+        with self.app.app_context():
+            self.engine = db.engine
+        event.listen(self.engine, 'before_cursor_execute', self._record_update)
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        event.remove(self.engine, 'before_cursor_execute', self._record_update)
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _record_update(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('UPDATE CHARACTER'):
+            self.updates.append(statement)
+
+    def _post(self, **changes):
+        with route_budget('POST user.user_edit_character'):
+            return self.client.post(f'/user/edit_character/{self.character_id}',
+                                    data={**self.form, **changes})
+
+    def _character(self):
+        with self.app.app_context():
+            return db.session.get(Character, self.character_id)
+
+    def test_unchanged_form_skips_the_write(self):
+        response = self._post()
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.updates, [])
+        self.assertEqual(self._character().version, 1)
+
+    def test_only_changed_columns_are_updated(self):
+        response = self._post(animal='Wolf', age='26')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(len(self.updates), 1)
+        statement = self.updates[0]
+        self.assertIn('animal', statement)
+        self.assertIn('age', statement)
+        self.assertNotIn('nickname', statement)
+        self.assertNotIn('house_id', statement)
+
+        character = self._character()
+        self.assertEqual((character.animal, character.age, character.version), ('Wolf', 26, 2))
+
+    def test_stale_version_is_rejected(self):
+        self._post(animal='Wolf')
+        # A second edit still based on version 1 must not overwrite the first
+        response = self._post(animal='Cat', version='1')
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(f'/user/edit_character/{self.character_id}', response.location)
+
+        character = self._character()
+        self.assertEqual((character.animal, character.version), ('Wolf', 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_data_manager_routing.py
+Description:
+The `test_data_manager_routing.py` file runs the app's write paths (signup,
+contact, add/edit/delete character, profile edit) once on SQLite and once on
+the in-memory data manager. The in-memory backend has no tables at all, so a
+controller that still queried the models directly would fail there.
+
+Key Features:
+1. **Same Behaviour on Both Backends**: Every step is asserted through the
+   data manager, never through the models.
+2. **Existence Checks**: Duplicate emails, duplicate character names on add
+   and on rename, and stale edits are rejected on both backends.
+3. **Query Budgets**: Login and the character pages stay within their
+   declared SQL statement budgets (`query_budget.py`).
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+from app.tests.query_budget import route_budget
+
+PASSWORD = 'Test@1234'
+
+
+class DataManagerRoutingMixin:
+    """The scenario; subclasses choose the backend."""
+
+    backend_config = {}
+
+    def setUp(self):
+        """Create the app on the subclass's backend."""
+        self.tmp_dir = tempfile.mkdtemp()
+        config = {
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+        }
+        config.update(self.backend_config)
+        self.app = create_app(config)
+        self.client = self.app.test_client()
+        if self.backend_config.get('DATA_MANAGER') != 'memory':
+            with self.app.app_context():
+                db.create_all()
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _signup(self, email, password=PASSWORD):
+        return self.client.post('/auth/signup_user', data={
+            'username': 'routing', 'email': email, 'dob': '1990-01-01',
+            'password': password, 'gender': 'female'}, follow_redirects=True)
+
+    def _characters(self, user_id):
+        """{name: (id, house name, age, version)}, read outside of any session."""
+        with self.app.app_context():
+            return {c.name: (c.id, c.house.name if c.house else None, c.age, c.version)
+                    for c in data_manager().get_user_characters(user_id)}
+
+    def test_signup_and_contact(self):
+        self.assertIn(b'User registration successful!', self._signup('routing@example.com').data)
+        self.assertIn(b'User already exists', self._signup('routing@example.com').data)
+        self.assertIn(b'at least 8 characters', self._signup('short@example.com', 'short').data)
+        with self.app.app_context():
+            self.assertTrue(data_manager().email_exists('routing@example.com'))
+            self.assertFalse(data_manager().email_exists('short@example.com'))
+            self.assertEqual(list(data_manager().iter_user_emails()), ['routing@example.com'])
+
+        response = self.client.post('/auth/contact', data={
+            'name': 'Routing', 'email': 'routing@example.com', 'message': 'Hello'},
+            follow_redirects=True)
+        self.assertIn(b'Your message has been sent!', response.data)
+        with self.app.app_context():
+            self.assertEqual([c.message for c in data_manager().get_all_contacts()], ['Hello'])
+
+    @patch('app.controllers.common_fun.fetch_character_data')
+    def test_character_and_profile_writes(self, mock_fetch_character_data):
+        self._signup('routing@example.com')
+        with route_budget('POST auth.login'):
+            self.client.post('/auth/login', data={'email': 'routing@example.com',
+                                                  'password': PASSWORD})
+        with self.app.app_context():
+            user_id = data_manager().get_user_by_email('routing@example.com').id
+
+        for name, house in (('Jon Snow', 'Stark'), ('Arya Stark', 'Stark'), ('Jon Snow', 'Stark')):
+            mock_fetch_character_data.return_value = {'name': name, 'house': house, 'age': 20}
+            with route_budget('POST user.user_add_character'):
+                self.client.post('/user/add_character', data={'name': name})
+        response = self.client.get('/user/character_list')
+        self.assertIn(b'Character with this name already exists.', response.data)
+        characters = self._characters(user_id)
+        self.assertEqual(sorted(characters), ['Arya Stark', 'Jon Snow'])
+        self.assertEqual(characters['Jon Snow'][1], 'Stark')
+        with route_budget('GET user.user_add_character'):
+            self.assertEqual(self.client.get('/user/add_character').status_code, 200)
+        with route_budget('GET user.my_character_list'):
+            self.assertIn(b'Arya Stark', self.client.get('/user/character_list').data)
+        with route_budget('GET user.user_dashboard'):
+            self.assertEqual(self.client.get('/user/dashboard').status_code, 200)
+
+        jon_id, _, _, version = characters['Jon Snow']
+        with route_budget('GET user.user_edit_character'):
+            self.assertEqual(self.client.get(f'/user/edit_character/{jon_id}').status_code, 200)
+        self.assertEqual(self.client.get('/user/edit_character/999').status_code, 404)
+        response = self.client.post(f'/user/edit_character/{jon_id}', data={
+            'name': 'Arya Stark', 'version': version}, follow_redirects=True)
+        self.assertIn(b'Character with this name already exists.', response.data)
+        with route_budget('POST user.user_edit_character'):
+            self.client.post(f'/user/edit_character/{jon_id}', data={
+                'name': 'Jon Snow', 'age': '21', 'version': version})
+        response = self.client.get('/user/character_list')
+        self.assertIn(b'Character updated successfully!', response.data)
+        response = self.client.post(f'/user/edit_character/{jon_id}', data={
+            'name': 'Jon Snow', 'age': '22', 'version': version}, follow_redirects=True)
+        self.assertIn(b'changed by someone else', response.data)
+        self.assertEqual(self._characters(user_id)['Jon Snow'][2], 21)
+
+        with route_budget('POST user.delete_character'):
+            self.client.post(f'/user/delete_character/{jon_id}')
+        response = self.client.post(f'/user/delete_character/{jon_id}', follow_redirects=True)
+        self.assertIn(b'Character not found or does not belong to you.', response.data)
+        self.assertEqual(list(self._characters(user_id)), ['Arya Stark'])
+
+        self.client.post(f'/user/edit_user_profile/{user_id}', data={'name': 'renamed'})
+        with self.app.app_context():
+            self.assertEqual(data_manager().get_user(user_id).username, 'renamed')
+
+
+class TestSQLiteRouting(DataManagerRoutingMixin, unittest.TestCase):
+    backend_config = {}
+
+
+class TestInMemoryRouting(DataManagerRoutingMixin, unittest.TestCase):
+    backend_config = {'DATA_MANAGER': 'memory', 'SQLALCHEMY_DATABASE_URI': None}
+
+
+if __name__ == '__main__':
+    unittest.main()
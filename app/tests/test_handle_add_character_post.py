@@ -31,7 +31,7 @@ Key Features:
    - Ensures that the session remains active after the character addition process, verifying that the user is still logged in.
 
 Created: 2024-12-09
-Updated: 2024-12-09
+Updated: 2026-10-19
 =============================================================================
 """
 import os
@@ -69,9 +69,8 @@ class TestHandleAddCharacterPostSuccess(unittest.TestCase):
         self.app_context = self.app.app_context()
         self.app_context.push()
 
-    @patch('app.controllers.common_fun.User.query.get')
     @patch('app.controllers.common_fun.fetch_character_data')
-    def test_handle_add_character_post_success(self, mock_fetch_character_data, mock_get):
+    def test_handle_add_character_post_success(self, mock_fetch_character_data):
         """
         Test the success flow of adding a character through handle_add_character_post.
         """
@@ -111,7 +110,11 @@ class TestHandleAddCharacterPostSuccess(unittest.TestCase):
         mock_user = MagicMock(User)
         mock_user.id = 16
         mock_user.email = 'test@gmail.com'  # Mock email
-        mock_get.return_value = mock_user
+        # Only the user lookup is mocked; the character is saved for real
+        get_user = patch.object(self.app.extensions['data_manager'], 'get_user',
+                                return_value=mock_user)
+        get_user.start()
+        self.addCleanup(get_user.stop)
 
         # Simulate login (no need to manually set session here)
         login_response = self.client.post('/auth/login', data={
@@ -0,0 +1,192 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_in_memory_data_manager.py
+Description:
+The `test_in_memory_data_manager.py` file tests `InMemoryDataManager` against
+the SQL data manager and runs the app with DATA_MANAGER=memory, where no
+database table exists at all.
+
+Key Features:
+1. **List Parity**: Filters, sorting and pagination of the character list
+   match the SQL manager on the same data.
+2. **Constraints and Indexes**: (user, name) uniqueness, lookup upserts,
+   deletes and version bumps keep the indexes consistent.
+3. **Reports and Rollups**: Counts and per-day rollups match what was added.
+4. **Web Layer**: Login, dashboard, profile and character list render from
+   memory only.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from app import create_app
+from app.models import db, User
+from app.datamanager.data_manager_factory import data_manager
+from app.datamanager.in_memory_data_manager import InMemoryDataManager
+from app.datamanager.sqlite_data_manager import SQLiteDataManager
+
+NO_FILTERS = {'search_query': '', 'house_filter': '', 'role_filter': '',
+              'strength_filter': '', 'age_more_than': None, 'age_less_than': None}
+HOUSES = ['Stark', 'Lannister', 'Targaryen']
+
+
+def _memory_app():
+    return create_app({
+        'DATA_MANAGER': 'memory',
+        'SQLALCHEMY_DATABASE_URI': None,
+        'TESTING': True,
+        'SECRET_KEY': 'test-secret',
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'PASSWORD_HASH_POOL_SIZE': 0,
+    })
+
+
+def _characters(user_id, house_ids):
+    return [{'name': f'Character {i:02}', 'age': 10 + (i * 7) % 50, 'user_id': user_id,
+             'house_id': house_ids[HOUSES[i % 3]]} for i in range(30)]
+
+
+class TestInMemoryDataManager(unittest.TestCase):
+
+    def setUp(self):
+        """A fresh manager; the app context is only needed for password hashing."""
+        self.context = _memory_app().app_context()
+        self.context.push()
+        self.manager = InMemoryDataManager()
+        self.user = self.manager.add_user('memory', 'memory@example.com', 'Test@1234',
+                                          date(1990, 1, 1), None, None)
+
+    def tearDown(self):
+        self.context.pop()
+
+    def test_list_matches_the_sql_manager(self):
+        tmp_dir = tempfile.mkdtemp()
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp_dir, 't.db'),
+                          'SECRET_KEY': 'x'})
+        try:
+            with app.app_context():
+                db.create_all()
+                sql_manager = SQLiteDataManager(app)
+                sql_user = User(username='memory', email='memory@example.com', password='x')
+                db.session.add(sql_user)
+                db.session.flush()
+                sql_manager.bulk_add_characters(
+                    _characters(sql_user.id, sql_manager.bulk_upsert_houses(HOUSES)))
+                db.session.commit()
+                self.manager.bulk_add_characters(
+                    _characters(self.user.id, self.manager.bulk_upsert_houses(HOUSES)))
+
+                cases = [
+                    (NO_FILTERS, {'sort_column': 'name', 'sort_order': 'asc'}, 1),
+                    (NO_FILTERS, {'sort_column': 'name', 'sort_order': 'desc'}, 3),
+                    (dict(NO_FILTERS, search_query='character 1'),
+                     {'sort_column': 'id', 'sort_order': 'asc'}, 1),
+                    (dict(NO_FILTERS, house_filter='STAR', age_more_than=20, age_less_than=50),
+                     {'sort_column': 'id', 'sort_order': 'desc'}, 1),
+                    (NO_FILTERS, {'sort_column': 'name', 'sort_order': 'asc'}, 9),
+                ]
+                for filters, sort_options, page in cases:
+                    expected = sql_manager.get_character_page(
+                        sql_user.id, filters, sort_options, page, 5)
+                    actual = self.manager.get_character_page(
+                        self.user.id, filters, sort_options, page, 5)
+                    self.assertEqual(actual.total, expected.total, filters)
+                    self.assertEqual([c.name for c in actual.items],
+                                     [c.name for c in expected.items], (filters, sort_options))
+                    self.assertEqual(actual.pages, expected.pages)
+        finally:
+            with app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_nulls_sort_like_postgresql(self):
+        for name, age in (('A', 30), ('B', None), ('C', 10)):
+            self.manager.add_character({'name': name, 'age': age, 'user_id': self.user.id})
+        ascending = self.manager.get_character_page(
+            self.user.id, NO_FILTERS, {'sort_column': 'age', 'sort_order': 'asc'}, 1, 5)
+        descending = self.manager.get_character_page(
+            self.user.id, NO_FILTERS, {'sort_column': 'age', 'sort_order': 'desc'}, 1, 5)
+        self.assertEqual([c.name for c in ascending.items], ['C', 'A', 'B'])
+        self.assertEqual([c.name for c in descending.items], ['B', 'A', 'C'])
+
+    def test_constraints_and_indexes(self):
+        arya = self.manager.add_character({'name': 'Arya', 'user_id': self.user.id})
+        with self.assertRaises(ValueError):
+            self.manager.add_character({'name': 'Arya', 'user_id': self.user.id})
+        self.assertEqual(self.manager.get_user_by_email('memory@example.com'), self.user)
+        self.assertTrue(self.user.check_password('Test@1234'))
+
+        ids = self.manager.bulk_upsert_houses(['Stark', 'Stark', ''])
+        self.assertEqual(self.manager.bulk_upsert_houses(['Stark', 'Tully'])['Stark'], ids['Stark'])
+        self.manager.update_character(arya.id, {'house_id': ids['Stark'], 'name': 'No One'})
+        self.assertEqual((arya.house.name, arya.version), ('Stark', 2))
+        self.manager.add_character({'name': 'Arya', 'user_id': self.user.id})
+
+        self.manager.delete_house(ids['Stark'])
+        self.assertIsNone(arya.house)
+        self.assertIsNone(arya.house_id)
+        self.assertEqual(self.manager.bulk_delete_characters(
+            [c.id for c in self.manager.get_user_characters(self.user.id)]), 2)
+        self.assertEqual(self.manager.get_all_characters(), [])
+
+    def test_reports_and_rollups(self):
+        self.manager.bulk_add_characters(
+            [{'name': f'Character {i}', 'user_id': self.user.id,
+              'created_at': datetime(2026, 10, 1 + i % 3, 12)} for i in range(6)])
+        self.assertEqual(self.manager.get_reports(use_cache=False),
+                         {'user_count': 1, 'character_count': 6, 'house_count': 0})
+        self.assertEqual(self.manager.get_daily_rollups(), [])
+        self.manager.refresh_daily_rollups()
+        rollups = self.manager.get_daily_rollups()
+        self.assertEqual([(r['day'], r['characters_created']) for r in rollups[-3:]],
+                         [(date(2026, 10, 3), 2), (date(2026, 10, 2), 2), (date(2026, 10, 1), 2)])
+        # Only the latest stored day (today, the user's signup) is recounted
+        self.manager.add_character({'name': 'Today', 'user_id': self.user.id})
+        self.assertEqual(self.manager.refresh_daily_rollups(), 1)
+        today = self.manager.get_daily_rollups(days=1)[0]
+        self.assertEqual((today['signups'], today['characters_created']), (1, 1))
+
+    def test_streaming(self):
+        self.manager.bulk_add_characters(
+            [{'name': f'Character {i}', 'user_id': self.user.id} for i in range(5)])
+        self.assertEqual([c.name for c in self.manager.iter_characters(batch_size=2)],
+                         [f'Character {i}' for i in range(5)])
+        self.assertEqual(next(self.manager.iter_users(rows=True))[1], 'memory')
+
+
+class TestInMemoryApp(unittest.TestCase):
+
+    def setUp(self):
+        """Run the app on the in-memory data manager, without any table."""
+        self.app = _memory_app()
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            manager = data_manager()
+            user = manager.add_user('memory', 'memory@example.com', 'Test@1234',
+                                    date(1990, 1, 1), None, None)
+            manager.bulk_add_characters(
+                _characters(user.id, manager.bulk_upsert_houses(HOUSES)))
+
+    def test_pages_render_from_memory(self):
+        with self.app.app_context():
+            self.assertIsInstance(data_manager(), InMemoryDataManager)
+        response = self.client.post('/auth/login', data={'email': 'memory@example.com',
+                                                         'password': 'Test@1234'})
+        self.assertIn('/user/dashboard', response.headers['Location'])
+
+        for url in ('/user/dashboard', '/user/user_profile', '/user/character_list'):
+            self.assertEqual(self.client.get(url).status_code, 200, url)
+        response = self.client.get('/user/character_list?search=character 0&sort_order=desc')
+        self.assertIn(b'Character 09', response.data)
+        self.assertNotIn(b'Character 10', response.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
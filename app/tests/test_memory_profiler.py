@@ -0,0 +1,122 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_memory_profiler.py
+Description:
+The `test_memory_profiler.py` file tests the tracemalloc endpoints under
+`/internal/memory` and the per-request peak allocation histogram.
+
+Key Features:
+1. **Diffs**: Memory kept between two snapshots shows up at the line that
+   allocated it.
+2. **Bounds**: Only the newest snapshots are kept, and snapshots need
+   tracing.
+3. **Peaks**: A request's temporary allocation lands in its endpoint's
+   bucket, unless another request overlaps it.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from app.models import db
+from app.monitoring.memory_profiler import memory_profiler
+
+TOKEN = {'X-Internal-Token': 'internal-secret'}
+MIB = 1024 * 1024
+
+
+class TestMemoryProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with a view that allocates 2 MiB for a moment."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'INTERNAL_API_TOKEN': 'internal-secret',
+            'MEMORY_SNAPSHOT_KEEP': 2,
+            'MEMORY_PEAK_ENDPOINTS': 'hog',
+        })
+        self.app.add_url_rule('/_hog', 'hog', lambda: str(len(bytearray(2 * MIB))))
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        """Stop tracing and drop the temporary database."""
+        memory_profiler.stop()
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _post(self, path):
+        return self.client.post(path, headers=TOKEN)
+
+    def test_snapshot_diff_points_at_the_allocating_line(self):
+        self.assertFalse(self.client.get('/internal/memory', headers=TOKEN).get_json()['tracing'])
+        self.assertEqual(self._post('/internal/memory/snapshots').status_code, 409)
+
+        status = self._post('/internal/memory/start?frames=2').get_json()
+        self.assertEqual((status['tracing'], status['frames']), (True, 2))
+        first = self._post('/internal/memory/snapshots')
+        self.assertEqual(first.status_code, 201)
+        self.assertIsNone(first.get_json()['compare'])
+
+        self.hoard = [bytearray(1024) for _ in range(2048)]
+        second = self._post('/internal/memory/snapshots').get_json()
+        self.assertEqual(second['compare'], first.get_json()['id'])
+        site = second['top'][0]
+        self.assertEqual(site['file'], __file__)
+        self.assertGreaterEqual(site['size_diff'], 2 * MIB)
+        self.assertGreaterEqual(site['count_diff'], 2048)
+
+        by_file = self.client.get(f'/internal/memory/snapshots/{second["id"]}'
+                                  f'?compare={first.get_json()["id"]}&group_by=filename&limit=3',
+                                  headers=TOKEN).get_json()['top']
+        self.assertEqual((by_file[0]['file'], by_file[0]['line']), (__file__, None))
+        self.assertLessEqual(len(by_file), 3)
+        self.assertEqual(self.client.get(f'/internal/memory/snapshots/{second["id"]}?group_by=x',
+                                         headers=TOKEN).status_code, 400)
+
+    def test_only_the_newest_snapshots_are_kept(self):
+        self._post('/internal/memory/start')
+        ids = [self._post('/internal/memory/snapshots').get_json()['id'] for _ in range(3)]
+        status = self.client.get('/internal/memory', headers=TOKEN).get_json()
+        self.assertEqual([snapshot['id'] for snapshot in status['snapshots']], ids[1:])
+        self.assertEqual(self.client.get(f'/internal/memory/snapshots/{ids[0]}',
+                                         headers=TOKEN).status_code, 404)
+
+        self.assertEqual(self._post('/internal/memory/stop').get_json()['snapshots'], [])
+        self.assertEqual(self.client.post('/internal/memory/start').status_code, 403)
+
+    def test_request_peak_histogram(self):
+        self.client.get('/_hog')
+        self._post('/internal/memory/start')
+        self.client.get('/_hog')
+        # Overlapping another request: not recorded
+        memory_profiler._in_flight += 1
+        try:
+            self.client.get('/_hog')
+        finally:
+            memory_profiler._in_flight -= 1
+
+        metrics = self.client.get('/internal/metrics', headers=TOKEN).get_data(as_text=True)
+        labels = 'blueprint="",endpoint="hog"'
+        self.assertIn(f'app_http_request_peak_alloc_bytes_count{{{labels}}} 1', metrics)
+        self.assertIn(f'app_http_request_peak_alloc_bytes_bucket{{{labels},le="1048576.0"}} 0',
+                      metrics)
+        self.assertIn(f'app_http_request_peak_alloc_bytes_bucket{{{labels},le="4194304.0"}} 1',
+                      metrics)
+        # Endpoints outside MEMORY_PEAK_ENDPOINTS are not measured
+        self.assertFalse([line for line in metrics.splitlines()
+                          if line.startswith('app_http_request_peak_alloc_bytes')
+                          and 'endpoint="internal.' in line])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_metrics.py
+Description:
+The `test_metrics.py` file tests the Prometheus metrics: the request hooks,
+the per-thread shards, the multiprocess directory and the
+`/internal/metrics` endpoint.
+
+Key Features:
+1. **Requests**: Latency histograms and status counters per endpoint, and an
+   in-flight gauge that returns to zero.
+2. **Shards**: Counts from many threads add up, and finished threads' shards
+   are folded away.
+3. **Multiprocess**: A forked worker's counters reach the parent's scrape;
+   its gauges are dropped once it has exited.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+from app.monitoring.metrics import MetricsRegistry, render
+
+TOKEN = {'X-Internal-Token': 'internal-secret'}
+LOGIN = (('blueprint', 'auth'), ('endpoint', 'auth.login'), ('method', 'GET'))
+
+
+def _worker(app, directory):
+    """Record one request's worth of samples in a forked process and flush them."""
+    registry = MetricsRegistry(directory)
+    with app.app_context():
+        registry.inc('app_http_requests_total', LOGIN + (('status', '200'),), 5)
+        registry.inc('app_http_requests_in_flight', LOGIN[:2], 3)
+        registry.flush()
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with internal endpoints enabled."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = self._create_app()
+        self.client = self.app.test_client()
+        self.registry = self.app.extensions['metrics']
+
+    def _create_app(self, **overrides):
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'INTERNAL_API_TOKEN': 'internal-secret',
+            **overrides,
+        })
+        with app.app_context():
+            db.create_all()
+        return app
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_request_metrics(self):
+        self.client.get('/auth/login')
+        self.client.get('/auth/login')
+        self.client.get('/no/such/page')
+        self.client.open('/auth/login', method='BREW')
+        with self.app.app_context():
+            samples = self.registry.collect()
+
+        self.assertEqual(samples[('app_http_requests_total', LOGIN + (('status', '200'),))], 2)
+        self.assertEqual(samples[('app_http_requests_total', (
+            ('blueprint', ''), ('endpoint', '<unmatched>'), ('method', 'GET'),
+            ('status', '404')))], 1)
+        self.assertEqual(samples[('app_http_requests_total', (
+            ('blueprint', ''), ('endpoint', '<unmatched>'), ('method', 'OTHER'),
+            ('status', '405')))], 1)
+        latency = samples[('app_http_request_duration_seconds', LOGIN)]
+        self.assertEqual(sum(latency[:-1]), 2)
+        self.assertGreater(latency[-1], 0)
+        self.assertEqual(samples[('app_http_requests_in_flight', LOGIN[:2])], 0)
+        self.assertEqual(samples[('app_db_pool_size', (('bind', 'default'),))], 10)
+
+    def test_endpoint_renders_prometheus_text(self):
+        self.assertEqual(self.client.get('/internal/metrics').status_code, 403)
+        with self.app.app_context():
+            data_manager().get_reports()
+            data_manager().get_reports()
+        self.client.get('/auth/login')
+
+        response = self.client.get('/internal/metrics', headers=TOKEN)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, 'text/plain; version=0.0.4; charset=utf-8')
+        text = response.get_data(as_text=True)
+        self.assertIn('# TYPE app_http_request_duration_seconds histogram\n', text)
+        self.assertIn('app_http_request_duration_seconds_bucket{blueprint="auth",'
+                      'endpoint="auth.login",method="GET",le="+Inf"} 1\n', text)
+        self.assertIn('app_http_request_duration_seconds_count{blueprint="auth",'
+                      'endpoint="auth.login",method="GET"} 1\n', text)
+        # The scrape itself is in flight while it renders
+        self.assertIn('app_http_requests_in_flight{blueprint="internal",'
+                      'endpoint="internal.metrics"} 1\n', text)
+        self.assertIn('app_cache_requests_total{cache="reports",result="hit"} 1\n', text)
+        self.assertIn('app_cache_requests_total{cache="reports",result="miss"} 1\n', text)
+        self.assertIn('app_db_pool_connections{bind="default",state="checked_out"} ', text)
+        self.assertIn('app_db_pool_checkout_wait_seconds_bucket{bind="default",le="0.001"} ', text)
+
+    def test_metrics_can_be_disabled(self):
+        app = self._create_app(METRICS_ENABLED=False)
+        self.assertNotIn('metrics', app.extensions)
+        self.assertEqual(app.test_client().get('/internal/metrics', headers=TOKEN).status_code,
+                         404)
+
+    def test_thread_shards_add_up(self):
+        registry = MetricsRegistry()
+
+        def record():
+            for _ in range(1000):
+                registry.inc('app_cache_requests_total', (('cache', 'c'), ('result', 'hit')))
+                registry.observe('app_http_request_duration_seconds', LOGIN, 0.02)
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        record()
+
+        samples = registry.snapshot()
+        self.assertEqual(samples[('app_cache_requests_total', (('cache', 'c'), ('result', 'hit')))],
+                         9000)
+        latency = samples[('app_http_request_duration_seconds', LOGIN)]
+        self.assertEqual(latency[2], 9000)
+        self.assertAlmostEqual(latency[-1], 180.0)
+        # Only the main thread's shard is still live; the rest were folded
+        self.assertEqual(len(registry._shards), 1)
+        self.assertEqual(registry.snapshot(), samples)
+
+    def test_label_escaping(self):
+        text = render({('app_cache_requests_total', (('cache', 'a"b\\c\nd'), ('result', 'hit'))): 1})
+        self.assertIn('app_cache_requests_total{cache="a\\"b\\\\c\\nd",result="hit"} 1\n', text)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'needs fork')
+    def test_multiprocess_directory(self):
+        directory = os.path.join(self.tmp_dir, 'metrics')
+        app = self._create_app(METRICS_MULTIPROC_DIR=directory)
+        app.test_client().get('/auth/login')
+
+        worker = multiprocessing.get_context('fork').Process(target=_worker, args=(app, directory))
+        worker.start()
+        worker.join()
+        self.assertEqual(worker.exitcode, 0)
+        self.assertEqual(sorted(os.listdir(directory)),
+                         sorted([f'metrics-{os.getpid()}.json', f'metrics-{worker.pid}.json']))
+
+        with app.app_context():
+            samples = app.extensions['metrics'].collect()
+        # 1 request here plus 5 in the exited worker
+        self.assertEqual(samples[('app_http_requests_total', LOGIN + (('status', '200'),))], 6)
+        # Its in-flight gauge left with it
+        self.assertEqual(samples[('app_http_requests_in_flight', LOGIN[:2])], 0)
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
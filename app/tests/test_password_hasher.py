@@ -0,0 +1,100 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_password_hasher.py
+Description:
+The `test_password_hasher.py` file contains unit tests for the bounded password
+hashing pool in `app/password_hasher.py`. The tests run the hasher inline
+(`PASSWORD_HASH_POOL_SIZE = 0`) with a cheap method so they stay fast.
+
+Key Features:
+1. **Round Trip**: Hashes a password and verifies it against the stored hash.
+2. **Rehash Detection**: Changing the configured method flags older hashes.
+3. **Backpressure**: A saturated pool raises `PasswordHashPoolBusy`, which the
+   registered error handler turns into a `503` with `Retry-After`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import unittest
+from app import create_app
+from app.password_hasher import password_hasher, PasswordHashPoolBusy
+from werkzeug.security import generate_password_hash
+from dotenv import load_dotenv
+
+# Load environment variables
+dotenv_path = os.path.join(os.path.dirname(__file__), '.env')
+load_dotenv(dotenv_path)
+
+
+class TestPasswordHasher(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with a cheap, inline hashing configuration."""
+        self.app = create_app()
+        self.app.config['TESTING'] = True
+        self.app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+        self.app.config['PASSWORD_HASH_POOL_SIZE'] = 0
+        self.app.config['PASSWORD_HASH_QUEUE_DEPTH'] = 0
+
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self):
+        """Pop the application context."""
+        self.app_context.pop()
+
+    def test_hash_and_verify(self):
+        pwhash = password_hasher.hash('Test@1234')
+        self.assertTrue(pwhash.startswith('pbkdf2:sha256:1000$'))
+        self.assertTrue(password_hasher.verify(pwhash, 'Test@1234'))
+        self.assertFalse(password_hasher.verify(pwhash, 'wrong-password'))
+
+    def test_needs_rehash_when_method_changes(self):
+        pwhash = password_hasher.hash('Test@1234')
+        self.assertFalse(password_hasher.needs_rehash(pwhash))
+
+        # A fresh app picks up the new cost parameters
+        other_app = create_app()
+        other_app.config['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:2000'
+        other_app.config['PASSWORD_HASH_POOL_SIZE'] = 0
+        with other_app.app_context():
+            self.assertTrue(password_hasher.needs_rehash(pwhash))
+            self.assertTrue(password_hasher.needs_rehash('plain-text'))
+
+    def test_shorthand_method_does_not_rehash(self):
+        # werkzeug stores 'scrypt' as 'scrypt:32768:8:1'
+        other_app = create_app()
+        other_app.config['PASSWORD_HASH_METHOD'] = 'scrypt'
+        other_app.config['PASSWORD_HASH_POOL_SIZE'] = 0
+        with other_app.app_context():
+            pwhash = password_hasher.hash('Test@1234')
+            self.assertTrue(pwhash.startswith('scrypt:32768:8:1$'))
+            self.assertFalse(password_hasher.needs_rehash(pwhash))
+            # Older cost parameters are still upgraded
+            self.assertTrue(password_hasher.needs_rehash(
+                generate_password_hash('Test@1234', 'scrypt:16384:8:1', 16)))
+
+    def test_saturated_pool_raises_busy(self):
+        pool = password_hasher._pool()
+        self.assertTrue(pool.slots.acquire(blocking=False))
+        try:
+            with self.assertRaises(PasswordHashPoolBusy):
+                password_hasher.hash('Test@1234')
+        finally:
+            pool.slots.release()
+
+    def test_busy_error_returns_503(self):
+        @self.app.route('/_busy')
+        def busy():
+            raise PasswordHashPoolBusy('saturated')
+
+        response = self.app.test_client().get('/_busy')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
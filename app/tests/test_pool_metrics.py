@@ -0,0 +1,96 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_pool_metrics.py
+Description:
+The `test_pool_metrics.py` file tests the configurable, instrumented
+connection pool and the `/internal/pool` endpoint, using a throw-away SQLite
+database file.
+
+Key Features:
+1. **Configuration**: DB_POOL_* settings reach the engine's pool.
+2. **Checkout Metrics**: Checkouts and timeouts are counted, and in-use /
+   overflow gauges follow the connections held.
+3. **Internal Endpoint**: Hidden without a token, forbidden with a wrong one,
+   JSON with the right one.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import exc
+from app import create_app
+from app.models import db
+from app.monitoring.pool_metrics import InstrumentedQueuePool, engine_options, pool_stats
+
+
+class TestPoolMetrics(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with a one-connection pool and a one-second timeout."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'DB_POOL_SIZE': 1,
+            'DB_POOL_MAX_OVERFLOW': 1,
+            'DB_POOL_TIMEOUT': 1,
+            'INTERNAL_API_TOKEN': 'internal-secret',
+        })
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_config_reaches_the_pool(self):
+        with self.app.app_context():
+            pool = db.engine.pool
+            self.assertIsInstance(pool, InstrumentedQueuePool)
+            self.assertEqual((pool.size(), pool._max_overflow, pool._timeout), (1, 1, 1))
+            self.assertTrue(pool._pre_ping)
+
+    def test_in_memory_sqlite_keeps_its_pool(self):
+        self.assertNotIn('poolclass', engine_options({'SQLALCHEMY_DATABASE_URI': 'sqlite://'}))
+
+    def test_checkouts_overflow_and_timeouts(self):
+        with self.app.app_context():
+            engine = db.engine
+            before = pool_stats(engine)
+            first, second = engine.connect(), engine.connect()
+            stats = pool_stats(engine)
+            self.assertEqual((stats['checked_out'], stats['overflow']), (2, 1))
+            with self.assertRaises(exc.TimeoutError):
+                engine.connect()
+            first.close()
+            second.close()
+
+            stats = pool_stats(engine)
+            self.assertEqual(stats['checked_out'], 0)
+            self.assertEqual(stats['checkouts'] - before['checkouts'], 2)
+            self.assertEqual(stats['timeouts'] - before['timeouts'], 1)
+            self.assertEqual(stats['wait_ms_buckets']['+Inf'],
+                             before['wait_ms_buckets']['+Inf'] + 3)
+            self.assertGreaterEqual(stats['wait_ms_max'], 1000)
+
+    def test_internal_endpoint_requires_token(self):
+        self.assertEqual(self.client.get('/internal/pool').status_code, 403)
+        response = self.client.get('/internal/pool',
+                                   headers={'X-Internal-Token': 'internal-secret'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('checkouts', response.get_json()['default'])
+
+        self.app.config['INTERNAL_API_TOKEN'] = None
+        self.assertEqual(self.client.get('/internal/pool').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_query_budget.py
+Description:
+The `test_query_budget.py` file tests the `query_budget` test utility and
+holds the character list to a statement count that does not depend on how
+many characters, houses, roles and strengths the page shows.
+
+Key Features:
+1. **Utility**: Blocks within budget pass; blocks over budget fail with the
+   statements listed.
+2. **No N+1 on the List**: A full page of characters, each with its own
+   house, role and strength, runs as many statements as a page of one.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import text
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+from app.tests.query_budget import ROUTE_BUDGETS, query_budget, route_budget
+
+
+class TestQueryBudget(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with one logged-in user."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            self.user_id = data_manager().add_user('budget', 'budget@example.com', 'Test@1234',
+                                                   date(1990, 1, 1), None, None).id
+            db.session.commit()
+        with route_budget('POST auth.login'):
+            self.client.post('/auth/login', data={'email': 'budget@example.com',
+                                                  'password': 'Test@1234'})
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _add_characters(self, start, count):
+        with self.app.app_context():
+            manager = data_manager()
+            names = [f'{i:02}' for i in range(start, start + count)]
+            houses = manager.bulk_upsert_houses([f'House {name}' for name in names])
+            roles = manager.bulk_upsert_roles([f'Role {name}' for name in names])
+            strengths = manager.bulk_upsert_strengths([f'Strength {name}' for name in names])
+            manager.bulk_add_characters([
+                {'name': f'Character {name}', 'user_id': self.user_id,
+                 'house_id': houses[f'House {name}'], 'role_id': roles[f'Role {name}'],
+                 'strength_id': strengths[f'Strength {name}']} for name in names])
+            db.session.commit()
+
+    def _list_statements(self):
+        with route_budget('GET user.my_character_list') as statements:
+            response = self.client.get('/user/character_list')
+        self.assertEqual(response.status_code, 200)
+        return len(statements), response.data
+
+    def test_over_budget_fails_with_the_statements(self):
+        with self.app.app_context():
+            with query_budget(2) as statements:
+                db.session.execute(text('SELECT 1'))
+                db.session.execute(text('SELECT 2'))
+            self.assertEqual(len(statements), 2)
+
+            with self.assertRaises(AssertionError) as raised:
+                with query_budget(1, 'two selects'):
+                    db.session.execute(text('SELECT 1'))
+                    db.session.execute(text('SELECT 2'))
+        message = str(raised.exception)
+        self.assertIn('two selects ran 2 SQL statements, over its budget of 1', message)
+        self.assertIn('  2. SELECT 2', message)
+
+    def test_list_does_not_grow_with_rows(self):
+        self._add_characters(0, 1)
+        one, _ = self._list_statements()
+        # A full page (five rows) plus a second page
+        self._add_characters(1, 9)
+        full, page = self._list_statements()
+        self.assertTrue(b'House 04' in page and b'Strength 04' in page)
+        self.assertEqual(one, full)
+        self.assertEqual(full, ROUTE_BUDGETS['GET user.my_character_list'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_replica_routing.py
+Description:
+The `test_replica_routing.py` file tests read-replica routing with two
+throw-away SQLite files standing in for the primary and the replica. The
+files hold different rows on purpose, so every assertion shows which database
+answered.
+
+Key Features:
+1. **Marked Reads**: Queries with `read_replica=True` (or inside
+   `read_replica()`) read from the replica; unmarked queries use the primary.
+2. **Read-Your-Writes**: Once a transaction has written, its reads stay on
+   the primary.
+3. **Sticky Primary**: After a user writes, their character list is read
+   from the primary for `REPLICA_STICKY_SECONDS`.
+4. **No Shared Bind**: The replica engine lives on its app, so other apps in
+   the process are unaffected.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from app import create_app
+from app.models import db, User, House, Character
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+from app.datamanager.replica_routing import app_engines, read_replica
+
+
+class TestReplicaRouting(unittest.TestCase):
+
+    def setUp(self):
+        """Create a primary and a replica file holding different data."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'primary.db'),
+            'REPLICA_DATABASE_URL': 'sqlite:///' + os.path.join(self.tmp_dir, 'replica.db'),
+            'REPLICA_STICKY_SECONDS': 60,
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            replica = self.app.extensions['replica']
+            db.create_all()
+            db.metadata.create_all(replica)
+            user = User(username='reader', email='reader@example.com',
+                        date_of_birth=date(1990, 1, 1))
+            user.set_password('Test@1234')
+            db.session.add_all([user, House(name='Primary House')])
+            db.session.commit()
+            self.user_id = user.id
+            with replica.begin() as connection:
+                connection.execute(House.__table__.insert(), [{'name': 'Replica House'}])
+                connection.execute(Character.__table__.insert(),
+                                   [{'name': 'Replica Character', 'user_id': user.id}])
+
+    def tearDown(self):
+        """Drop both temporary databases."""
+        with self.app.app_context():
+            db.session.remove()
+            for engine in app_engines().values():
+                engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _house_names(self, query):
+        return [house.name for house in query.all()]
+
+    def test_marked_reads_use_the_replica(self):
+        with self.app.app_context():
+            self.assertEqual(self._house_names(House.query), ['Primary House'])
+            self.assertEqual(self._house_names(
+                House.query.execution_options(read_replica=True)), ['Replica House'])
+            with read_replica(db.session):
+                self.assertEqual(self._house_names(House.query), ['Replica House'])
+
+            data_manager = PostgreSQLDataManager(self.app)
+            self.assertEqual([h.name for h in data_manager.get_all_houses()], ['Replica House'])
+
+    def test_reads_after_a_write_use_the_primary(self):
+        with self.app.app_context():
+            db.session.add(House(name='New House'))
+            db.session.flush()
+            names = self._house_names(House.query.execution_options(read_replica=True))
+            self.assertEqual(sorted(names), ['New House', 'Primary House'])
+            db.session.rollback()
+
+    def test_user_sticks_to_primary_after_writing(self):
+        self.client.post('/auth/login', data={'email': 'reader@example.com',
+                                              'password': 'Test@1234'})
+        page = self.client.get('/user/character_list')
+        self.assertIn(b'Replica Character', page.data)
+
+        self.client.post('/user/add_character', data={'name': 'Arya'})
+        page = self.client.get('/user/character_list')
+        self.assertNotIn(b'Replica Character', page.data)
+        self.assertIn(b'Arya Stark', page.data)
+
+        # Another client (no recent writes) still reads from the replica
+        other = self.app.test_client()
+        other.post('/auth/login', data={'email': 'reader@example.com',
+                                        'password': 'Test@1234'})
+        self.assertIn(b'Replica Character', other.get('/user/character_list').data)
+
+    def test_replica_is_not_a_shared_bind(self):
+        with self.app.app_context():
+            self.assertIn('replica', app_engines())
+            self.assertNotIn('replica', db.engines)
+        self.assertNotIn('replica', db.metadatas)
+
+        # A later app without a replica in the same process still works
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'other.db'),
+            'SECRET_KEY': 'test-secret',
+        })
+        with app.app_context():
+            db.create_all()
+            self.assertEqual(list(app_engines()), [None])
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_reports.py
+Description:
+The `test_reports.py` file tests `PostgreSQLDataManager.get_reports` and the
+per-day rollups against a throw-away SQLite database, and checks the
+PostgreSQL estimate expression by compiling it.
+
+Key Features:
+1. **One Statement**: All report numbers come from a single query.
+2. **TTL Cache**: Repeated calls within the TTL do not query again.
+3. **Estimates**: On PostgreSQL, counts use pg_class.reltuples above the
+   threshold and fall back to COUNT(*) below it.
+4. **Incremental Rollups**: Only the latest stored day onwards is recounted,
+   by `refresh_daily_rollups` or `flask refresh-rollups`; reads never write.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from app import create_app
+from app.models import db, User, House, Character
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+from app.datamanager.statements import count_expression
+
+
+class TestReports(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database with some data."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'REPORTS_CACHE_TTL': 60,
+        })
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self._add_user('first', datetime(2026, 10, 1, 9))
+        self._add_user('second', datetime(2026, 10, 1, 18))
+        self._add_user('third', datetime(2026, 10, 3, 12))
+        db.session.add(House(name='Stark'))
+        db.session.commit()
+        self.data_manager = PostgreSQLDataManager(self.app)
+
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._record)
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        event.remove(db.engine, 'before_cursor_execute', self._record)
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _add_user(self, name, created_at):
+        user = User(username=name, email=f'{name}@example.com', password='x',
+                    created_at=created_at)
+        db.session.add(user)
+        db.session.add(Character(name=f'{name} character', user=user, created_at=created_at))
+
+    def test_reports_use_one_cached_statement(self):
+        expected = {'user_count': 3, 'character_count': 3, 'house_count': 1}
+        self.assertEqual(self.data_manager.get_reports(), expected)
+        self.assertEqual(len(self.statements), 1)
+
+        self.assertEqual(self.data_manager.get_reports(), expected)
+        self.assertEqual(len(self.statements), 1)
+
+        self.assertEqual(self.data_manager.get_reports(use_cache=False), expected)
+        self.assertEqual(len(self.statements), 2)
+
+    def test_postgresql_estimate_expression(self):
+        expression = count_expression(Character, 1000, 'postgresql')
+        sql = str(select(expression).compile(dialect=postgresql.dialect()))
+        self.assertIn('CASE WHEN', sql)
+        self.assertIn('pg_class.reltuples', sql)
+        self.assertIn('AS REGCLASS', sql)
+        self.assertIn('count(*)', sql)
+
+        exact = count_expression(Character, 0, 'postgresql')
+        self.assertNotIn('reltuples', str(select(exact).compile(dialect=postgresql.dialect())))
+
+    def test_daily_rollups_are_incremental(self):
+        # Reading does not refresh (or write) anything
+        self.assertEqual(self.data_manager.get_daily_rollups(), [])
+        self.data_manager.refresh_daily_rollups()
+        rollups = self.data_manager.get_daily_rollups()
+        self.assertEqual(rollups, [
+            {'day': date(2026, 10, 3), 'signups': 1, 'characters_created': 1},
+            {'day': date(2026, 10, 1), 'signups': 2, 'characters_created': 2},
+        ])
+
+        self._add_user('fourth', datetime(2026, 10, 3, 20))
+        self._add_user('fifth', datetime(2026, 10, 4, 8))
+        db.session.commit()
+        self.assertEqual(len(self.data_manager.get_daily_rollups()), 2)
+        # Only the latest stored day (2026-10-03) onwards is recounted
+        self.assertEqual(self.data_manager.refresh_daily_rollups(), 2)
+
+        rollups = {r['day']: r for r in self.data_manager.get_daily_rollups()}
+        self.assertEqual(rollups[date(2026, 10, 1)]['signups'], 2)
+        self.assertEqual(rollups[date(2026, 10, 3)]['signups'], 2)
+        self.assertEqual(rollups[date(2026, 10, 4)]['characters_created'], 1)
+
+    def test_refresh_rollups_command(self):
+        result = self.app.test_cli_runner().invoke(args=['refresh-rollups'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Refreshed 2 day(s)', result.output)
+        self.assertEqual([r['signups'] for r in self.data_manager.get_daily_rollups()], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_request_profiler.py
+Description:
+The `test_request_profiler.py` file tests the on-demand request profiler
+and the `/internal/profiles` endpoints.
+
+Key Features:
+1. **Authorization**: Requests without the header, or without the right
+   token, are not profiled.
+2. **Store**: Profiles land in a ring of `PROFILE_KEEP` dumps that pstats
+   can read, and the page is served unchanged.
+3. **Download**: The dump replaces the response body.
+4. **One at a Time**: A second profiling request runs unprofiled.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from app import create_app
+from app.models import db
+
+TOKEN = {'X-Internal-Token': 'internal-secret'}
+
+
+class TestRequestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with a profile directory keeping two dumps."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.profile_dir = os.path.join(self.tmp_dir, 'profiles')
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'INTERNAL_API_TOKEN': 'internal-secret',
+            'PROFILE_DIR': self.profile_dir,
+            'PROFILE_KEEP': 2,
+        })
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        """Drop the temporary database and profiles."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _stats(self, path):
+        return {function for _, _, function in pstats.Stats(path).stats}
+
+    def test_unauthorized_requests_are_not_profiled(self):
+        plain = self.client.get('/auth/login')
+        for headers in ({'X-Profile': 'store'},
+                        {'X-Profile': 'store', 'X-Internal-Token': 'wrong'},
+                        {'X-Profile': 'flamegraph', **TOKEN}):
+            response = self.client.get('/auth/login', headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Profile-Id', response.headers)
+            self.assertEqual(response.data, plain.data)
+        self.assertFalse(os.path.exists(self.profile_dir))
+
+    def test_store_keeps_a_ring_of_dumps(self):
+        plain = self.client.get('/auth/login')
+        names = []
+        for _ in range(3):
+            response = self.client.get('/auth/login', headers={'X-Profile': 'store', **TOKEN})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, plain.data)
+            self.assertEqual(int(response.headers['Content-Length']), len(plain.data))
+            names.append(response.headers['X-Profile-Id'])
+
+        self.assertEqual(sorted(os.listdir(self.profile_dir)), sorted(names[1:]))
+        self.assertIn('login', self._stats(os.path.join(self.profile_dir, names[-1])))
+        self.assertRegex(names[-1], r'-GET-auth_login-\d+ms\.pstats$')
+
+        listing = self.client.get('/internal/profiles', headers=TOKEN).get_json()
+        self.assertEqual([profile['name'] for profile in listing], names[:0:-1])
+        download = self.client.get(f'/internal/profiles/{names[-1]}', headers=TOKEN)
+        self.assertEqual(download.status_code, 200)
+        self.assertIn('attachment', download.headers['Content-Disposition'])
+        download.close()
+        self.assertEqual(self.client.get('/internal/profiles/../test.db',
+                                         headers=TOKEN).status_code, 404)
+        self.assertEqual(self.client.get('/internal/profiles', headers={}).status_code, 403)
+
+    def test_download_returns_the_dump(self):
+        response = self.client.get('/no/such/page?_profile=download', headers=TOKEN)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Profiled-Status'], '404 NOT FOUND')
+        self.assertEqual(response.content_type, 'application/octet-stream')
+        path = os.path.join(self.tmp_dir, 'download.pstats')
+        with open(path, 'wb') as f:
+            f.write(response.data)
+        self.assertIn('wsgi_app', self._stats(path))
+        self.assertFalse(os.path.exists(self.profile_dir))
+
+    def test_one_profile_at_a_time(self):
+        profiler = self.app.wsgi_app
+        with profiler._busy:
+            response = self.client.get('/auth/login', headers={'X-Profile': 'store', **TOKEN})
+        self.assertEqual(response.headers['X-Profile'], 'busy')
+        self.assertNotIn('X-Profile-Id', response.headers)
+
+    def test_profiler_can_be_disabled(self):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'test-secret',
+                          'INTERNAL_API_TOKEN': 'internal-secret', 'PROFILER_ENABLED': False,
+                          'PROFILE_DIR': self.profile_dir})
+        response = app.test_client().get('/auth/login', headers={'X-Profile': 'store', **TOKEN})
+        self.assertNotIn('X-Profile-Id', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
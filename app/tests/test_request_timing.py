@@ -0,0 +1,115 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_request_timing.py
+Description:
+The `test_request_timing.py` file tests the per-request timing middleware:
+the `Server-Timing` header, the structured log line, SQL and cache counters
+and the configuration switches.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+from app.monitoring import request_timing
+
+
+def _test_app(tmp_dir, **overrides):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp_dir, 'test.db'),
+        'TESTING': True,
+        'SECRET_KEY': 'test-secret',
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'PASSWORD_HASH_POOL_SIZE': 0,
+        **overrides,
+    })
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+class TestRequestTiming(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with one logged-in user."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = _test_app(self.tmp_dir)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            data_manager().add_user('timing', 'timing@example.com', 'Test@1234',
+                                    date(1990, 1, 1), None, None)
+            db.session.commit()
+        self.client.post('/auth/login', data={'email': 'timing@example.com',
+                                              'password': 'Test@1234'})
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_server_timing_header_and_log_line(self):
+        with self.assertLogs('app.request_timing', 'INFO') as logs:
+            response = self.client.get('/user/character_list')
+        self.assertEqual(response.status_code, 200)
+
+        header = response.headers['Server-Timing']
+        self.assertRegex(header, r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", '
+                                 r'tpl;dur=[\d.]+, cache;desc="hits=0 misses=0"$')
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertEqual((line['method'], line['path'], line['status']),
+                         ('GET', '/user/character_list', 200))
+        self.assertEqual(line['endpoint'], 'user.my_character_list')
+        # Session user, count and page queries
+        self.assertGreaterEqual(line['sql_count'], 3)
+        self.assertEqual(int(re.search(r'"(\d+) queries"', header).group(1)), line['sql_count'])
+        self.assertGreater(line['template_ms'], 0)
+        self.assertGreaterEqual(line['duration_ms'], line['sql_ms'])
+        # A read-only request does not commit
+        self.assertEqual(line['commit_ms'], 0)
+
+    def test_commit_time_is_reported(self):
+        with self.assertLogs('app.request_timing', 'INFO') as logs:
+            response = self.client.post('/user/add_character', data={'name': 'Jon Snow'})
+        self.assertEqual(response.status_code, 302)
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertGreater(line['commit_ms'], 0)
+        db_ms = float(re.search(r'db;dur=([\d.]+)', response.headers['Server-Timing']).group(1))
+        self.assertAlmostEqual(db_ms, line['sql_ms'] + line['commit_ms'], delta=0.02)
+
+    def test_cache_counters_and_no_request(self):
+        with self.app.test_request_context('/'):
+            request_timing.start_request()
+            data_manager().get_reports()
+            data_manager().get_reports()
+            timing = request_timing.current_timing()
+            self.assertEqual((timing.cache_hits, timing.cache_misses), (1, 1))
+            self.assertEqual(timing.sql_count, 1)
+            request_timing.end_request()
+        # Outside of requests nothing is recorded
+        with self.app.app_context():
+            data_manager().get_reports(use_cache=False)
+        self.assertIsNone(request_timing.current_timing())
+
+    def test_header_can_be_disabled(self):
+        app = _test_app(self.tmp_dir, SERVER_TIMING_HEADER=False)
+        self.assertNotIn('Server-Timing', app.test_client().get('/auth/login').headers)
+        app = _test_app(self.tmp_dir, REQUEST_TIMING_ENABLED=False)
+        with self.assertNoLogs('app.request_timing', 'INFO'):
+            response = app.test_client().get('/auth/login')
+        self.assertNotIn('Server-Timing', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
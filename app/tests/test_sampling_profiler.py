@@ -0,0 +1,110 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_sampling_profiler.py
+Description:
+The `test_sampling_profiler.py` file tests the always-on sampling profiler
+and the `/internal/sampling` endpoints.
+
+Key Features:
+1. **Attribution**: A busy view's frames are counted under its endpoint and
+   served as folded stacks.
+2. **Bounds**: Idle threads are not sampled, and stacks beyond the limit are
+   counted together.
+3. **Switch**: A disabled sampler has no hooks and no endpoints.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from app import create_app
+from app.models import db
+from app.monitoring.sampling_profiler import OTHER_STACKS, SamplingProfiler
+
+TOKEN = {'X-Internal-Token': 'internal-secret'}
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestSamplingProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app with a fast sampler and a busy test view."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'INTERNAL_API_TOKEN': 'internal-secret',
+            'SAMPLING_PROFILER_HZ': 200,
+        })
+        self.app.add_url_rule('/_spin', 'spin', lambda: _spin(0.3) or 'done')
+        self.client = self.app.test_client()
+        self.sampler = self.app.extensions['sampling_profiler']
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_busy_view_is_attributed_to_its_endpoint(self):
+        self.client.delete('/internal/sampling', headers=TOKEN)
+        self.assertEqual(self.client.get('/_spin').data, b'done')
+
+        stats = self.client.get('/internal/sampling', headers=TOKEN).get_json()
+        self.assertTrue(stats['running'])
+        self.assertEqual(stats['hz'], 200)
+        self.assertGreater(stats['endpoints']['spin'], 5)
+        self.assertLess(stats['overhead'], 0.5)
+
+        folded = self.client.get('/internal/sampling/folded?endpoint=spin', headers=TOKEN)
+        self.assertEqual(folded.content_type, 'text/plain; charset=utf-8')
+        stack, count = folded.get_data(as_text=True).splitlines()[0].rsplit(' ', 1)
+        self.assertTrue(stack.endswith(f'{__name__}:_spin'))
+        self.assertIn('flask.app:Flask.wsgi_app', stack)
+        self.assertGreater(int(count), 0)
+
+        everything = self.client.get('/internal/sampling/folded', headers=TOKEN).get_data(as_text=True)
+        self.assertIn('spin;', everything)
+
+        self.assertEqual(self.client.delete('/internal/sampling', headers=TOKEN).status_code, 204)
+        self.assertNotIn('spin', self.client.get('/internal/sampling', headers=TOKEN).get_json()['endpoints'])
+        self.assertEqual(self.client.get('/internal/sampling', headers={}).status_code, 403)
+
+    def test_idle_threads_and_stack_limit(self):
+        sampler = SamplingProfiler()
+        sampler.max_stacks = 1
+        sampler.sample()
+        self.assertEqual(sampler.stats()['ticks'], 0)
+
+        sampler._active[threading.get_ident()] = 'here'
+        sampler.sample()
+        (lambda: sampler.sample())()
+        sampler.sample()
+        stacks = sampler._stacks['here']
+        self.assertEqual(len(stacks), 2)
+        self.assertEqual(stacks[OTHER_STACKS], 1)
+        self.assertEqual(sampler.stats()['endpoints'], {'here': 3})
+
+    def test_sampler_can_be_disabled(self):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'test-secret',
+                          'INTERNAL_API_TOKEN': 'internal-secret',
+                          'SAMPLING_PROFILER_ENABLED': False})
+        self.assertNotIn('sampling_profiler', app.extensions)
+        self.assertEqual(app.test_client().get('/internal/sampling', headers=TOKEN).status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
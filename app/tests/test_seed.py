@@ -0,0 +1,154 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_seed.py
+Description:
+The `test_seed.py` file tests the `flask seed` command that generates
+synthetic data for scale testing.
+
+Key Features:
+1. **Counts and Shape**: The requested users and contacts are created,
+   characters per user are skewed around the requested mean, and creation
+   times lie in the past year.
+2. **Determinism**: The same seed gives the same rows.
+3. **Usable Rows**: Seeded users can log in and see their characters, and
+   the per-day rollups count them.
+4. **Catalog**: The catalog file has the format of `characters.json`.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from sqlalchemy import func, select
+from app import create_app
+from app.models import db, User, Character, Contact, House
+from app.datamanager.data_manager_factory import data_manager
+
+
+class TestSeedCommand(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on an empty temporary database."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = self._create_app('test.db')
+
+    def _create_app(self, name):
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, name),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+        with app.app_context():
+            db.create_all()
+        return app
+
+    def tearDown(self):
+        """Drop the temporary databases."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _seed(self, app, *args):
+        # Run in this app even if another test left its app context pushed
+        with app.app_context():
+            return app.test_cli_runner().invoke(args=['seed', *args])
+
+    def _rows(self, app):
+        with app.app_context():
+            return (db.session.execute(select(User.username, User.email)
+                                       .order_by(User.id)).all(),
+                    db.session.execute(select(Character.name, Character.user_id, Character.age,
+                                              Character.house_id).order_by(Character.id)).all())
+
+    def test_counts_and_skew(self):
+        result = self._seed(self.app, '--users', '300', '--characters-per-user', '8',
+                            '--contacts', '40', '--lookups', '30')
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('characters', result.output)
+
+        with self.app.app_context():
+            self.assertEqual(db.session.scalar(select(func.count(User.id))), 300)
+            self.assertEqual(db.session.scalar(select(func.count(Contact.id))), 40)
+            self.assertEqual(db.session.scalar(select(func.count(House.id))), 30)
+            per_user = sorted(db.session.execute(
+                select(func.count(Character.id)).group_by(Character.user_id)).scalars())
+            created = db.session.execute(select(func.min(Character.created_at),
+                                                func.max(Character.created_at))).one()
+        self.assertEqual(len(per_user), 300)
+        # Spread over the year before today, never in the future
+        today = datetime.combine(date.today(), datetime.min.time())
+        self.assertLessEqual(created[1], today)
+        self.assertGreaterEqual(created[0], today - timedelta(days=365))
+        self.assertGreater(created[1] - created[0], timedelta(days=300))
+        self.assertAlmostEqual(sum(per_user) / len(per_user), 8, delta=3)
+        # Long tail: the busiest user owns far more than the median one
+        self.assertGreater(per_user[-1], 4 * per_user[len(per_user) // 2])
+
+    def test_same_seed_same_rows(self):
+        other = self._create_app('other.db')
+        try:
+            for app in (self.app, other):
+                self.assertEqual(self._seed(app, '--users', '50', '--seed', '7').exit_code, 0)
+            self.assertEqual(self._rows(self.app), self._rows(other))
+        finally:
+            with other.app_context():
+                db.engine.dispose()
+
+        self._seed(self.app, '--users', '50', '--seed', '8', '--prefix', 'second')
+        users, characters = self._rows(self.app)
+        self.assertEqual(len(users), 100)
+        self.assertNotEqual([c[2] for c in characters if c[1] <= 50][:20],
+                            [c[2] for c in characters if c[1] > 50][:20])
+
+    def test_seeded_users_can_log_in(self):
+        result = self._seed(self.app, '--users', '5', '--password', 'Seeded@1234')
+        self.assertEqual(result.exit_code, 0, result.output)
+        client = self.app.test_client()
+        response = client.post('/auth/login', data={'email': 'seed_user_3@example.com',
+                                                    'password': 'Seeded@1234'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(client.get('/user/character_list').status_code, 200)
+
+    def test_rollups_count_the_backdated_rows(self):
+        with self.app.app_context():
+            data_manager().add_user('existing', 'existing@example.com', 'Test@1234',
+                                    date(1990, 1, 1), None, None)
+            data_manager().refresh_daily_rollups()
+            db.session.commit()
+        self.assertEqual(self._seed(self.app, '--users', '200').exit_code, 0)
+
+        with self.app.app_context():
+            rollups = data_manager().get_daily_rollups(400)
+            characters = db.session.scalar(select(func.count(Character.id)))
+        self.assertEqual(sum(day['signups'] for day in rollups), 201)
+        self.assertEqual(sum(day['characters_created'] for day in rollups), characters)
+        self.assertGreater(len(rollups), 100)
+
+    def test_existing_prefix_is_refused(self):
+        self.assertEqual(self._seed(self.app, '--users', '5').exit_code, 0)
+        result = self._seed(self.app, '--users', '5')
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("prefix 'seed' exist already", result.output)
+
+    def test_catalog_file(self):
+        path = os.path.join(self.tmp_dir, 'catalog.json')
+        result = self._seed(self.app, '--users', '0', '--catalog', path, '--catalog-size', '500')
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(path) as f:
+            catalog = json.load(f)
+        self.assertEqual([entry['id'] for entry in catalog], list(range(1, 501)))
+        with open(os.path.join(os.path.dirname(__file__), '..', 'characters.json')) as f:
+            self.assertEqual(set(catalog[0]), set(json.load(f)[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
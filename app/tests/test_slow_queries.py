@@ -0,0 +1,127 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_slow_queries.py
+Description:
+The `test_slow_queries.py` file tests the slow-query log against a throw-away
+SQLite database, with a threshold low enough that every statement is slow.
+
+Key Features:
+1. **Context**: Logged statements carry their parameters, route and user id.
+2. **Plans**: The plan arrives later on the background thread under the same
+   id, and is skipped for a shared in-memory connection.
+3. **Rate Limit**: Statements over the per-minute limit are suppressed and
+   counted in the next logged line.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import text
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+
+EVERYTHING_IS_SLOW = 0.0001
+
+
+class TestSlowQueries(unittest.TestCase):
+
+    def setUp(self):
+        """Create a database file and a user."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = self._create_app()
+        with self.app.app_context():
+            db.create_all()
+            self.user_id = data_manager().add_user('slow', 'slow@example.com', 'Test@1234',
+                                                   date(1990, 1, 1), None, None).id
+            db.session.commit()
+        self.slow_log = self.app.extensions['slow_query_log']
+        self.slow_log.wait()
+
+    def _create_app(self, **overrides):
+        return create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+            'SLOW_QUERY_THRESHOLD_MS': EVERYTHING_IS_SLOW,
+            'SLOW_QUERY_LOG_PER_MINUTE': 1000,
+            **overrides,
+        })
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _lines(self, logs):
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_statement_context_and_plan(self):
+        client = self.app.test_client()
+        client.post('/auth/login', data={'email': 'slow@example.com', 'password': 'Test@1234'})
+        with self.assertLogs('app.slow_queries', 'WARNING') as logs:
+            self.assertEqual(client.get('/user/character_list?search=jon').status_code, 200)
+            self.slow_log.wait(timeout=5)
+
+        lines = self._lines(logs)
+        page = next(line for line in lines
+                    if 'statement' in line and line['statement'].startswith('SELECT character.id'))
+        self.assertEqual((page['method'], page['route'], page['user_id'], page['bind']),
+                         ('GET', 'user.my_character_list', self.user_id, 'default'))
+        self.assertIn("'%jon%'", page['parameters'])
+        self.assertIn('LIMIT', page['statement'])
+        self.assertEqual(page['suppressed'], 0)
+
+        plan = next(line['plan'] for line in lines if line.get('id') == page['id'] and 'plan' in line)
+        self.assertTrue(any('character' in str(row) for row in plan))
+        # The EXPLAIN statements themselves are not logged
+        self.assertFalse(any('EXPLAIN' in line.get('statement', '') for line in lines))
+
+    def test_rate_limit_and_parameters_off(self):
+        app = self._create_app(SLOW_QUERY_LOG_PER_MINUTE=2, SLOW_QUERY_EXPLAIN=False,
+                               SLOW_QUERY_LOG_PARAMETERS=False)
+        slow_log = app.extensions['slow_query_log']
+        # Start a new minute (the startup email scan took a slot of this one)
+        slow_log._window_started -= 60
+        with app.app_context(), self.assertLogs('app.slow_queries', 'WARNING') as logs:
+            for number in range(5):
+                db.session.execute(text('SELECT :number'), {'number': number})
+            # A minute later the next statement is logged with the suppressed count
+            slow_log._window_started -= 60
+            db.session.execute(text('SELECT 42'))
+            db.session.remove()
+
+        lines = self._lines(logs)
+        self.assertEqual([line['statement'] for line in lines],
+                         ['SELECT ?', 'SELECT ?', 'SELECT 42'])
+        self.assertEqual([line['suppressed'] for line in lines], [0, 0, 3])
+        self.assertEqual({line['parameters'] for line in lines}, {None})
+        self.assertIsNone(lines[0]['route'])
+        self.assertIsNone(slow_log._executor)
+
+    def test_no_plan_on_a_shared_connection(self):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'test-secret',
+                          'SLOW_QUERY_THRESHOLD_MS': EVERYTHING_IS_SLOW})
+        with app.app_context(), self.assertLogs('app.slow_queries', 'WARNING') as logs:
+            db.session.execute(text('SELECT 1'))
+        self.assertNotIn('plan', self._lines(logs)[-1])
+        self.assertIsNone(app.extensions['slow_query_log']._executor)
+
+    def test_threshold_zero_disables(self):
+        app = self._create_app(SLOW_QUERY_THRESHOLD_MS=0)
+        self.assertNotIn('slow_query_log', app.extensions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_sqlite_data_manager.py
+Description:
+The `test_sqlite_data_manager.py` file tests `SQLiteDataManager` and the
+per-connection SQLite tuning applied by `create_app`.
+
+Key Features:
+1. **PRAGMAs**: New connections run in WAL mode with the configured busy
+   timeout, synchronous level and mmap size.
+2. **Capabilities**: The PostgreSQL-only paths are off; bulk updates and
+   reports still work through the portable fallbacks.
+3. **Indexes**: The SQLite schema carries the same indexes and unique
+   constraints as PostgreSQL, and matches `app/db/sqlite_script`.
+4. **Concurrency**: A reader is not blocked by an open write transaction.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import text
+from app import create_app
+from app.models import db, User, Character
+from app.datamanager.sqlite_data_manager import SQLiteDataManager, sqlite_pragmas
+
+SQLITE_SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'db', 'sqlite_script')
+
+
+class TestSQLiteDataManager(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database file."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'edge.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'SQLITE_BUSY_TIMEOUT_MS': 1234,
+            'SQLITE_MMAP_SIZE': 1 << 20,
+        })
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        self.data_manager = SQLiteDataManager(self.app)
+        user = User(username='edge', email='edge@example.com', password='x',
+                    date_of_birth=date(1990, 1, 1))
+        db.session.add(user)
+        db.session.commit()
+        self.user_id = user.id
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _pragma(self, name):
+        return db.session.execute(text(f'PRAGMA {name}')).scalar()
+
+    def test_connections_are_tuned(self):
+        self.assertEqual(self._pragma('journal_mode'), 'wal')
+        self.assertEqual(self._pragma('busy_timeout'), 1234)
+        self.assertEqual(self._pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self._pragma('mmap_size'), 1 << 20)
+
+    def test_invalid_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            sqlite_pragmas({'SQLITE_SYNCHRONOUS': 'SOMETIMES'})
+        self.assertNotIn('journal_mode',
+                         dict(sqlite_pragmas({}, 'sqlite:///:memory:')))
+
+    def test_requires_a_sqlite_database(self):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'x'})
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'postgresql://u@localhost/game'
+        with self.assertRaises(ValueError):
+            SQLiteDataManager(app)
+
+    def test_portable_fallbacks(self):
+        self.assertFalse(self.data_manager.supports_update_from_values)
+        self.assertFalse(self.data_manager.supports_row_estimates)
+        self.data_manager.bulk_add_characters(
+            [{'name': f'Character {i}', 'user_id': self.user_id} for i in range(4)])
+        ids = [c.id for c in Character.query.order_by(Character.id)]
+        self.assertEqual(self.data_manager.bulk_update_characters(
+            {character_id: {'age': 40} for character_id in ids}), 4)
+        db.session.commit()
+        self.assertEqual(self.data_manager.get_reports(use_cache=False)['character_count'], 4)
+
+    def test_schema_matches_sqlite_script(self):
+        script_db = os.path.join(self.tmp_dir, 'script.db')
+        with open(SQLITE_SCRIPT) as script:
+            sqlite3.connect(script_db).executescript(script.read()).connection.close()
+
+        def schema(path):
+            """{table: (columns, {(unique, indexed columns), ...})} as SQLite sees it."""
+            connection = sqlite3.connect(path)
+            try:
+                tables = [row[0] for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'")]
+                result = {}
+                for table in tables:
+                    columns = {row[1] for row in connection.execute(f'PRAGMA table_info({table})')}
+                    index_keys = set()
+                    for _, name, unique, *_ in connection.execute(f'PRAGMA index_list({table})'):
+                        index_columns = tuple(row[2] for row in connection.execute(
+                            f'PRAGMA index_info({name})'))
+                        index_keys.add((bool(unique), index_columns))
+                    result[table] = (columns, index_keys)
+                return result
+            finally:
+                connection.close()
+
+        models_schema = schema(os.path.join(self.tmp_dir, 'edge.db'))
+        self.assertEqual(models_schema, schema(script_db))
+        self.assertIn((False, ('created_at',)), models_schema['character'][1])
+        self.assertIn((True, ('user_id', 'name')), models_schema['character'][1])
+
+    def test_reader_is_not_blocked_by_a_writer(self):
+        with db.engine.connect() as writer:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO house (name) VALUES ('Pending')"))
+            with db.engine.connect() as reader:
+                self.assertEqual(reader.execute(text("SELECT count(*) FROM house")).scalar(), 0)
+            writer.rollback()
+
+
+if __name__ == '__main__':
+    unittest.main()
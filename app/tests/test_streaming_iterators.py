@@ -0,0 +1,76 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_streaming_iterators.py
+Description:
+The `test_streaming_iterators.py` file tests the iter_* methods of
+`PostgreSQLDataManager`, which stream tables in batches instead of loading
+every row with `.all()`. It runs against a throw-away SQLite database.
+
+Key Features:
+1. **Lazy**: Nothing is queried until the iterator is consumed.
+2. **Complete**: Every row comes back once, in primary key order, whatever
+   the batch size.
+3. **Row Tuples**: `rows=True` yields plain column tuples, not ORM objects.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import types
+import unittest
+from app import create_app
+from app.models import db, Contact
+from app.datamanager.postgre_sql_data_manager import PostgreSQLDataManager
+
+
+class TestStreamingIterators(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database with some contacts."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'DATA_MANAGER_STREAM_BATCH_SIZE': 4,
+        })
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([Contact(name=f'c{i}', email='c@example.com', message='hi')
+                            for i in range(10)])
+        db.session.commit()
+        db.session.expunge_all()
+        self.data_manager = PostgreSQLDataManager(self.app)
+
+    def tearDown(self):
+        """Drop the temporary database."""
+        db.session.remove()
+        db.engine.dispose()
+        self.context.pop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_iterator_is_lazy(self):
+        self.assertIsInstance(self.data_manager.iter_contacts(), types.GeneratorType)
+
+    def test_streams_every_instance(self):
+        for batch_size in (None, 1, 3, 100):
+            contacts = list(self.data_manager.iter_contacts(batch_size=batch_size))
+            self.assertTrue(all(isinstance(c, Contact) for c in contacts))
+            self.assertEqual([c.name for c in contacts], [f'c{i}' for i in range(10)])
+
+    def test_rows_option_yields_tuples(self):
+        rows = list(self.data_manager.iter_contacts(batch_size=3, rows=True))
+        self.assertEqual(len(rows), 10)
+        self.assertNotIsInstance(rows[0], Contact)
+        self.assertEqual((rows[0].name, rows[0].email), ('c0', 'c@example.com'))
+        # Row tuples are not tracked by the session
+        self.assertEqual(len(db.session.identity_map), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
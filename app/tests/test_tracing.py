@@ -0,0 +1,196 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_tracing.py
+Description:
+The `test_tracing.py` file tests request tracing: the span tree of a request,
+head-based sampling and both exporters (a file, and a stand-in OTLP/HTTP
+collector on a local port).
+
+Key Features:
+1. **Span Tree**: Adding a character yields the request, controller, helper,
+   SQL and template spans, linked to their parents.
+2. **Sampling**: The sample rate and an incoming `traceparent` decide which
+   requests are traced.
+3. **Errors**: Failed requests end their spans with an error status.
+4. **Off by Default**: Without an exporter nothing is wrapped.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import date
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from app import create_app
+from app.models import db
+from app.datamanager.data_manager_factory import data_manager
+from app.monitoring.tracing import span
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_ID = '00f067aa0ba902b7'
+
+
+class _Collector(BaseHTTPRequestHandler):
+    """Stand-in OTLP/HTTP collector keeping the export requests it receives."""
+
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.received.append((self.path, self.headers['Content-Type'], json.loads(body)))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app tracing every request into a file."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.trace_file = os.path.join(self.tmp_dir, 'traces.jsonl')
+        self.app = self._create_app()
+
+    def _create_app(self, **overrides):
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+            'TRACING_EXPORTER': 'file',
+            'TRACING_FILE': self.trace_file,
+            'TRACING_SAMPLE_RATE': 1.0,
+            **overrides,
+        })
+        with app.app_context():
+            db.create_all()
+        return app
+
+    def tearDown(self):
+        """Drop the temporary database and traces."""
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _traces(self):
+        """Return the exported spans grouped by trace id, in export order."""
+        self.app.extensions['tracing'].flush()
+        traces = {}
+        if not os.path.exists(self.trace_file):
+            return traces
+        with open(self.trace_file) as f:
+            for line in f:
+                for resource in json.loads(line)['resourceSpans']:
+                    self.assertEqual(resource['resource']['attributes'][0]['value'],
+                                     {'stringValue': 'game-api'})
+                    for scope in resource['scopeSpans']:
+                        for exported in scope['spans']:
+                            traces.setdefault(exported['traceId'], []).append(exported)
+        return traces
+
+    def _log_in(self, client):
+        with self.app.app_context():
+            data_manager().add_user('tracer', 'tracer@example.com', 'Test@1234',
+                                    date(1990, 1, 1), None, None)
+            db.session.commit()
+        client.post('/auth/login', data={'email': 'tracer@example.com', 'password': 'Test@1234'})
+
+    def test_span_tree_of_adding_a_character(self):
+        client = self.app.test_client()
+        self._log_in(client)
+        response = client.post('/user/add_character', data={'name': 'Jon Snow'})
+        self.assertEqual(response.status_code, 302)
+        client.get('/user/character_list')
+
+        traces = list(self._traces().values())
+        self.assertEqual(len(traces), 3)
+        add = {exported['name']: exported for exported in traces[1]}
+        root = add['POST user.user_add_character']
+        self.assertEqual(root['kind'], 2)
+        self.assertNotIn('parentSpanId', root)
+        self.assertIn({'key': 'http.status_code', 'value': {'intValue': '302'}},
+                      root['attributes'])
+        controller = add['user_add_character']
+        self.assertEqual(controller['parentSpanId'], root['spanId'])
+        self.assertEqual(add['fetch_character_data']['parentSpanId'], controller['spanId'])
+        self.assertEqual(add['find_or_create_house']['parentSpanId'],
+                         add['create_character_from_data']['spanId'])
+
+        statements = [exported for exported in traces[1] if exported['name'] == 'sql']
+        self.assertTrue(statements)
+        ids = {exported['spanId'] for exported in traces[1]}
+        self.assertTrue(all(exported['parentSpanId'] in ids for exported in statements))
+        self.assertTrue(any('INSERT INTO character' in attribute['value']['stringValue']
+                            for exported in statements for attribute in exported['attributes']
+                            if attribute['key'] == 'db.statement'))
+        for exported in traces[1]:
+            self.assertLessEqual(int(root['startTimeUnixNano']), int(exported['startTimeUnixNano']))
+            self.assertLessEqual(int(exported['endTimeUnixNano']), int(root['endTimeUnixNano']))
+
+        names = {exported['name'] for exported in traces[2]}
+        self.assertIn('render character_list.html', names)
+
+    def test_head_based_sampling(self):
+        app = self._create_app(TRACING_SAMPLE_RATE=0.0)
+        self.app = app
+        client = app.test_client()
+        client.get('/auth/login')
+        client.get('/auth/login', headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-00'})
+        client.get('/auth/login', headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-01'})
+        # An invalid header falls back to the sample rate
+        client.get('/auth/login', headers={'traceparent': f'00-{"0" * 32}-{PARENT_ID}-01'})
+
+        traces = self._traces()
+        self.assertEqual(list(traces), [TRACE_ID])
+        root = next(exported for exported in traces[TRACE_ID] if exported['kind'] == 2)
+        self.assertEqual(root['parentSpanId'], PARENT_ID)
+
+    def test_errors_end_spans_with_an_error_status(self):
+        def fail():
+            with span('step'):
+                raise ValueError('broken')
+        self.app.add_url_rule('/_fail', 'fail', fail)
+        self.app.config['PROPAGATE_EXCEPTIONS'] = False
+        self.assertEqual(self.app.test_client().get('/_fail').status_code, 500)
+
+        spans = {exported['name']: exported for exported in next(iter(self._traces().values()))}
+        self.assertEqual(spans['step']['status'], {'code': 2, 'message': 'ValueError: broken'})
+        self.assertEqual(spans['GET fail']['status']['code'], 2)
+
+    def test_otlp_exporter_posts_to_the_collector(self):
+        collector = HTTPServer(('127.0.0.1', 0), _Collector)
+        threading.Thread(target=collector.serve_forever, daemon=True).start()
+        self.addCleanup(collector.server_close)
+        self.addCleanup(collector.shutdown)
+        _Collector.received.clear()
+
+        self.app = self._create_app(TRACING_EXPORTER='otlp', TRACING_OTLP_ENDPOINT=(
+            f'http://127.0.0.1:{collector.server_port}/'))
+        self.app.test_client().get('/auth/login')
+        self.app.extensions['tracing'].flush()
+
+        path, content_type, payload = _Collector.received[0]
+        self.assertEqual((path, content_type), ('/v1/traces', 'application/json'))
+        spans = payload['resourceSpans'][0]['scopeSpans'][0]['spans']
+        self.assertIn('GET auth.login', [exported['name'] for exported in spans])
+
+    def test_tracing_is_off_without_an_exporter(self):
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'test-secret'})
+        self.assertNotIn('tracing', app.extensions)
+        self.assertFalse(hasattr(app.view_functions['auth.login'], '__wrapped__'))
+        with span('outside') as outside:
+            outside.set('ignored', True)
+
+
+if __name__ == '__main__':
+    unittest.main()
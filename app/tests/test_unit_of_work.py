@@ -0,0 +1,125 @@
+"""=============================================================================
+Project: Game API App
+Developer: Varsha Rana
+File: test_unit_of_work.py
+Description:
+The `test_unit_of_work.py` file tests the request-scoped unit of work in
+`app/datamanager/unit_of_work.py` against a throw-away SQLite database.
+
+Key Features:
+1. **Commit Once**: A successful request with several writes commits once.
+2. **Rollback**: Error responses and unhandled exceptions persist nothing.
+3. **Read-Only Requests**: Requests that only read never issue a commit.
+4. **Add Character**: Creating lookups and the character is one transaction.
+
+Created: 2026-10-19
+Updated: 2026-10-19
+=============================================================================
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app import create_app
+from app.models import db, User, Contact, House
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        """Create the app on a temporary SQLite database with test routes."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(self.tmp_dir, 'test.db'),
+            'TESTING': True,
+            'SECRET_KEY': 'test-secret',
+            'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+            'PASSWORD_HASH_POOL_SIZE': 0,
+        })
+
+        def add_contacts(count):
+            for i in range(count):
+                db.session.add(Contact(name=f'c{i}', email='c@example.com', message='hi'))
+                db.session.flush()
+
+        @self.app.route('/_write_ok')
+        def write_ok():
+            add_contacts(2)
+            return 'ok'
+
+        @self.app.route('/_write_then_400')
+        def write_then_400():
+            add_contacts(1)
+            return 'bad', 400
+
+        @self.app.route('/_write_then_raise')
+        def write_then_raise():
+            add_contacts(1)
+            raise RuntimeError('boom')
+
+        @self.app.route('/_read_only')
+        def read_only():
+            return str(Contact.query.count())
+
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+            user = User(username='uow', email='uow@example.com', date_of_birth=date(1990, 1, 1))
+            user.set_password('Test@1234')
+            db.session.add(user)
+            db.session.commit()
+
+        self.commits = 0
+        event.listen(Session, 'after_commit', self._count_commit)
+
+    def tearDown(self):
+        """Drop the temporary database and the commit listener."""
+        event.remove(Session, 'after_commit', self._count_commit)
+        with self.app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _count_commit(self, session):
+        self.commits += 1
+
+    def _contact_count(self):
+        with self.app.app_context():
+            return Contact.query.count()
+
+    def test_successful_request_commits_once(self):
+        self.assertEqual(self.client.get('/_write_ok').status_code, 200)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self._contact_count(), 2)
+
+    def test_error_response_rolls_back(self):
+        self.assertEqual(self.client.get('/_write_then_400').status_code, 400)
+        self.assertEqual(self.commits, 0)
+        self.assertEqual(self._contact_count(), 0)
+
+    def test_exception_rolls_back(self):
+        self.app.config['PROPAGATE_EXCEPTIONS'] = False
+        self.assertEqual(self.client.get('/_write_then_raise').status_code, 500)
+        self.assertEqual(self.commits, 0)
+        self.assertEqual(self._contact_count(), 0)
+
+    def test_read_only_request_does_not_commit(self):
+        self.assertEqual(self.client.get('/_read_only').status_code, 200)
+        self.assertEqual(self.commits, 0)
+
+    def test_add_character_is_one_transaction(self):
+        self.client.post('/auth/login', data={'email': 'uow@example.com',
+                                              'password': 'Test@1234'})
+        self.commits = 0
+        response = self.client.post('/user/add_character', data={'name': 'Arya'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.commits, 1)
+        with self.app.app_context():
+            self.assertIsNotNone(House.query.filter_by(name='Stark').first())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,13 +12,13 @@ Key Features:
 
 2. **Test Setup**:
    - Sets up the Flask app in test mode and simulates request contexts for testing.
-   - Mocks the database call to retrieve user data and patches the Flask session to simulate logged-in and non-logged-in states.
+   - Mocks the data manager's user lookup and patches the Flask session to simulate logged-in and non-logged-in states.
 
 3. **Application Context**:
    - Ensures that the application context is correctly pushed and popped around tests, allowing for accurate simulation of user interactions.
 
 Created: 2024-12-09
-Updated: 2024-12-09
+Updated: 2026-10-19
 =============================================================================
 """
 
@@ -54,12 +54,12 @@ class TestUserSession(unittest.TestCase):
         """Pop the application context."""
         self.app_context.pop()
 
-    @patch('app.controllers.common_fun.User.query.get')
-    def test_user_logged_in_logged_in(self, mock_get):
+    @patch('app.controllers.common_fun.data_manager')
+    def test_user_logged_in_logged_in(self, mock_data_manager):
         # Mock the user database call
         mock_user = MagicMock(User)
         mock_user.id = 1
-        mock_get.return_value = mock_user
+        mock_data_manager.return_value.get_user.return_value = mock_user
 
         # Patch the Flask session
         with self.app.test_request_context():
@@ -69,11 +69,12 @@ class TestUserSession(unittest.TestCase):
             user = user_logged_in()
             self.assertIsNotNone(user)
             self.assertEqual(user.id, 1)
+            mock_data_manager.return_value.get_user.assert_called_once_with(1)
 
-    @patch('app.controllers.common_fun.User.query.get')
-    def test_user_logged_in_not_logged_in(self, mock_get):
+    @patch('app.controllers.common_fun.data_manager')
+    def test_user_logged_in_not_logged_in(self, mock_data_manager):
         # Mock the user database call
-        mock_get.return_value = None
+        mock_data_manager.return_value.get_user.return_value = None
 
         # Clear the Flask session
         with self.app.test_request_context():
@@ -82,6 +83,7 @@ class TestUserSession(unittest.TestCase):
             # Call the function
             user = user_logged_in()
             self.assertIsNone(user)
+            mock_data_manager.return_value.get_user.assert_not_called()
 
 
 if __name__ == '__main__':
@@ -11,10 +11,11 @@ Description: This file contains the configuration settings for the Game Api App.
              while providing default fallback values where necessary. Flask testing
              mode is also enabled for development purposes.
 Created: 2024-12-02
-Updated: 2024-12-08
+Updated: 2026-10-19
 =============================================================================
 """
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from the .env file
@@ -29,3 +30,130 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     # Enable testing mode for Flask
     TESTING = True
+
+    # Connection pool (see app/monitoring/pool_metrics.py)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+    # Connections allowed above DB_POOL_SIZE under bursts
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", 20))
+    # Whole seconds a checkout waits for a free connection before failing
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))
+    # Seconds after which connections are replaced (below server idle limits)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    # Test connections on checkout so dropped ones are replaced transparently
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+    # Read replica for read-only queries (see app/datamanager/replica_routing.py)
+    REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+    # Seconds a user's reads stay on the primary after they write
+    REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", 5))
+
+    # SQLite tuning, applied to every connection when DATABASE_URL is
+    # sqlite:/// (see app/datamanager/sqlite_data_manager.py)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    # Milliseconds a writer waits for the database lock before failing
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    # NORMAL is durable across application crashes in WAL mode; FULL also
+    # survives power loss at the cost of an fsync per commit
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    # Bytes of the database file read through mmap (0 disables it)
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+
+    # Database used by the asyncio data manager (defaults to DATABASE_URL with
+    # its asyncio driver, e.g. asyncpg)
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+    # Level of the root logger (DEBUG, INFO, WARNING, ...)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    # Per-request wall/SQL/template/cache timings, logged as one JSON line
+    # per request (see app/monitoring/request_timing.py)
+    REQUEST_TIMING_ENABLED = os.getenv("REQUEST_TIMING_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Also send the timings to clients in a Server-Timing response header
+    SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "true").lower() in ("1", "true", "yes")
+
+    # Statements slower than this (ms) are logged with their plan on the
+    # app.slow_queries logger (see app/monitoring/slow_queries.py); 0 disables
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 500))
+    # Most slow statements logged (and explained) per minute and process
+    SLOW_QUERY_LOG_PER_MINUTE = int(os.getenv("SLOW_QUERY_LOG_PER_MINUTE", 10))
+    # Capture an EXPLAIN plan (without ANALYZE) of each logged statement
+    SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() in ("1", "true", "yes")
+    # Include bound parameters (may contain personal data) in the log
+    SLOW_QUERY_LOG_PARAMETERS = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "true").lower() in ("1", "true", "yes")
+
+    # Prometheus metrics served at /internal/metrics (see app/monitoring/metrics.py)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Directory shared by prefork workers so a scrape covers all of them;
+    # empty it when the server starts. Unset: per-process metrics
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR")
+    # Seconds between writes of a worker's metrics to that directory
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 1))
+
+    # Profile single requests sent with X-Profile and the internal token
+    # (see app/monitoring/request_profiler.py)
+    PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Where stored profiles go, and how many of the newest are kept
+    PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(tempfile.gettempdir(), "game_api_profiles"))
+    PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", 20))
+    # Always-on stack sampling of request threads, aggregated per endpoint
+    # (see app/monitoring/sampling_profiler.py)
+    SAMPLING_PROFILER_ENABLED = os.getenv("SAMPLING_PROFILER_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Samples per second; the sampler's cost grows with rate and stack depth
+    SAMPLING_PROFILER_HZ = float(os.getenv("SAMPLING_PROFILER_HZ", 25))
+    # Distinct stacks kept per endpoint; further ones count as "[other stacks]"
+    SAMPLING_PROFILER_MAX_STACKS = int(os.getenv("SAMPLING_PROFILER_MAX_STACKS", 2000))
+    # tracemalloc control, snapshots and per-request peak allocations under
+    # /internal/memory (see app/monitoring/memory_profiler.py)
+    MEMORY_PROFILER_ENABLED = os.getenv("MEMORY_PROFILER_ENABLED", "true").lower() in ("1", "true", "yes")
+    # Frames kept per traced allocation (1 groups by file and line)
+    MEMORY_TRACE_FRAMES = int(os.getenv("MEMORY_TRACE_FRAMES", 1))
+    # Snapshots kept per process; each holds every traced allocation
+    MEMORY_SNAPSHOT_KEEP = int(os.getenv("MEMORY_SNAPSHOT_KEEP", 3))
+    # Comma-separated endpoints whose peak allocation is recorded while
+    # tracing; empty records every endpoint
+    MEMORY_PEAK_ENDPOINTS = os.getenv("MEMORY_PEAK_ENDPOINTS", "")
+
+    # Request tracing (see app/monitoring/tracing.py): "file" or "otlp";
+    # unset turns tracing off
+    TRACING_EXPORTER = os.getenv("TRACING_EXPORTER")
+    # Share of requests traced, unless a traceparent header decides
+    TRACING_SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", 0.05))
+    # OTLP/JSON export requests, one per line, for the file exporter
+    TRACING_FILE = os.getenv("TRACING_FILE", os.path.join(tempfile.gettempdir(), "game_api_traces.jsonl"))
+    # OTLP/HTTP collector base URL for the otlp exporter (/v1/traces is appended)
+    TRACING_OTLP_ENDPOINT = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318")
+    TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "game-api")
+    # Traces waiting for export; further ones are dropped
+    TRACING_QUEUE_SIZE = int(os.getenv("TRACING_QUEUE_SIZE", 1000))
+
+    # Shared token for the /internal endpoints; unset disables them
+    INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+    # Password hashing (see app/password_hasher.py). Changing the method or
+    # salt length re-hashes each user's password on their next login.
+    # Keep the resulting hash within the 150 characters of `users.password`.
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:600000")
+    PASSWORD_HASH_SALT_LENGTH = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", 16))
+    # Worker processes dedicated to hashing (0 hashes on the request thread)
+    PASSWORD_HASH_POOL_SIZE = int(os.getenv("PASSWORD_HASH_POOL_SIZE", 2))
+    # Extra jobs allowed to wait for a worker before requests get a 503
+    PASSWORD_HASH_QUEUE_DEPTH = int(os.getenv("PASSWORD_HASH_QUEUE_DEPTH", 8))
+    # Seconds a request waits for its hashing job before giving up with a 503
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 5))
+
+    # Bloom filter of registered emails used by signup (see app/bloom_filter.py)
+    KNOWN_EMAILS_CAPACITY = int(os.getenv("KNOWN_EMAILS_CAPACITY", 1_000_000))
+    KNOWN_EMAILS_ERROR_RATE = float(os.getenv("KNOWN_EMAILS_ERROR_RATE", 0.01))
+
+    # Storage behind the controllers: postgresql, sqlite or memory (see
+    # app/datamanager/data_manager_factory.py); unset follows DATABASE_URL
+    DATA_MANAGER = os.getenv("DATA_MANAGER")
+    # Rows per statement used by the data manager's bulk_* methods
+    DATA_MANAGER_BULK_CHUNK_SIZE = int(os.getenv("DATA_MANAGER_BULK_CHUNK_SIZE", 5000))
+    # Rows fetched per round trip by the data manager's iter_* methods
+    DATA_MANAGER_STREAM_BATCH_SIZE = int(os.getenv("DATA_MANAGER_STREAM_BATCH_SIZE", 1000))
+
+    # Seconds get_reports serves its cached numbers before querying again
+    REPORTS_CACHE_TTL = float(os.getenv("REPORTS_CACHE_TTL", 60))
+    # On PostgreSQL, tables whose planner estimate (pg_class.reltuples) is at
+    # least this many rows are reported from the estimate; 0 always counts
+    REPORTS_ESTIMATE_THRESHOLD = int(os.getenv("REPORTS_ESTIMATE_THRESHOLD", 1_000_000))